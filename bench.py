@@ -0,0 +1,158 @@
+from argparse import ArgumentParser
+from configparser import ConfigParser
+from datetime import datetime, timezone
+import json
+import os
+import shutil
+import statistics
+import subprocess
+from tests.PrepareTest import PrepareTest
+from tests.Profile import DEFAULT_FREQUENCY, PROFILE_FOLDER, Profile, profile_command
+
+CONFIG = "config.conf"
+BENCH_SCRIPT = "benchmarks/QuaternionBenchmark.lua"
+HISTORY_PATH = "bench_history.json"
+# the baseline of a benchmark is its median over this many recent runs
+BASELINE_RUNS = 5
+sep = "-" * 50
+sep_n = sep + "\n"
+
+def parse_args():
+	parser = ArgumentParser(description="Run the Quaternion.lua micro-benchmarks.")
+	parser.add_argument(
+		"--threshold", type=float, default=0.25,
+		help="fail when a benchmark is slower than its baseline by more than this fraction (default 0.25)"
+	)
+	parser.add_argument(
+		"--filter", metavar="TEXT",
+		help="only run the benchmarks whose name contains TEXT"
+	)
+	parser.add_argument(
+		"--history", default=HISTORY_PATH, metavar="PATH",
+		help=f"json file the results are appended to (default {HISTORY_PATH})"
+	)
+	parser.add_argument(
+		"--no-save", action="store_true",
+		help="compare against the history without appending this run to it"
+	)
+	parser.add_argument(
+		"--profile", type=int, nargs="?", const=DEFAULT_FREQUENCY, metavar="HZ",
+		help=f"run under the luau sampling profiler (default {DEFAULT_FREQUENCY} Hz) and write flamegraphs to {PROFILE_FOLDER}/, the timings are neither saved nor compared"
+	)
+	return parser.parse_args()
+
+def get_luau():
+	if os.name == 'nt':
+		return "binaries/windows/luau.exe"
+	return "binaries/ubuntu/luau"
+
+def get_commit():
+	try:
+		result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+	except (OSError, subprocess.CalledProcessError):
+		return None
+	return result.stdout.strip()
+
+def write_driver(temp_test_folder, name_filter):
+	# luau takes no arguments, so the filter is set as a global in a copy of
+	# the benchmark script, on its first line so that the profile lines match
+	with open(BENCH_SCRIPT, "r") as bench_script:
+		bench_source = bench_script.read()
+	driver_path = os.path.join(temp_test_folder, "bench.lua")
+	with open(driver_path, "w") as driver:
+		driver.write(f"FILTER = {json.dumps(name_filter)} ")
+		driver.write(bench_source)
+	return driver_path
+
+def parse_results(output):
+	results = {}
+	for line in output.splitlines():
+		fields = line.split("\t")
+		if len(fields) != 4:
+			# luau --profile adds a summary of the profile to the output
+			continue
+		name, ns, allocated, iterations = fields
+		results[name] = {"ns": float(ns), "bytes": float(allocated), "iterations": int(iterations)}
+	return results
+
+def load_history(history_path):
+	if not os.path.exists(history_path):
+		return []
+	with open(history_path, "r") as history_file:
+		return json.load(history_file)
+
+def save_history(history_path, history):
+	with open(history_path, "w") as history_file:
+		json.dump(history, history_file, indent=1)
+
+def get_baselines(history):
+	timings = {}
+	for run in history[-BASELINE_RUNS:]:
+		for name, result in run["results"].items():
+			timings.setdefault(name, []).append(result["ns"])
+	return {name: statistics.median(values) for name, values in timings.items()}
+
+def print_report(results, baselines, threshold):
+	# returns the names of the benchmarks that regressed
+	regressions = []
+	print(f"{'benchmark':<26} {'ns/op':>10} {'B/op':>8} {'baseline':>10} {'change':>8}")
+	for name, result in results.items():
+		baseline = baselines.get(name)
+		if baseline:
+			change = result["ns"] / baseline - 1
+			compared = f"{baseline:>10.1f} {change:>+8.1%}"
+			if change > threshold:
+				regressions.append(name)
+				compared += "  slower"
+		else:
+			compared = f"{'-':>10} {'-':>8}"
+		print(f"{name:<26} {result['ns']:>10.1f} {result['bytes']:>8.0f} {compared}")
+	return regressions
+
+def Bench():
+	args = parse_args()
+
+	quotes = r"\""
+	config_parser = ConfigParser()
+	config_parser.read(CONFIG)
+
+	src_folder = config_parser["PATHS.INPUT"]["SRC_FOLDER"].strip(quotes)
+	temp_test_folder = config_parser["TEST"]["TEMP_TEST_FOLDER"].strip(quotes)
+
+	print(f"{sep_n}Preprocessing luau files for benchmarking")
+	PrepareTest(src_folder, temp_test_folder)
+
+	print(f"{sep_n}Running benchmarks.")
+	try:
+		bench_script = write_driver(temp_test_folder, args.filter) if args.filter else BENCH_SCRIPT
+		command = profile_command(get_luau(), bench_script, args.profile) if args.profile else [get_luau(), bench_script]
+		output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+	finally:
+		shutil.rmtree(temp_test_folder)
+	results = parse_results(output)
+	
+	if args.profile:
+		# sampling slows every benchmark down, so the run says nothing about
+		# regressions
+		print_report(results, {}, args.threshold)
+		Profile("bench", src_folder, temp_test_folder, {bench_script: BENCH_SCRIPT})
+		return
+
+	history = load_history(args.history)
+	regressions = print_report(results, get_baselines(history), args.threshold)
+
+	if not args.no_save:
+		history.append({
+			"time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+			"commit": get_commit(),
+			"results": results,
+		})
+		save_history(args.history, history)
+
+	if regressions:
+		print(f"{sep_n}Slower than baseline by more than {args.threshold:.0%}: {', '.join(regressions)}")
+		exit(1)
+	print(f"{sep_n}Benchmarks finished successfully.")
+
+if __name__ == "__main__":
+	Bench()
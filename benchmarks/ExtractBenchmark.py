@@ -0,0 +1,66 @@
+import io
+import timeit
+
+from docs.JSON import read_file
+
+sep = "-" * 50
+sep_n = sep + "\n"
+
+SIZES = [1000, 2500, 5000, 10000, 20000]
+
+HEADER = """--[=[
+    A synthetic module in the style of Quaternion.lua.
+
+    @class Module
+    @grouporder ["Constructors", "Math"]
+]=]
+local Module = {}
+"""
+
+def doc_block(i):
+    group = "Constructors" if i % 2 == 0 else "Math"
+    return f"""
+--[=[
+    Description of function {i}.
+
+    @function f{i}
+    @group {group}
+]=]
+function Module.f{i}(q0: Quaternion, alpha: number): Quaternion
+    return q0
+end
+"""
+
+def module_source(lines):
+    parts = [HEADER]
+    count = HEADER.count("\n")
+    i = 0
+    while count < lines:
+        block = doc_block(i)
+        parts.append(block)
+        count += block.count("\n")
+        i += 1
+    return "".join(parts)
+
+def time_per_call(source):
+    timer = timeit.Timer(lambda: read_file(io.StringIO(source)))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / number
+
+def ExtractBenchmark():
+    print(f"{sep_n}Module length (doc blocks of a Quaternion.lua-style module)")
+    print(f"{'lines':>6} {'ms/file':>10} {'us/line':>9}")
+    per_line = []
+    for lines in SIZES:
+        source = module_source(lines)
+        line_count = source.count("\n")
+        seconds = time_per_call(source)
+        per_line.append(seconds * 1e6 / line_count)
+        print(f"{line_count:>6} {seconds * 1e3:>10.2f} {per_line[-1]:>9.2f}")
+    # a linear extractor keeps the cost per line flat as the module grows
+    print(f"us/line growth from {SIZES[0]} to {SIZES[-1]} lines: x{per_line[-1] / per_line[0]:.2f}")
+    print(sep)
+
+if __name__ == "__main__":
+    ExtractBenchmark()
@@ -0,0 +1,159 @@
+-- Micro-benchmarks of the Quaternion.lua hot paths, run by bench.py after it
+-- has prepared test_build. Prints one tab separated line per benchmark:
+-- name, ns per op, bytes allocated per op and the calibrated iterations.
+
+local Quaternion = require("test_build/Quaternion")
+local QuaternionBuffer = require("test_build/QuaternionBuffer")
+local QuaternionBuilder = require("test_build/QuaternionBuilder")
+local Spring = require("test_build/Spring")
+local SpringGroup = require("test_build/SpringGroup")
+local Vector3 = require("mocks/Vector3")
+
+-- seconds a calibrated sample should take, the fastest of SAMPLES is kept
+local TARGET = 0.05
+local SAMPLES = 7
+local ALLOCATION_ITERATIONS = 1000
+local ALLOCATION_BALLAST = 2 ^ 22
+-- quaternions in each buffer of the bulk benchmarks
+local BUFFER_SIZE = 1000
+local SPRING_COUNT = 100
+
+local q0 = Quaternion.new(0.3, -0.5, 0.2, 0.7):Normalize()
+local q1 = Quaternion.new(-0.1, 0.4, 0.8, 0.3):Normalize()
+local vector = Vector3.new(1, 2, 3)
+local cframe = q0:ToCFrame()
+local slerp = q0:SlerpFunction(q1)
+local builder = QuaternionBuilder.new()
+
+local buffer0 = QuaternionBuffer.new(BUFFER_SIZE)
+local buffer1 = QuaternionBuffer.new(BUFFER_SIZE)
+local bufferOut = QuaternionBuffer.new(BUFFER_SIZE)
+local angles = table.create(BUFFER_SIZE)
+local vectorsX = table.create(BUFFER_SIZE, 1)
+local vectorsY = table.create(BUFFER_SIZE, 2)
+local vectorsZ = table.create(BUFFER_SIZE, 3)
+for i = 1, BUFFER_SIZE do
+    buffer0:Set(i, q0)
+    buffer1:Set(i, q1)
+    angles[i] = i / BUFFER_SIZE
+end
+
+-- the clock moves by a fixed step on every read, like a frame loop
+local springTime = 0
+local function springClock()
+    springTime += 1 / 60
+    return springTime
+end
+local springs = table.create(SPRING_COUNT)
+local springGroup = SpringGroup.new(springClock)
+for i = 1, SPRING_COUNT do
+    springs[i] = Spring.new(i, 0.5, 4, springClock)
+    springs[i].Target = 0
+    springGroup:SetTarget(springGroup:AddSpring(i, 0.5, 4), 0)
+end
+
+local BENCHMARKS = {
+    {"Mul", function() return q0 * q1 end},
+    {"RotateVector", function() return q0:RotateVector(vector) end},
+    {"Slerp", function() return q0:Slerp(q1, 0.3) end},
+    {"SlerpFunction", function() return q0:SlerpFunction(q1) end},
+    {"SlerpFunction call", function() return slerp(0.3) end},
+    {"Normalize", function() return q1:Normalize() end},
+    {"fromCFrame", function() return Quaternion.fromCFrame(cframe) end},
+    {"ToCFrame", function() return q0:ToCFrame() end},
+    {"ToEulerAngles", function() return q0:ToEulerAngles() end},
+    {"MulInto", function() return builder:MulInto(q0, q1) end},
+    {"SlerpInto", function() return builder:SlerpInto(q0, q1, 0.3) end},
+    {"NormalizeInto", function() return builder:NormalizeInto(q1) end},
+    {"MulBuffers 1000", function() return bufferOut:MulBuffers(buffer0, buffer1) end},
+    {"SlerpBuffers 1000", function() return bufferOut:SlerpBuffers(buffer0, buffer1, 0.3) end},
+    {"NormalizeAll 1000", function() return buffer1:NormalizeAll() end},
+    {"FromEulerAnglesBatch 1000", function() return bufferOut:FromEulerAnglesBatch(angles, angles, angles) end},
+    {"RotateVectors 1000", function() return buffer0:RotateVectors(vectorsX, vectorsY, vectorsZ) end},
+    {"Spring.Position 100", function()
+        for i = 1, SPRING_COUNT do
+            local _ = springs[i].Position
+        end
+    end},
+    {"SpringGroup Step 100", function() return springGroup:Step() end},
+}
+
+local function empty()
+    return nil
+end
+
+local function run(benchmark, iterations)
+    local start = os.clock()
+    for _ = 1, iterations do
+        benchmark()
+    end
+    return os.clock() - start
+end
+
+local function calibrate(benchmark)
+    -- doubles the iterations until a sample is long enough to time, which
+    -- also warms the benchmark up, then scales them to the target
+    local iterations = 1
+    local elapsed = run(benchmark, iterations)
+    while elapsed < TARGET / 10 do
+        iterations *= 2
+        elapsed = run(benchmark, iterations)
+    end
+    return math.max(1, math.ceil(iterations * TARGET / elapsed))
+end
+
+local function timePerOp(benchmark, iterations)
+    local best = math.huge
+    for _ = 1, SAMPLES do
+        best = math.min(best, run(benchmark, iterations))
+    end
+    return best / iterations
+end
+
+-- luau can't pause the collector, and a collection step during a sample
+-- would free earlier garbage and lower the count. The collector only steps
+-- again once the heap has grown by a fraction of what a full collection
+-- left alive, so a large live table leaves room for a whole sample. It is
+-- only created once every benchmark has been timed, as it would make every
+-- collection during the timing slower.
+local function bytesPerOp(benchmark)
+    local samples = table.create(SAMPLES)
+    for i = 1, SAMPLES do
+        collectgarbage("collect")
+        local before = collectgarbage("count")
+        for _ = 1, ALLOCATION_ITERATIONS do
+            benchmark()
+        end
+        samples[i] = collectgarbage("count") - before
+    end
+    table.sort(samples)
+    return samples[(SAMPLES + 1) / 2] * 1024 / ALLOCATION_ITERATIONS
+end
+
+-- the cost of the loop and the call itself is measured once and taken off
+-- every benchmark
+local overhead = timePerOp(empty, calibrate(empty))
+local filter = FILTER
+
+local selected = {}
+for _, entry in ipairs(BENCHMARKS) do
+    if not filter or string.find(entry[1], filter, 1, true) then
+        table.insert(selected, entry)
+    end
+end
+
+local timings = {}
+for i, entry in ipairs(selected) do
+    collectgarbage("collect")
+    local iterations = calibrate(entry[2])
+    local seconds = math.max(0, timePerOp(entry[2], iterations) - overhead)
+    timings[i] = {seconds, iterations}
+end
+
+local ballast = table.create(ALLOCATION_BALLAST, 0)
+for i, entry in ipairs(selected) do
+    local seconds, iterations = timings[i][1], timings[i][2]
+    local bytes = bytesPerOp(entry[2])
+    print(string.format("%s\t%.2f\t%.1f\t%d", entry[1], seconds * 1e9, bytes, iterations))
+end
+ballast = nil
@@ -0,0 +1,55 @@
+import time
+
+import numpy as np
+
+from tests.reference import Quaternion
+from tests.reference.Cases import standard_cases
+
+sep = "-" * 50
+sep_n = sep + "\n"
+
+SIZES = [10000, 100000, 1000000]
+SCALAR_CASES = 2000
+
+def generate_vectorized(quaternions):
+    # the standard fields, then every constructor run back on them
+    cases = standard_cases(quaternions)
+    matrix = cases["matrix"].reshape(-1, 3, 3)
+    Quaternion.fromMatrix(matrix[:, :, 0], matrix[:, :, 1], matrix[:, :, 2])
+    Quaternion.fromAxisAngle(*cases["axisAngle"])
+    for rotationOrder in Quaternion.ROTATION_ORDERS:
+        angles = cases[rotationOrder]
+        Quaternion.fromEulerAngles(angles[:, 0], angles[:, 1], angles[:, 2], rotationOrder)
+    Quaternion.Slerp(quaternions, quaternions[::-1], 0.25)
+    Quaternion.Pow(Quaternion.Log(quaternions), 0.5)
+
+def generate_scalar(quaternions):
+    # the same work one case at a time, as a per-case generator would do it
+    for i in range(len(quaternions)):
+        generate_vectorized(quaternions[i:i + 1])
+
+def best_time(function, quaternions, runs=3):
+    elapsed = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function(quaternions)
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed)
+
+def ReferenceBenchmark():
+    rng = np.random.default_rng(1)
+    scalar_quaternions = Quaternion.RandomQuaternion(SCALAR_CASES, rng)
+    scalar_rate = SCALAR_CASES / best_time(generate_scalar, scalar_quaternions, runs=1)
+
+    print(f"{sep_n}Reference case generation, cases per second")
+    print(f"{'cases':>9} {'seconds':>9} {'cases/s':>12} {'vs scalar':>10}")
+    print(f"{SCALAR_CASES:>9} {SCALAR_CASES / scalar_rate:>9.2f} {scalar_rate:>12.0f} {'(scalar)':>10}")
+    for size in SIZES:
+        quaternions = Quaternion.RandomQuaternion(size, rng)
+        elapsed = best_time(generate_vectorized, quaternions)
+        rate = size / elapsed
+        print(f"{size:>9} {elapsed:>9.2f} {rate:>12.0f} {rate / scalar_rate:>9.0f}x")
+    print(sep)
+
+if __name__ == "__main__":
+    ReferenceBenchmark()
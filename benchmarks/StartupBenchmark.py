@@ -0,0 +1,95 @@
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+
+from bench import get_baselines, get_commit, load_history, save_history
+from build import STAGE_MODULES
+
+HISTORY_PATH = "startup_history.json"
+RUNS = 7
+
+sep = "-" * 50
+sep_n = sep + "\n"
+
+def parse_args():
+    parser = ArgumentParser(description="Time the imports of each build.py stage.")
+    parser.add_argument(
+        "--runs", type=int, default=RUNS,
+        help=f"fresh interpreters to time each stage in, the median is reported (default {RUNS})"
+    )
+    parser.add_argument(
+        "--history", default=HISTORY_PATH, metavar="PATH",
+        help=f"json file the results are appended to (default {HISTORY_PATH})"
+    )
+    parser.add_argument(
+        "--no-save", action="store_true",
+        help="compare against the history without appending this run to it"
+    )
+    return parser.parse_args()
+
+def parse_importtime(stderr):
+    # -X importtime prints "import time: self | cumulative | module" for
+    # every module imported, in microseconds, so the self times add up to
+    # the whole import
+    total = 0
+    modules = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us = line[len("import time:"):].split("|")[0].strip()
+        if self_us.isdigit():
+            total += int(self_us)
+            modules += 1
+    return total, modules
+
+def time_imports(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True
+    )
+    return parse_importtime(result.stderr)
+
+def time_stage(stage, runs):
+    # the interpreter's own imports are measured apart and taken off, so
+    # that only what build.py and the stage load is counted
+    code = f"import build; build.load_stage({stage!r})"
+    times = []
+    modules = 0
+    for _ in range(runs):
+        interpreter_us, interpreter_modules = time_imports("pass")
+        stage_us, stage_modules = time_imports(code)
+        times.append(stage_us - interpreter_us)
+        modules = stage_modules - interpreter_modules
+    return statistics.median(times), modules
+
+def StartupBenchmark():
+    args = parse_args()
+    history = load_history(args.history)
+    baselines = get_baselines(history)
+
+    results = {}
+    print(f"{sep_n}Import time of each build.py stage, median of {args.runs} runs")
+    print(f"{'stage':<8} {'ms':>8} {'modules':>8} {'baseline':>10} {'change':>8}")
+    for stage in STAGE_MODULES:
+        microseconds, modules = time_stage(stage, args.runs)
+        results[stage] = {"ns": microseconds * 1000, "runs": args.runs, "modules": modules}
+        baseline = baselines.get(stage)
+        if baseline:
+            compared = f"{baseline / 1e6:>10.1f} {microseconds * 1000 / baseline - 1:>+8.1%}"
+        else:
+            compared = f"{'-':>10} {'-':>8}"
+        print(f"{stage:<8} {microseconds / 1000:>8.1f} {modules:>8} {compared}")
+
+    if not args.no_save:
+        history.append({
+            "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": get_commit(),
+            "results": results,
+        })
+        save_history(args.history, history)
+    print(sep)
+
+if __name__ == "__main__":
+    StartupBenchmark()
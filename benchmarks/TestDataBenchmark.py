@@ -0,0 +1,77 @@
+import os
+import subprocess
+import tempfile
+
+from tests.ConvertTestData import PACKED_TEST_DATA_PATH, TEST_DATA_PATH, ConvertTestData, is_converted
+
+sep = "-" * 50
+sep_n = sep + "\n"
+
+RUNS = 5
+
+# each format is loaded in a fresh luau process, the retained memory is
+# measured after a full collection with the loaded data still referenced
+DRIVERS = {
+    "literal": """
+collectgarbage()
+local before = collectgarbage("count")
+local start = os.clock()
+local testData = require("tests/TestData")
+local elapsed = os.clock() - start
+collectgarbage()
+print(elapsed, collectgarbage("count") - before, testData ~= nil)
+""",
+    "packed": """
+local TestDataLoader = require("tests/TestDataLoader")
+collectgarbage()
+local before = collectgarbage("count")
+local start = os.clock()
+local testData = TestDataLoader.load(require("tests/TestDataPacked"))
+local elapsed = os.clock() - start
+collectgarbage()
+print(elapsed, collectgarbage("count") - before, testData ~= nil)
+""",
+}
+
+def get_luau():
+    if os.name == 'nt':
+        return "binaries/windows/luau.exe"
+    return "binaries/ubuntu/luau"
+
+def run_driver(source):
+    # luau resolves requires from the working directory, so the driver is
+    # written next to the repository root and run from there
+    with tempfile.NamedTemporaryFile("w", suffix=".lua", dir=".", delete=False) as driver:
+        driver.write(source)
+    try:
+        output = subprocess.run([get_luau(), driver.name], capture_output=True, text=True, check=True).stdout
+    finally:
+        os.remove(driver.name)
+    elapsed, memory, _ = output.split()
+    return float(elapsed), float(memory)
+
+def TestDataBenchmark():
+    if not is_converted(TEST_DATA_PATH, PACKED_TEST_DATA_PATH):
+        ConvertTestData()
+
+    sizes = {
+        "literal": os.path.getsize(TEST_DATA_PATH),
+        "packed": os.path.getsize(PACKED_TEST_DATA_PATH),
+    }
+    print(f"{sep_n}Test data load, best of {RUNS} fresh luau processes")
+    print(f"{'format':>8} {'file KB':>9} {'load ms':>9} {'memory KB':>10}")
+    results = {}
+    for name, source in DRIVERS.items():
+        runs = [run_driver(source) for _ in range(RUNS)]
+        elapsed = min(run[0] for run in runs)
+        memory = min(run[1] for run in runs)
+        results[name] = (elapsed, memory)
+        print(f"{name:>8} {sizes[name] / 1024:>9.0f} {elapsed * 1000:>9.1f} {memory:>10.0f}")
+
+    literal_elapsed, literal_memory = results["literal"]
+    packed_elapsed, packed_memory = results["packed"]
+    print(f"packed: load time x{literal_elapsed / packed_elapsed:.1f} faster, memory x{packed_memory / literal_memory:.2f} of the literal")
+    print(sep)
+
+if __name__ == "__main__":
+    TestDataBenchmark()
@@ -0,0 +1,45 @@
+import timeit
+
+from docs.moonwave.tokens import tokenize
+
+sep = "-" * 50
+sep_n = sep + "\n"
+
+SIZES = [16, 32, 64, 128, 256, 512, 1024]
+
+def flat_signature(n):
+    params = ", ".join(f"a{i}: Quaternion" for i in range(n))
+    return f"({params}) -> Quaternion"
+
+def nested_signature(depth):
+    signature = "number"
+    for i in range(depth):
+        signature = f"(f{i}: {signature}, v: {{[string]: Vector3}}) -> Quaternion"
+    return signature
+
+def time_per_call(code, min_time=0.2):
+    timer = timeit.Timer(lambda: tokenize(code))
+    number, _ = timer.autorange()
+    number = max(number, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / number
+
+def run_series(name, make_signature):
+    print(f"{sep_n}{name}")
+    print(f"{'n':>6} {'chars':>8} {'us/call':>10} {'ns/char':>9}")
+    per_char = []
+    for n in SIZES:
+        code = "".join(make_signature(n).split())
+        seconds = time_per_call(code)
+        per_char.append(seconds * 1e9 / len(code))
+        print(f"{n:>6} {len(code):>8} {seconds * 1e6:>10.2f} {per_char[-1]:>9.1f}")
+    # a linear tokenizer keeps the cost per character flat as n grows
+    print(f"ns/char growth from n={SIZES[0]} to n={SIZES[-1]}: x{per_char[-1] / per_char[0]:.2f}")
+
+def TokenizeBenchmark():
+    run_series("Signature length (flat parameter list)", flat_signature)
+    run_series("Nesting depth (nested function types)", nested_signature)
+    print(sep)
+
+if __name__ == "__main__":
+    TokenizeBenchmark()
@@ -1,68 +1,216 @@
+import importlib
 import os
-from sys import argv
+import sys
+from argparse import ArgumentParser
 from configparser import ConfigParser
-from docs.JSON import JSON
-from docs.HTML import HTML
 
 CONFIG = "config.conf"
+# the docs modules each stage runs, imported only once the stage is chosen
+# so that a json build never loads bs4 and markdown
+STAGE_MODULES = {
+	"json": ["docs.Jobs", "docs.JSON"],
+	"html": ["docs.Jobs", "docs.HTML"],
+	"all": ["docs.Jobs", "docs.JSON", "docs.HTML"],
+}
+DEFAULT_STAGE = "all"
 sep = "-" * 50
 sep_n = sep + "\n"
 
 def run_python_script(script, on_succ, on_err):
 	try:
-		script()
+		result = script()
 	except SystemExit as e:
 		on_err(e.code)
 		exit(e.code)
 	else:
 		on_succ(0)
+		return result
 
 
-def Build():
-	argc = len(argv)
+def load_stage(stage):
+	for module in STAGE_MODULES[stage]:
+		importlib.import_module(module)
+
+
+def parse_args(argv=None):
+	shared = ArgumentParser(add_help=False)
+	shared.add_argument(
+		"--force", action="store_true",
+		help="ignore the build manifest and rebuild every file"
+	)
+	shared.add_argument(
+		"-j", "--jobs", type=int, default=1,
+		help="number of worker processes, 0 uses every available core"
+	)
+	shared.add_argument(
+		"--profile", action="store_true",
+		help="record the time and peak memory of every stage, write a Chrome trace to profiles/ and print a summary"
+	)
+	rendering = ArgumentParser(add_help=False)
+	rendering.add_argument(
+		"actions", nargs="?", default="false",
+		help="pass true when building on the actions runner"
+	)
+	rendering.add_argument(
+		"--compress", action="store_true",
+		help="minify the pages and write .gz and .br copies of every page, stylesheet and script"
+	)
 	
-	if argc > 2:
-		print("Invalid number of arguments passed into build. Expected a maximum of 1 argument.")
+	parser = ArgumentParser(description="Build the API documentation website.")
+	stages = parser.add_subparsers(dest="stage", metavar="{all,json,html}")
+	all_stage = stages.add_parser(
+		"all", parents=[shared, rendering],
+		help="extract the docs and render the website (the default)"
+	)
+	all_stage.add_argument(
+		"--no-json", action="store_true",
+		help="render straight from the extracted docs without writing build/json"
+	)
+	all_stage.add_argument(
+		"--watch", action="store_true",
+		help="keep running and rebuild the pages affected by each change"
+	)
+	all_stage.add_argument(
+		"--serve", type=int, nargs="?", const=8000, metavar="PORT",
+		help="with --watch, serve the build folder over http (default port 8000)"
+	)
+	stages.add_parser(
+		"json", parents=[shared],
+		help="only extract the docs from src into build/json"
+	)
+	stages.add_parser(
+		"html", parents=[shared, rendering],
+		help="only render the website from the docs in build/json"
+	)
 	
+	# "build.py", "build.py true" and "build.py --force" keep building
+	# everything, as they did before there were stages
+	argv = sys.argv[1:] if argv is None else argv
+	if not argv or argv[0] not in STAGE_MODULES and argv[0] not in ("-h", "--help"):
+		argv = [DEFAULT_STAGE] + argv
+	args = parser.parse_args(argv)
+	if args.stage == "all" and args.serve is not None and not args.watch:
+		all_stage.error("--serve requires --watch")
+	if args.stage == "all" and args.compress and args.watch:
+		all_stage.error("--compress can't be combined with --watch")
+	if args.profile and args.jobs != 1:
+		parser.error("--profile traces a single process and can't be combined with --jobs")
+	if args.stage == "all" and args.profile and args.watch:
+		all_stage.error("--profile can't be combined with --watch")
+	return args
+
+
+def get_web_path(args, build_path, web):
+	# returns the root the pages link to, and the file the home link opens
 	quotes = r"\""
-	config = ConfigParser()
-	config.read(CONFIG)
-	
-	input_paths = config["PATHS.INPUT"]
-	output_paths = config["PATHS.OUTPUT"]
-	web = config["WEB"]
-	
-	src_path = input_paths["SRC_FOLDER"].strip(quotes)
-	read_me_path = input_paths["READ_ME_PATH"].strip(quotes)
-	template_html_path = input_paths["TEMPLATE_HTML_PATH"].strip(quotes)
+	if args.actions == "true":
+		return web["ACTIONS_WEB_PATH"].strip(quotes), ""
+	if args.stage == "all" and args.serve is not None:
+		return "/", "index.html"
+	local_web_path = os.path.join(build_path, web["LOCAL_WEB_PATH"].strip(quotes))
+	return "file:///" + os.path.abspath(local_web_path).replace("\\", "/") + "/", "index.html"
+
+
+def Build():
+	args = parse_args()
+	load_stage(args.stage)
+	from docs import Trace
+	from docs.Jobs import resolve_jobs
+	jobs = resolve_jobs(args.jobs)
 	
-	build_path = output_paths["BUILD_PATH"].strip(quotes)
-	json_path = output_paths["JSON_PATH"].strip(quotes)
-	api_path = output_paths["API_PATH"].strip(quotes)
+	if args.profile:
+		Trace.start()
 	
-	web_path = None
-	index_html = ""
+	with Trace.span("config"):
+		quotes = r"\""
+		config = ConfigParser()
+		config.read(CONFIG)
+		
+		input_paths = config["PATHS.INPUT"]
+		output_paths = config["PATHS.OUTPUT"]
+		web = config["WEB"]
+		
+		src_path = input_paths["SRC_FOLDER"].strip(quotes)
+		read_me_path = input_paths["READ_ME_PATH"].strip(quotes)
+		template_html_path = input_paths["TEMPLATE_HTML_PATH"].strip(quotes)
+		
+		build_path = output_paths["BUILD_PATH"].strip(quotes)
+		json_path = output_paths["JSON_PATH"].strip(quotes)
+		api_path = output_paths["API_PATH"].strip(quotes)
 	
-	if argc > 1 and argv[1] == "true":
-		web_path = web["ACTIONS_WEB_PATH"].strip(quotes)
-	else:
-		local_web_path = os.path.join(build_path, web["LOCAL_WEB_PATH"].strip(quotes))
-		web_path = "file:///" + os.path.abspath(local_web_path).replace("\\", "/") + "/"
-		index_html = "index.html"
+	def on_fin(code):
+		print(f"{sep_n}Build finished successfully.")
+		if args.profile:
+			print(sep)
+			Trace.Trace()
 	
 	on_err = lambda code: print(f"{sep_n}An error occured during build: {code}")
 	on_succ = lambda code: print(f"{sep}")
-	on_fin = lambda code: print(f"{sep_n}Build finished successfully.")
 	
 	print(sep)
-	run_python_script(
-		lambda: JSON(src_path, build_path, json_path), 
+	if args.stage == "json":
+		from docs.JSON import JSON
+		run_python_script(
+			lambda: Trace.traced("json", JSON, src_path, build_path, json_path, force=args.force, jobs=jobs),
+			on_fin,
+			on_err
+		)
+		return
+	
+	web_path, index_html = get_web_path(args, build_path, web)
+	
+	def compress():
+		if args.compress:
+			from docs.Compress import Compress
+			print(sep)
+			Trace.traced("compress", Compress, build_path)
+		else:
+			# the compressed copies of an earlier --compress build would no
+			# longer match the pages just written
+			from docs.Compress import remove_compressed
+			remove_compressed(build_path)
+	
+	if args.stage == "html":
+		from docs.HTML import HTML
+		
+		def render_pages():
+			Trace.traced("html", HTML, read_me_path, template_html_path, build_path, web_path, index_html, force=args.force, jobs=jobs)
+			compress()
+		
+		run_python_script(
+			render_pages,
+			on_fin,
+			on_err
+		)
+		return
+	
+	from docs.HTML import HTML
+	from docs.JSON import JSON
+	
+	if args.watch:
+		# watch mode starts an http server, which a single build does not need
+		from docs.Watch import Watch
+		compress()
+		Watch(src_path, read_me_path, template_html_path, build_path, json_path, web_path, index_html, write_json=not args.no_json, port=args.serve)
+		return
+	
+	# the doc models go straight from JSON to HTML, the json artifacts are
+	# written alongside the page rendering, unless the build is traced and
+	# every stage has to run on this thread
+	doc_models, json_output = run_python_script(
+		lambda: Trace.traced("json", JSON, src_path, build_path, json_path, force=args.force, jobs=jobs, write_json=not args.no_json, background=not args.profile), 
 		on_succ, 
 		on_err
 	)
 	
+	def render_pages():
+		Trace.traced("html", HTML, read_me_path, template_html_path, build_path, web_path, index_html, force=args.force, jobs=jobs, doc_models=doc_models)
+		if json_output is not None:
+			json_output.result()
+		compress()
+	
 	run_python_script(
-		lambda: HTML(read_me_path, template_html_path, build_path, web_path, index_html), 
+		render_pages, 
 		on_fin, 
 		on_err
 	)
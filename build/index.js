@@ -12,6 +12,27 @@ const menuButton = document.querySelector(".menu-button")
 const body = document.body
 const checkbox = document.getElementById("checkbox")
 
+// the links to every page are shared by all of them in navigation.js, which
+// is loaded just before this script and cached across page views
+function createNavigation() {
+    const navigation = window.API_NAVIGATION || []
+    const lists = [
+        document.getElementById("api-sidebar-list-desktop"),
+        document.getElementById("api-sidebar-list-mobile"),
+    ]
+    for (const list of lists) {
+        for (const [text, href] of navigation) {
+            const li = document.createElement("li")
+            const a = document.createElement("a")
+            a.textContent = text
+            a.href = href
+            li.append(a)
+            list.append(li)
+        }
+    }
+}
+
+createNavigation()
 
 checkbox.addEventListener("change", () => {
   body.classList.toggle("light-mode")
@@ -75,6 +96,100 @@ const searchOptions = {
     allowTypo: true,
 }
 
+// the prebuilt index of every page lives next to this script, it is only
+// loaded once the search is first used
+const siteRoot = document.getElementById("index-script").src.replace(/index\.js$/, "")
+const currentPage = window.location.href.split("#")[0]
+let searchIndex = null
+let searchIndexNames = null
+let searchIndexTargets = null
+let searchIndexRequested = false
+
+function loadSearchIndex() {
+    if (searchIndexRequested) {return}
+    searchIndexRequested = true
+    const script = document.createElement("script")
+    script.src = siteRoot + "search-index.js"
+    script.addEventListener("load", () => {
+        searchIndex = window.SEARCH_INDEX
+        searchIndexNames = searchIndex.e.map((entry) => entry[0])
+        // names repeat across pages, so fuzzysort is given the entry ids too
+        searchIndexTargets = searchIndexNames.map((name, id) => ({name, id}))
+        if (searchbox.classList.contains("active")) {searchQuery()}
+    })
+    document.head.append(script)
+}
+
+function getTrigrams(key) {
+    const trigrams = []
+    for (let i = 0; i + 3 <= key.length; i++) {
+        trigrams.push(key.slice(i, i + 3))
+    }
+    return trigrams
+}
+
+function intersectPostings(postings) {
+    postings.sort((a, b) => a.length - b.length)
+    let candidates = postings[0]
+    for (let i = 1; i < postings.length && candidates.length > 0; i++) {
+        const posting = new Set(postings[i])
+        candidates = candidates.filter((entryId) => posting.has(entryId))
+    }
+    return candidates
+}
+
+function getIndexCandidates(searchTerm) {
+    if (searchTerm.length <= searchIndex.n) {
+        return searchIndex.x[searchTerm] || []
+    }
+    const postings = []
+    for (const trigram of getTrigrams(searchTerm)) {
+        const posting = searchIndex.t[trigram]
+        if (! posting) {return []}
+        postings.push(posting)
+    }
+    // trigrams only narrow the candidates down, the name must contain the
+    // whole term
+    return intersectPostings(postings).filter(
+        (entryId) => searchIndexNames[entryId].toLowerCase().includes(searchTerm)
+    )
+}
+
+function toSearchResult(entryId) {
+    const [name, kind, pageId] = searchIndex.e[entryId]
+    const page = siteRoot + searchIndex.p[pageId]
+    if (page == currentPage) {
+        return {text: name, href: "#" + name}
+    }
+    const pageName = searchIndex.p[pageId].replace(/^api\//, "").replace(/\.html$/, "")
+    return {text: name + " (" + pageName + ")", href: page + "#" + name}
+}
+
+function searchIndexQuery(searchTerm) {
+    if (searchTerm == "") {return []}
+    let candidates = getIndexCandidates(searchTerm)
+    if (candidates.length == 0) {
+        // fall back to typo tolerant matching over every name
+        return fuzzysort.go(searchTerm, searchIndexTargets, {...searchOptions, key: "name"}).map(
+            (result) => toSearchResult(result.obj.id)
+        )
+    }
+    candidates = candidates.slice().sort((a, b) => {
+        const nameA = searchIndexNames[a].toLowerCase()
+        const nameB = searchIndexNames[b].toLowerCase()
+        const prefixA = nameA.startsWith(searchTerm) ? 0 : 1
+        const prefixB = nameB.startsWith(searchTerm) ? 0 : 1
+        return (prefixA - prefixB) || (nameA.length - nameB.length) || (a - b)
+    })
+    return candidates.slice(0, searchOptions.limit).map(toSearchResult)
+}
+
+function searchPage(searchTerm) {
+    return fuzzysort.go(searchTerm, headings, searchOptions).map(
+        (result) => ({text: result.target, href: "#" + result.target})
+    )
+}
+
 function createSearchElement(searchTarget) {
     const li = document.createElement("li")
     li.classList.add("search-result")
@@ -99,7 +214,7 @@ function deleteSearchResults() {
 
 function searchQuery() {
     const searchTerm = searchBar.value.trim().toLowerCase();
-    const results = fuzzysort.go(searchTerm, headings, searchOptions)
+    const results = searchIndex ? searchIndexQuery(searchTerm) : searchPage(searchTerm)
     deleteSearchResults()
     clickClosures = []
     searchResults.replaceChildren()
@@ -107,12 +222,11 @@ function searchQuery() {
     if (results.length > 0) {
         for (i = 0; i < results.length; i++) {
             let result = results[i]
-            let searchTarget = result.target
             const li = document.createElement("li")
             li.classList.add("search-result")
             const a = document.createElement("a")
-            a.textContent = searchTarget
-            a.href = "#" + searchTarget
+            a.textContent = result.text
+            a.href = result.href
             const div = document.createElement("div")
             div.classList.add("divider", "horizontal")
             li.append(a)
@@ -131,6 +245,7 @@ function searchQuery() {
 }
 
 searchBar.addEventListener("focus", searchFocus)
+searchBar.addEventListener("focus", loadSearchIndex)
 
 function handleSearchBlur(e) {
     const withinBoundaries = e.composedPath().includes(searchbox)
@@ -0,0 +1,202 @@
+import gzip
+import hashlib
+import os
+import re
+
+from docs.Manifest import is_fresh, load_manifest, update_manifest
+
+try:
+    import brotli
+except ImportError:
+    # brotli is optional, without it only the .gz siblings are written
+    brotli = None
+
+COMPRESSED_EXTENSIONS = (".html", ".css", ".js")
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+# whitespace is significant inside these, so they are kept as they are
+PRESERVE_PATTERN = re.compile(r"(<(pre|code|textarea|script|style)\b.*?</\2>)", re.DOTALL | re.IGNORECASE)
+TAG_PATTERN = re.compile(r"<[^>]+>")
+# only the whitespace HTML collapses, "\s" would also match non-breaking
+# spaces
+WHITESPACE_PATTERN = re.compile(r"[ \t\n\r\f]+")
+# whitespace between two tags only renders when the tags are inline
+BETWEEN_TAGS_PATTERN = re.compile(r"(<(/?)([a-zA-Z][\w-]*)[^>]*>)[ \t\n\r\f]+(?=<(/?)([a-zA-Z][\w-]*))")
+# an attribute of a start tag, the value as it was written: double or single
+# quoted, or bare
+ATTRIBUTE_PATTERN = re.compile(r"""[ \t\n\r\f]+([^ \t\n\r\f"'=<>/]+)(?:[ \t\n\r\f]*=[ \t\n\r\f]*("[^"]*"|'[^']*'|[^ \t\n\r\f"'=<>`]+))?""")
+START_TAG_PATTERN = re.compile(r"<([a-zA-Z][\w-]*)")
+END_OF_TAG_PATTERN = re.compile(r"[ \t\n\r\f]*/?>$")
+# values are only unquoted when they are plain ascii, and a value ending
+# in "/" keeps its quotes, as it would read as "/>" otherwise
+UNQUOTED_CHARACTERS = r"\-A-Za-z0-9_.:#%?&;,+@!~$*()\[\]{}|^"
+UNQUOTED_VALUE_PATTERN = re.compile(rf"[{UNQUOTED_CHARACTERS}/]*[{UNQUOTED_CHARACTERS}]")
+BOOLEAN_ATTRIBUTES = {"checked", "disabled", "hidden", "readonly", "required", "selected", "async", "defer"}
+VOID_END_TAG_PATTERN = re.compile(r"</(area|base|br|col|embed|hr|img|input|link|meta|source|track|wbr)>", re.IGNORECASE)
+
+# whitespace next to these never renders: they are block-level, or only
+# found in the head
+BLOCK_TAGS = {
+    "html", "head", "body", "header", "footer", "main", "nav", "aside", "section",
+    "article", "div", "ul", "ol", "li", "p", "h1", "h2", "h3", "h4", "h5", "h6",
+    "table", "thead", "tbody", "tr", "td", "th", "blockquote", "hr", "pre",
+    "meta", "link", "title",
+}
+
+def minify_attribute(name, value):
+    if value is None or name.lower() in BOOLEAN_ATTRIBUTES:
+        return " " + name
+    if value.startswith('"') and UNQUOTED_VALUE_PATTERN.fullmatch(value, 1, len(value) - 1):
+        return " " + name + "=" + value[1:-1]
+    return " " + name + "=" + value
+
+def minify_tag(tag):
+    # bs4 writes every attribute quoted and every void element self-closed,
+    # neither is needed in HTML5. The attributes are read one after another,
+    # so a value is never mistaken for an attribute of its own
+    start = START_TAG_PATTERN.match(tag)
+    if start is None:
+        return WHITESPACE_PATTERN.sub(" ", tag)
+
+    parts = [start.group(0)]
+    position = start.end()
+    while True:
+        attribute = ATTRIBUTE_PATTERN.match(tag, position)
+        if attribute is None:
+            break
+        parts.append(minify_attribute(attribute.group(1), attribute.group(2)))
+        position = attribute.end()
+    if END_OF_TAG_PATTERN.fullmatch(tag, position) is None:
+        # not a tag this minifier understands, it is kept as it is
+        return tag
+    return "".join(parts) + ">"
+
+def collapse_between_tags(match):
+    before_name = match.group(3).lower()
+    after_name = match.group(5).lower()
+    if before_name in BLOCK_TAGS or after_name in BLOCK_TAGS:
+        return match.group(1)
+    return match.group(1) + " "
+
+def minify_text(html):
+    # whitespace is only collapsed in the text between tags, attribute
+    # values keep theirs
+    html = VOID_END_TAG_PATTERN.sub("", html)
+    minified = []
+    position = 0
+    for tag in TAG_PATTERN.finditer(html):
+        minified.append(WHITESPACE_PATTERN.sub(" ", html[position:tag.start()]))
+        minified.append(minify_tag(tag.group(0)))
+        position = tag.end()
+    minified.append(WHITESPACE_PATTERN.sub(" ", html[position:]))
+    return BETWEEN_TAGS_PATTERN.sub(collapse_between_tags, "".join(minified))
+
+def minify_html(html):
+    parts = PRESERVE_PATTERN.split(html)
+    minified = []
+    # split keeps both groups of the pattern, so every third part is the
+    # tag name of the preserved block before it
+    for i in range(0, len(parts), 3):
+        minified.append(minify_text(parts[i]))
+        if i + 1 < len(parts):
+            minified.append(parts[i + 1])
+    return "".join(minified).strip()
+
+def write_compressed(path, data, key, old_manifest, compress_manifest):
+    # returns the gzip and brotli sizes, brotli is None when not installed.
+    # A copy is only written again when the bytes it was made from changed
+    digest = hashlib.sha256(data).hexdigest()
+    gzip_path = path + ".gz"
+    if not is_fresh(old_manifest, key + ".gz", digest, gzip_path):
+        with open(gzip_path, "wb") as gzip_file:
+            # no timestamp, so unchanged files compress to the same bytes
+            gzip_file.write(gzip.compress(data, compresslevel=9, mtime=0))
+    compress_manifest[key + ".gz"] = digest
+    gzip_size = os.path.getsize(gzip_path)
+
+    if brotli is None:
+        return gzip_size, None
+    brotli_path = path + ".br"
+    if not is_fresh(old_manifest, key + ".br", digest, brotli_path):
+        with open(brotli_path, "wb") as brotli_file:
+            brotli_file.write(brotli.compress(data, quality=11))
+    compress_manifest[key + ".br"] = digest
+    return gzip_size, os.path.getsize(brotli_path)
+
+def get_compressed_copies(build_path):
+    copies = []
+    for folder, _, filenames in os.walk(build_path):
+        for filename in filenames:
+            if filename.endswith(COMPRESSED_SUFFIXES):
+                copies.append(os.path.join(folder, filename))
+    return copies
+
+def remove_compressed(u_build_path):
+    # a build without --compress rewrites pages without their compressed
+    # copies, which a static host would otherwise keep serving
+    build_path = os.path.normpath(u_build_path)
+    copies = get_compressed_copies(build_path)
+    for copy_path in copies:
+        os.remove(copy_path)
+    if "compress" in load_manifest(build_path):
+        update_manifest(build_path, "compress", {})
+    if copies:
+        print(f"Removed {len(copies)} compressed file(s) left by an earlier --compress build.")
+
+def get_compressed_files(build_path):
+    files = []
+    for folder, _, filenames in os.walk(build_path):
+        for filename in filenames:
+            if filename.endswith(COMPRESSED_EXTENSIONS):
+                files.append(os.path.join(folder, filename))
+    return sorted(files)
+
+def print_report(rows):
+    print(f"{'file':<32} {'bytes':>8} {'minified':>9} {'gzip':>8} {'brotli':>8}")
+    for name, size, minified_size, gzip_size, brotli_size in rows:
+        minified_column = f"{minified_size:>9}" if minified_size is not None else f"{'-':>9}"
+        brotli_column = f"{brotli_size:>8}" if brotli_size is not None else f"{'-':>8}"
+        print(f"{name:<32} {size:>8} {minified_column} {gzip_size:>8} {brotli_column}")
+
+    total = sum(row[1] for row in rows)
+    served = sum(row[4] if row[4] is not None else row[3] for row in rows)
+    if total > 0:
+        print(f"{len(rows)} files, {total} bytes served as {served} bytes ({served / total:.1%}).")
+
+def Compress(u_build_path):
+    # minifies the rendered pages in place, then writes .gz and .br
+    # siblings of every page, stylesheet and script for the static host
+    print("Minifying and compressing the build output.")
+    assert(isinstance(u_build_path, str))
+    build_path = os.path.normpath(u_build_path)
+
+    # the copies of a file that is no longer built are removed
+    for copy_path in get_compressed_copies(build_path):
+        if not os.path.exists(copy_path[:-3]):
+            os.remove(copy_path)
+
+    old_manifest = load_manifest(build_path).get("compress", {})
+    compress_manifest = {}
+    rows = []
+    for path in get_compressed_files(build_path):
+        with open(path, "rb") as source_file:
+            data = source_file.read()
+        size = len(data)
+
+        minified_size = None
+        if path.endswith(".html"):
+            minified = minify_html(data.decode("utf-8")).encode("utf-8")
+            minified_size = len(minified)
+            if minified != data:
+                with open(path, "wb") as source_file:
+                    source_file.write(minified)
+                data = minified
+
+        key = os.path.relpath(path, build_path).replace("\\", "/")
+        gzip_size, brotli_size = write_compressed(path, data, key, old_manifest, compress_manifest)
+        rows.append((key, size, minified_size, gzip_size, brotli_size))
+
+    update_manifest(build_path, "compress", compress_manifest)
+    print_report(rows)
+    if brotli is None:
+        print("brotli is not installed, only .gz files were written (pip install brotli).")
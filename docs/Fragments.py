@@ -0,0 +1,92 @@
+import copy
+import re
+
+# Slot kinds, any other kind is the name of an attribute on the target
+TEXT = "#text"
+CHILDREN = "#children"
+BEFORE = "#before"
+CLASS = "#class"
+ELEMENT = "#element"
+
+ESCAPE_PATTERN = re.compile(r"[&<>]")
+ESCAPE_TABLE = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+
+def escape_text(string):
+    return ESCAPE_PATTERN.sub(lambda match: ESCAPE_TABLE[match.group(0)], string)
+
+def quote_attribute(string):
+    # same quoting rules as bs4's minimal formatter, so rendered fragments
+    # serialize exactly like the tags they replace
+    value = escape_text(string)
+    if '"' in value:
+        if "'" in value:
+            return '"' + value.replace('"', "&quot;") + '"'
+        return "'" + value + "'"
+    return '"' + value + '"'
+
+def marker(name):
+    return "\x00" + name + "\x00"
+
+def compile_fragment_spec(element, slots, registry=None):
+    # the spec is plain data, so that it can be cached between builds and
+    # turned back into a renderer with fragment_renderer
+    element = copy.copy(element)
+    kinds = {}
+    defaults = {}
+
+    for slot in slots:
+        selector, kind, name = slot[:3]
+        target = element if selector is None else element.select_one(selector)
+        kinds[name] = kind
+        if kind == TEXT:
+            defaults[name] = target.decode_contents()
+            target.string = marker(name)
+        elif kind == CHILDREN:
+            target.clear()
+            target.append(marker(name))
+        elif kind == BEFORE:
+            target.insert_before(marker(name))
+        elif kind == CLASS:
+            target["class"] = target.get("class", []) + [marker(name)]
+        elif kind == ELEMENT:
+            if registry is not None:
+                registry[name] = compile_fragment_spec(target, slot[3], registry)
+            target.replace_with(marker(name))
+        else:
+            if target.has_attr(kind):
+                defaults[name] = " " + kind + "=" + quote_attribute(target[kind])
+            target[kind] = marker(name)
+
+    format_string = element.decode().replace("{", "{{").replace("}", "}}")
+    for name, kind in kinds.items():
+        field = "{" + name + "}"
+        if kind == CLASS:
+            format_string = format_string.replace(" " + marker(name), field)
+        elif kind not in (TEXT, CHILDREN, BEFORE, ELEMENT):
+            format_string = format_string.replace(" " + kind + '="' + marker(name) + '"', field)
+        format_string = format_string.replace(marker(name), field)
+
+    return {"kinds": kinds, "defaults": defaults, "format": format_string}
+
+def fragment_renderer(spec):
+    kinds = spec["kinds"]
+    defaults = spec["defaults"]
+    format_string = spec["format"]
+
+    def render(**values):
+        fields = {}
+        for name, kind in kinds.items():
+            value = values.get(name)
+            if kind == TEXT:
+                fields[name] = defaults[name] if value is None else escape_text(value)
+            elif kind == CLASS:
+                fields[name] = " " + value if value else ""
+            elif kind in (CHILDREN, BEFORE, ELEMENT):
+                fields[name] = value or ""
+            elif value is None:
+                fields[name] = defaults.get(name, "")
+            else:
+                fields[name] = " " + kind + "=" + quote_attribute(value)
+        return format_string.format_map(fields)
+
+    return render
@@ -1,4 +1,3 @@
-import copy
 import json
 import markdown
 import os
@@ -6,28 +5,74 @@ import re
 import sys
 
 import warnings
+from collections import OrderedDict
 from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
+from docs import Fragments, Search
+from docs.Fragments import BEFORE, CHILDREN, CLASS, ELEMENT, TEXT, compile_fragment_spec, escape_text, fragment_renderer
+from docs.Jobs import map_jobs
+from docs.JSON import extract_file
+from docs.Manifest import combine_digests, file_digest, files_digest, is_fresh, load_manifest, save_json, update_manifest
+from docs.moonwave import tokens as moonwave_tokens
 from docs.moonwave.tokens import tokenize
+from docs.Search import SEARCH_INDEX_NAME, build_search_index, write_search_index
+from docs.Trace import span, traced
 
 warnings.filterwarnings("ignore", category=MarkupResemblesLocatorWarning)
 
-# function to be created at runtime
-get_template = None
+# source files whose changes invalidate every rendered page
+GENERATOR_FILES = [__file__, Fragments.__file__, Search.__file__, moonwave_tokens.__file__]
+# source files whose changes invalidate the template cache
+TEMPLATE_PARSER_FILES = [__file__, Fragments.__file__]
+TEMPLATE_CACHE_NAME = "template-cache.json"
+# the links to every page, written once and shared by all of them
+NAVIGATION_NAME = "navigation.js"
+
+# slots of each precompiled template, templates not listed are tokens
+TOKEN_SLOTS = [(None, TEXT, "text"), (None, CLASS, "class_"), (None, "href", "href")]
+SIDEBAR_LINK_SLOTS = [("a", TEXT, "text"), ("a", "href", "href")]
+FRAGMENT_SLOTS = {
+    "SOUP_TEMPLATE": [
+        ("#index-css", "href", "css_href"),
+        ("#index-script", "src", "script_src"),
+        ("#navigation-script", "src", "navigation_src"),
+        ("ul.content-list", CHILDREN, "content"),
+        ("ul.sidebar-list", CHILDREN, "sidebar"),
+    ],
+    "sidebar-super": SIDEBAR_LINK_SLOTS,
+    "sidebar-sub": SIDEBAR_LINK_SLOTS,
+    "title-description": [("h1", TEXT, "title"), ("h1", "id", "id"), ("p", CHILDREN, "desc")],
+    "group-component": [("h2", TEXT, "title"), ("h2", "id", "id"), ("ul", CHILDREN, "items")],
+    "group-item": [
+        (None, CLASS, "item_class"),
+        (None, "id", "id"),
+        ("h3", CLASS, "title_class"),
+        ("h3", TEXT, "title"),
+        ("h3", "id", "title_id"),
+        ("p", BEFORE, "special_tag"),
+        ("p", CHILDREN, "desc"),
+        ("div.box-container", ELEMENT, "box-container", [("span.definition", CHILDREN, "definition")]),
+    ],
+    "alias": [(None, TEXT, "text"), (None, "href", "href")],
+    "grouping": [(None, CHILDREN, "children")],
+}
+SPECIAL_TAG_SLOTS = [("span", TEXT, "text")]
+
+# functions and state to be created at runtime
+render_template = None
+template_classes = {}
+page_values = {}
 
 def quick_add_template(append_to, template_name, set_string=None, add_class_=None):
-    template = get_template(template_name)
-    if set_string:
-        template.string = set_string
+    classes = template_classes[template_name]
     if add_class_:
-        add_class(template, add_class_)
-    append_to.append(template)
-    return template
+        classes = classes + [add_class_]
+    html = render_template(template_name, text=set_string or None, class_=add_class_)
+    token = (get_identifying_class(classes), set_string or template_classes[template_name + ":text"], html)
+    append_to.append(token)
+    return token
 
-def create_sidebar_item(append_to, set_string, href):
-    sidebar_item = quick_add_template(append_to, "sidebar-item")
-    sidebar_item_a = sidebar_item.find("a")
-    sidebar_item_a.string = set_string
-    sidebar_item_a["href"] = href
+def render_page(content, sidebar):
+    return render_template("SOUP_TEMPLATE", content=content, sidebar=sidebar, **page_values)
 
 def add_class(element, class_name):
     element['class'] = element.get('class', []) + [class_name]
@@ -86,14 +131,14 @@ def description_array_to_html(desc):
         desc_string = desc_string + formatted_to_html(paragraph)
         if i < length:
             desc_string = desc_string + "<br>"
-    return BeautifulSoup(desc_string, "html.parser")
+    # parsing normalizes the markup exactly as it would be once embedded
+    return str(BeautifulSoup(desc_string, "html.parser"))
 
-def insert_special_tag(group_item, item, pos=1):
+def special_tag_html(item):
     if "special_tag" in item:
         tag_api = item["special_tag"]
-        special_tag = get_template("special-tag-" + tag_api["type"])
-        special_tag.span.string = tag_api["text"]
-        group_item.insert(pos, special_tag)
+        return render_template("special-tag-" + tag_api["type"], text=tag_api["text"])
+    return None
 
 
 
@@ -104,49 +149,51 @@ LUA_TYPE_API = "https://create.roblox.com/docs/luau/"
 ROBLOX_DATATYPE_API = "https://create.roblox.com/docs/reference/engine/datatypes/"
 ENUM_API = "https://create.roblox.com/docs/reference/engine/enums/"
 
-def anchor_type_href(class_name, append_to, gtype_):
-    anchor = get_template("lua-type")
-    anchor.string = gtype_
-    append_to.append(anchor)
-    
+def get_type_href(class_name, gtype_):
     type_ = gtype_
     if gtype_[-1:] == "?":
         type_ = gtype_[:-1]
     
     if type_ == class_name:
-        anchor["href"] = ""
-        return
+        return ""
     for lua_type in lua_types:
         if type_ == lua_type:
             href = LUA_TYPE_API + type_
             if type_ != "nil":
-                anchor["href"] = href + "s"
+                return href + "s"
             else:
-                anchor["href"] = href
-            return
+                return href
     for roblox_type in roblox_types:
         if type_ == roblox_type:
-            anchor["href"] = ROBLOX_DATATYPE_API + type_
-            return
+            return ROBLOX_DATATYPE_API + type_
     if type_[:5] == "Enum.":
-        anchor["href"] = ENUM_API + type_[5:]
-        return
-    return
+        return ENUM_API + type_[5:]
+    return None
+
+def anchor_type_href(class_name, append_to, gtype_):
+    html = render_template("lua-type", text=gtype_, href=get_type_href(class_name, gtype_))
+    append_to.append((get_identifying_class(template_classes["lua-type"]), gtype_, html))
 
 def setup_group_item(item):
-    group_item = get_template("group-item")
+    group_item = {}
     if item["tag"] == "operation":
         id = operation_to_string(item)
-        add_class(group_item.h3, "no-display")
+        group_item["title_class"] = "no-display"
     else:
         id = item["name"]
-    group_item.h3.string = id
-    group_item.h3["id"] = id
-    insert_special_tag(group_item, item)
+    group_item["title"] = id
+    group_item["title_id"] = id
+    group_item["special_tag"] = special_tag_html(item)
     if len(item["desc"]) > 0:
-        group_item.p.append(description_array_to_html(item["desc"]))
+        group_item["desc"] = description_array_to_html(item["desc"])
     return group_item
 
+def render_group_item(group_item, definition=None):
+    if definition is not None:
+        definition_html = "".join(traced("group similar items", group_similar_items, definition))
+        group_item["box-container"] = render_template("box-container", definition=definition_html)
+    return render_template("group-item", **group_item)
+
 # quick_add_template(append_to, "", "", depth_class)
 
 def generate_from_tokens(class_name, append_to, tokens, depth=0, remove_first=False):
@@ -227,10 +274,47 @@ def generate_from_tokens(class_name, append_to, tokens, depth=0, remove_first=Fa
                 )
         
             
+PARSE_TYPE_CACHE_SIZE = 512
+
+# rendered fragments keyed by (class_name, type_text, remove_first), least
+# recently used first
+parse_type_cache = OrderedDict()
+parse_type_stats = {"hits": 0, "misses": 0}
+
+def clear_parse_type_cache():
+    parse_type_cache.clear()
+    parse_type_stats["hits"] = 0
+    parse_type_stats["misses"] = 0
+
+def parse_type_cache_info():
+    return {
+        "hits": parse_type_stats["hits"],
+        "misses": parse_type_stats["misses"],
+        "size": len(parse_type_cache),
+        "maxsize": PARSE_TYPE_CACHE_SIZE
+    }
+
+def render_type(class_name, type_text, remove_first):
+    fragment = []
+    tokens = traced("tokenize", tokenize, ''.join(type_text.split()))
+    traced("generate from tokens", generate_from_tokens, class_name, fragment, tokens, remove_first=remove_first)
+    return tuple(fragment)
+
 def parse_type(class_name, append_to, type_text, remove_first=False):
-    type_text = ''.join(type_text.split())
-    tokens = tokenize(type_text)
-    generate_from_tokens(class_name, append_to, tokens, remove_first=remove_first)
+    key = (class_name, type_text, remove_first)
+    fragment = parse_type_cache.get(key)
+    if fragment is None:
+        parse_type_stats["misses"] += 1
+        fragment = render_type(class_name, type_text, remove_first)
+        parse_type_cache[key] = fragment
+        if len(parse_type_cache) > PARSE_TYPE_CACHE_SIZE:
+            parse_type_cache.popitem(last=False)
+    else:
+        parse_type_stats["hits"] += 1
+        parse_type_cache.move_to_end(key)
+    
+    # rendered tokens are immutable, so extending is the only copy needed
+    append_to.extend(fragment)
     
 
 class_compatability = {
@@ -251,77 +335,67 @@ class_compatability = {
 }
     
 
-def get_identifying_class(item):
-    class_list = item["class"]
+def get_identifying_class(class_list):
     i_class = class_list[1]
-    if i_class != "punc" or len(class_list) < 2:
+    if i_class != "punc" or len(class_list) < 3:
         return i_class
     else:
         return class_list[2]
 
-def group_similar_items(insert_span):
-    i = 0
-    groups = 0
-    token_list = insert_span.find_all(class_="token")
-    length = len(token_list)
+def render_grouping(group, grouped):
+    if len(group) > 1:
+        grouped.append(render_template("grouping", children="".join(group)))
+    else:
+        grouped.extend(group)
+
+def group_similar_items(tokens):
+    # a run of compatible tokens is folded into one grouping span in the
+    # same pass that reads it, so nothing is ever moved after the fact
+    grouped = []
     current_group = []
-    match_group = None
     prev_group = None
-    while i < length:
-        token = token_list[i]
-        i_class = get_identifying_class(token)
-        
-        token_starts_space = token.string[0] == "\u00A0"
-        token_ends_space = token.string[-1] == "\u00A0"
+    last = len(tokens) - 1
+    for i, (i_class, token_string, html) in enumerate(tokens):
+        token_starts_space = token_string[0] == "\u00A0"
+        token_ends_space = token_string[-1] == "\u00A0"
 
         if len(current_group) > 0:
             matches_prev = (not token_starts_space) and i_class in prev_group
             if matches_prev:
-                current_group.append(token)
+                current_group.append(html)
                 prev_group = class_compatability[i_class]
                 
-            if not(matches_prev) or token_ends_space or i == length - 1:
-                if len(current_group) > 1:
-                    group_span = get_template("grouping")
-                    for stok in current_group:
-                        group_span.append(stok)
-                    i_offset = 0
-                    if not(matches_prev):
-                        i_offset = 1
-                    groups += len(current_group) - 1
-                    insert_span.insert(i - i_offset - groups, group_span)
-                    
+            if not(matches_prev) or token_ends_space or i == last:
+                render_grouping(current_group, grouped)
                 current_group = []
-                match_group = None
                 prev_group = None
+            
+            if matches_prev:
+                continue
         
-        if len(current_group) == 0:
-            if not token_ends_space:
-                if i_class in class_compatability:
-                    match_group = class_compatability[i_class].copy()
-                    match_group.append(i_class)
-                    current_group = [token]
-                    prev_group = class_compatability[i_class]
-        
-        i += 1
+        if not token_ends_space and i_class in class_compatability:
+            current_group = [html]
+            prev_group = class_compatability[i_class]
+        else:
+            grouped.append(html)
     
+    render_grouping(current_group, grouped)
+    return grouped
 
 def property_to_html(class_name, item):
     group_item = setup_group_item(item)
-    insert_span = group_item.find("span", class_="definition")
+    insert_span = []
     quick_add_template(insert_span, "class-name", class_name)
     quick_add_template(insert_span, "punc", ".", "prop-dot")
     quick_add_template(insert_span, "prop-name", item["name"])
     quick_add_template(insert_span, "punc", ":\u00A0", "prop-colon")
     parse_type(class_name, insert_span, item["lua_type"])
     
-    group_similar_items(insert_span)
-    
-    return group_item
+    return render_group_item(group_item, insert_span)
 
 def function_to_html(class_name, item, call_syntax):
     group_item = setup_group_item(item)
-    insert_span = group_item.find("span", class_="definition")
+    insert_span = []
     quick_add_template(insert_span, "class-name", class_name)
     class_call_syntax = "dot-call" if call_syntax == "." else "colon-call"
     quick_add_template(insert_span, "punc", call_syntax, class_call_syntax)
@@ -329,9 +403,7 @@ def function_to_html(class_name, item, call_syntax):
     
     parse_type(class_name, insert_span, item["definition"], ((call_syntax == ":") and item["remove_first"]))
     
-    group_similar_items(insert_span)
-    
-    return group_item
+    return render_group_item(group_item, insert_span)
 
 operation_map = {
     "add": "+",
@@ -358,9 +430,9 @@ def operation_to_string(item):
 
 def operation_to_html(class_name, item):
     group_item = setup_group_item(item)
-    add_class(group_item, "operation-item")
+    group_item["item_class"] = "operation-item"
     group_item["id"] = operation_to_string(item)
-    insert_span = group_item.find("span", class_="definition")
+    insert_span = []
     
     operator = item["operator"]
     if operator == "unm":
@@ -378,124 +450,158 @@ def operation_to_html(class_name, item):
         quick_add_template(insert_span, "punc", ":" + "\u00A0", "op-colon")
         parse_type(class_name, insert_span, item["return"])
     
-    group_similar_items(insert_span)
-    
-    return group_item
+    return render_group_item(group_item, insert_span)
 
 def alias_to_html(class_name, item):
     group_item = setup_group_item(item)
     alias_link = "#" + item["alias"]
-    alias_anchor = get_template("alias")
-    alias_anchor["href"] = alias_link
-    alias_anchor.string = item["alias"]
-    group_item.p.append("Alias for ")
-    group_item.p.append(alias_anchor)
-    group_item.p.append(".")
+    alias_anchor = render_template("alias", text=item["alias"], href=alias_link)
+    group_item["desc"] = group_item.get("desc", "") + escape_text("Alias for ") + alias_anchor + "."
     
-    group_item.find("div", class_="box-container").extract()
-    
-    return group_item
+    return render_group_item(group_item)
 
-def process_list_json(function_group, soup, class_name):
+def process_list_json(function_group, sidebar_list, class_name):
     group_name = function_group["name"]
+    group_list = []
     
-    group_component = get_template("group-component")
-    group_component.h2.string = group_name
-    group_component.h2["id"] = group_name
-    
-    sidebar_list = soup.find("ul", class_="sidebar-list")
-    sidebar_super = get_template("sidebar-super")
-    sidebar_super.a.string = group_name
-    sidebar_super.a["href"] = "#" + group_name
-    sidebar_list.append(sidebar_super)
+    sidebar_list.append(render_template("sidebar-super", text=group_name, href="#" + group_name))
     
     for item in function_group["list"]:
-        sidebar_sub = get_template("sidebar-sub")
         tag = item["tag"]
         if "name" in item:
             target_name = item["name"]
         else:
             target_name = operation_to_string(item)
         
-        sidebar_sub.a.string = target_name
-        sidebar_sub.a["href"] = "#" + target_name
-            
-        sidebar_list.append(sidebar_sub)
+        sidebar_list.append(render_template("sidebar-sub", text=target_name, href="#" + target_name))
         
        
         if tag == "property":
-            group_component.ul.append(property_to_html(class_name, item))
+            group_list.append(property_to_html(class_name, item))
         elif tag == "function":
-            group_component.ul.append(function_to_html(class_name, item, "."))
+            group_list.append(function_to_html(class_name, item, "."))
         elif tag == "method":
-            group_component.ul.append(function_to_html(class_name, item, ":"))
+            group_list.append(function_to_html(class_name, item, ":"))
         elif tag == "operation":
-            group_component.ul.append(operation_to_html(class_name, item))
+            group_list.append(operation_to_html(class_name, item))
         elif tag == "alias":
-            group_component.ul.append(alias_to_html(class_name, item))
+            group_list.append(alias_to_html(class_name, item))
     
-    return group_component
+    return render_template("group-component", title=group_name, id=group_name, items="".join(group_list))
 
-def api_page(json_path, api_path, filename):
-    json_file = os.path.join(json_path, filename)
-    api_file = os.path.join(api_path, filename[:-4] + "html")
-    
-    with open(json_file, 'r') as json_fio:
-        json_docs = json.load(json_fio)
-    
-    soup = get_template("SOUP_TEMPLATE")
-    
-    content_list = soup.find("ul", class_="content-list")
+def render_api_content(json_docs):
+    # the page content and its sidebar
+    content_list = []
+    sidebar_list = []
     class_name = ""
     for function_group in json_docs:
         purpose = function_group["purpose"]
         if purpose == "top":
-            title = get_template("title-description")
             class_name = function_group["name"]
-            title.h1.string = function_group["name"]
-            title.h1["id"] = function_group["name"]
             desc = function_group["desc"]
-            title.p.append(description_array_to_html(desc))
-            content_list.append(title)
+            content_list.append(render_template(
+                "title-description",
+                title=class_name,
+                id=class_name,
+                desc=description_array_to_html(desc)
+            ))
         elif purpose == "list":
-            group_component = process_list_json(function_group, soup, class_name)
+            group_component = process_list_json(function_group, sidebar_list, class_name)
             content_list.append(group_component)
 
-
-    with open(api_file, 'w') as api_fio:
-        api_fio.write(str(soup))
-
-    print(f'Processed: {filename} -> html')
-
-def get_api_pages(json_path):
-    api_list = []
-    for filename in os.listdir(json_path):
+    return "".join(content_list), "".join(sidebar_list)
+
+def api_page(json_docs, api_file):
+    page_name = os.path.basename(api_file)
+    with span("render page", page_name):
+        page = render_page(*render_api_content(json_docs))
+    
+    with span("write page", page_name), open(api_file, 'w') as api_fio:
+        api_fio.write(page)
+
+def load_doc_model(doc_model):
+    if doc_model["docs"] is not None:
+        return doc_model["docs"]
+    if "src" in doc_model:
+        return extract_file(doc_model["src"])
+    with open(doc_model["json"], 'r') as json_fio:
+        return json.load(json_fio)
+
+def render_api_page(doc_model, api_file):
+    before = parse_type_cache_info()
+    api_page(load_doc_model(doc_model), api_file)
+    after = parse_type_cache_info()
+    return after["hits"] - before["hits"], after["misses"] - before["misses"]
+
+def read_doc_models(json_path):
+    # the doc models of a previous JSON run, read back from its artifacts
+    doc_models = {}
+    for filename in sorted(os.listdir(json_path)):
         if filename.endswith(".json"):
-            api_list.append(filename[:-5])
-    return api_list
-
-def create_api_pages(json_path, web_path, api_path):
-    for filename in os.listdir(json_path):
-        if filename.endswith('.json'):
-            api_page(json_path, api_path, filename)
+            json_file = os.path.join(json_path, filename)
+            doc_models[filename] = {"digest": file_digest(json_file), "json": json_file, "docs": None}
+    return doc_models
+
+def get_api_pages(doc_models):
+    return [filename[:-5] for filename in doc_models]
+
+def create_api_pages(doc_models, api_path, filenames=None, jobs=1, template_args=()):
+    if filenames is None:
+        filenames = list(doc_models)
+    # worker processes rebuild the template set once each, so every page is
+    # rendered from identical state
+    results = map_jobs(
+        render_api_page,
+        [(doc_models[filename], os.path.join(api_path, filename[:-4] + "html")) for filename in filenames],
+        jobs,
+        load_templates,
+        template_args
+    )
+    for filename in filenames:
+        print(f'Processed: {filename} -> html')
     print('All files processed.')
+    
+    hits = sum(page_hits for page_hits, _ in results)
+    misses = sum(page_misses for _, page_misses in results)
+    if hits + misses > 0:
+        print(f'Type cache: {hits} hits, {misses} misses.')
 
-def create_index_page(read_me_path, index_html_path):
+def get_search_entries(json_docs):
+    # every element the page gives an id, named as on the page
+    entries = []
+    for function_group in json_docs:
+        purpose = function_group["purpose"]
+        if purpose == "top":
+            entries.append((function_group["name"], "class"))
+        elif purpose == "list" and function_group["list"]:
+            entries.append((function_group["name"], "group"))
+            for item in function_group["list"]:
+                if "name" in item:
+                    entries.append((item["name"], item["tag"]))
+                else:
+                    entries.append((operation_to_string(item), item["tag"]))
+    return entries
+
+def create_search_index(pages_docs, search_index_path):
+    # pages_docs are (json filename, doc model) in sidebar order
+    pages = []
+    for filename, json_docs in pages_docs:
+        pages.append(("api/" + filename[:-4] + "html", get_search_entries(json_docs)))
+    write_search_index(search_index_path, build_search_index(pages))
+
+def read_read_me(read_me_path):
+    # the README as page content and its sidebar headings, independent of
+    # the template so it can be kept while the template changes
     read_me_html = None
     with open(read_me_path, "r") as read_me_md:
-        read_me_html = markdown.markdown(read_me_md.read())
+        read_me_html = traced("markdown", markdown.markdown, read_me_md.read())
     
     read_me_soup = BeautifulSoup(read_me_html, "html.parser")
     for link in read_me_soup.find_all("a"):
         add_class(link, "color-link")
     
-    soup = get_template("SOUP_TEMPLATE")
-    
-    ul = soup.find("ul", class_="content-list")
-    ul.append(read_me_soup)
-    
-    sidebar_list = soup.find("ul", class_="sidebar-list")
-    headings = soup.find_all(re.compile("^h[1-3]"))
+    sidebar_headings = []
+    headings = read_me_soup.find_all(re.compile("^h[1-3]"))
     
     for heading in headings:
         tag_name = heading.name
@@ -503,23 +609,145 @@ def create_index_page(read_me_path, index_html_path):
         if tag_text in ["ON THIS PAGE", "API"]:
             continue
         if tag_name == "h3":
-            sidebar_item = get_template("sidebar-sub")
+            sidebar_template = "sidebar-sub"
         else:
-            sidebar_item = get_template("sidebar-super")
+            sidebar_template = "sidebar-super"
         
-        sidebar_item.a.string = tag_text
-        sidebar_item.a["href"] = "#" + tag_text
-        sidebar_list.append(sidebar_item)
+        sidebar_headings.append((sidebar_template, tag_text))
+    
+    return str(read_me_soup), sidebar_headings
+
+def create_index_page(read_me, index_html_path):
+    content, sidebar_headings = read_me
+    sidebar_list = []
+    for sidebar_template, tag_text in sidebar_headings:
+        sidebar_list.append(render_template(sidebar_template, text=tag_text, href="#" + tag_text))
     
     
     with open(index_html_path, "w") as READ_ME_HTML:
-        READ_ME_HTML.write(str(soup))
+        READ_ME_HTML.write(render_page(content, "".join(sidebar_list)))
     
 
+def get_fragment_slots(template_name):
+    if template_name in FRAGMENT_SLOTS:
+        return FRAGMENT_SLOTS[template_name]
+    if template_name.startswith("special-tag-"):
+        return SPECIAL_TAG_SLOTS
+    return TOKEN_SLOTS
 
-def HTML(u_read_me_path, u_template_html_path, u_build_path, web_path, index_html):
-    global get_template
+def parse_templates(template_html_path):
+    # the fragment specs and classes of every template, which only depend on
+    # the template file and the slots above
+    with open(template_html_path, "r") as template_file:
+        html_content = "".join(line.strip() for line in template_file)
+
+    SOUP_TEMPLATE = BeautifulSoup(html_content, "html.parser")
+    
+    templates = {"SOUP_TEMPLATE": SOUP_TEMPLATE}
+    for template in SOUP_TEMPLATE.head.find_all("template"):
+        template_name = template.get("id")[9:] # remove "template-"
+        extracted_template = template.extract()
+        templates[template_name] = extracted_template.contents[0]
+    
+    specs = {}
+    classes = {}
+    for template_name, template in templates.items():
+        specs[template_name] = compile_fragment_spec(
+            template, get_fragment_slots(template_name), specs
+        )
+        if template_name != "SOUP_TEMPLATE":
+            classes[template_name] = template.get("class", [])
+            classes[template_name + ":text"] = str(template.string or "")
+    
+    return {"fragments": specs, "classes": classes}
+
+def get_template_digest(template_html_path):
+    return combine_digests(file_digest(template_html_path), files_digest(TEMPLATE_PARSER_FILES))
+
+def is_parsed_templates_cache(cache, digest):
+    if not isinstance(cache, dict) or cache.get("digest") != digest:
+        return False
+    templates = cache.get("templates")
+    return (
+        isinstance(templates, dict)
+        and isinstance(templates.get("fragments"), dict)
+        and isinstance(templates.get("classes"), dict)
+    )
+
+def load_parsed_templates(template_html_path, cache_path=None):
+    # parsing the template with bs4 is skipped while the cached parse was
+    # made from the same template and parser
+    digest = get_template_digest(template_html_path)
+    if cache_path is not None and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as cache_file:
+                cache = json.load(cache_file)
+            # a cache of any other shape is parsed again like a stale one
+            if is_parsed_templates_cache(cache, digest):
+                return cache["templates"]
+        except (OSError, ValueError):
+            pass
+    
+    parsed = traced("parse template", parse_templates, template_html_path)
+    if cache_path is not None:
+        save_json(cache_path, {"digest": digest, "templates": parsed})
+    return parsed
+
+def load_templates(template_html_path, web_path, cache_path=None):
+    global render_template
+    
+    parsed = load_parsed_templates(template_html_path, cache_path)
+    fragments = {
+        template_name: fragment_renderer(spec)
+        for template_name, spec in parsed["fragments"].items()
+    }
+    template_classes.clear()
+    template_classes.update(parsed["classes"])
     
+    render_template = lambda template_name, **values: fragments[template_name](**values)
+    clear_parse_type_cache()
+    set_page_values(web_path)
+
+def set_page_values(web_path):
+    page_values.clear()
+    page_values["css_href"] = web_path + "index.css" #/LuaQuaternion/index.css
+    page_values["script_src"] = web_path + "index.js" #/LuaQuaternion/index.js
+    page_values["navigation_src"] = web_path + NAVIGATION_NAME
+
+def get_navigation(web_path, index_html, api_pages):
+    navigation = [["Home", web_path + index_html]]
+    for api_page in api_pages:
+        navigation.append([api_page, web_path + "api/" + api_page + ".html"])
+    return navigation
+
+def create_navigation(navigation_path, navigation):
+    # index.js fills the api sidebar of every page from this, a script
+    # rather than json for the same reason as the search index
+    with open(navigation_path, "w") as navigation_file:
+        navigation_file.write("window.API_NAVIGATION = ")
+        json.dump(navigation, navigation_file, separators=(",", ":"))
+        navigation_file.write(";\n")
+
+def get_shared_digest(template_html_path, web_path, index_html):
+    # every page embeds the template, so it is part of each page's digest
+    # alongside its own doc model, the list of pages is only in navigation.js
+    return combine_digests(
+        file_digest(template_html_path),
+        files_digest(GENERATOR_FILES),
+        web_path,
+        index_html
+    )
+
+def get_navigation_digest(web_path, index_html, api_pages):
+    return combine_digests(files_digest(GENERATOR_FILES), web_path, index_html, *api_pages)
+
+def get_search_digest(doc_models):
+    filename_digests = [filename + doc_model["digest"] for filename, doc_model in doc_models.items()]
+    return combine_digests(files_digest(GENERATOR_FILES), *filename_digests)
+
+def HTML(u_read_me_path, u_template_html_path, u_build_path, web_path, index_html, force=False, jobs=1, doc_models=None):
+    # doc_models are handed over by JSON in the same process, without them
+    # the pages are rendered from the json artifacts in the build folder
     print("Creating HTML API pages from JSON.")
     assert(isinstance(u_template_html_path, str))
     assert(isinstance(u_build_path, str))
@@ -533,50 +761,73 @@ def HTML(u_read_me_path, u_template_html_path, u_build_path, web_path, index_htm
     json_path = os.path.join(build_path, "json")
     api_path = os.path.join(build_path, "api")
     index_html_path = os.path.join(build_path, "index.html")
-    
-    if not os.path.exists(json_path):
-        os.makedirs(json_path)
+    search_index_path = os.path.join(build_path, SEARCH_INDEX_NAME)
+    template_cache_path = os.path.join(build_path, TEMPLATE_CACHE_NAME)
+    navigation_path = os.path.join(build_path, NAVIGATION_NAME)
+    
+    if doc_models is None:
+        if not os.path.exists(json_path):
+            os.makedirs(json_path)
+        doc_models = read_doc_models(json_path)
         
     if not os.path.exists(api_path):
         os.makedirs(api_path)
     
-    html_content = ""
-    with open(template_html_path, "r") as template_file:
-        for line in template_file.readlines():
-            html_content = html_content + line.strip()
-
-    SOUP_TEMPLATE = BeautifulSoup(html_content, "html.parser")
+    api_pages = get_api_pages(doc_models)
     
-    templates = {"SOUP_TEMPLATE": SOUP_TEMPLATE}
-    for template in SOUP_TEMPLATE.head.find_all("template"):
-        template_name = template.get("id")[9:] # remove "template-"
-        extracted_template = template.extract()
-        templates[template_name] = extracted_template.contents[0]
+    html_manifest = load_manifest(build_path).get("html", {})
+    shared_digest = get_shared_digest(template_html_path, web_path, index_html)
     
-    get_template = lambda template_name: copy.copy(templates[template_name])
+    pending_pages = []
+    page_digests = {}
+    for filename, doc_model in doc_models.items():
+        api_file = os.path.join(api_path, filename[:-4] + "html")
+        digest = combine_digests(shared_digest, doc_model["digest"])
+        page_digests[filename] = digest
+        if force or not is_fresh(html_manifest, filename, digest, api_file):
+            pending_pages.append(filename)
     
+    index_digest = combine_digests(shared_digest, file_digest(read_me_path))
+    render_index = force or not is_fresh(html_manifest, "index.html", index_digest, index_html_path)
     
-    index_css = SOUP_TEMPLATE.find(id="index-css") #/LuaQuaternion/index.css
-    index_css["href"] = web_path + "index.css"
+    # the search index covers every page, its links are relative to web_path
+    search_digest = get_search_digest(doc_models)
+    render_search = force or not is_fresh(html_manifest, SEARCH_INDEX_NAME, search_digest, search_index_path)
     
-    index_script = SOUP_TEMPLATE.find(id="index-script") #/LuaQuaternion/index.js
-    index_script["src"] = web_path + "index.js"
+    navigation_digest = get_navigation_digest(web_path, index_html, api_pages)
+    render_navigation = force or not is_fresh(html_manifest, NAVIGATION_NAME, navigation_digest, navigation_path)
     
-    api_sidebar_desktop = SOUP_TEMPLATE.find(id="api-sidebar-list-desktop")
-    create_sidebar_item(api_sidebar_desktop, "Home", web_path + index_html)
+    skipped = len(page_digests) - len(pending_pages)
+    if skipped > 0:
+        print(f'Unchanged: {skipped} page(s) skipped.')
     
-    api_sidebar_mobile = SOUP_TEMPLATE.find(id="api-sidebar-list-mobile")
-    create_sidebar_item(api_sidebar_mobile, "Home", web_path + index_html)
+    if not pending_pages and not render_index and not render_search and not render_navigation:
+        print('All pages up to date.')
+        return
     
-    api_pages = get_api_pages(json_path)
+    if pending_pages or render_index:
+        template_args = (template_html_path, web_path, template_cache_path)
+        traced("load templates", load_templates, *template_args)
     
-    for api_page in api_pages:
-        api_href = web_path + "api/" + api_page + ".html"
-        create_sidebar_item(api_sidebar_desktop, api_page, api_href)
-        create_sidebar_item(api_sidebar_mobile, api_page, api_href)
+    if pending_pages:
+        create_api_pages(doc_models, api_path, pending_pages, jobs, template_args)
+    for filename in pending_pages:
+        html_manifest[filename] = page_digests[filename]
     
-    create_api_pages(json_path, web_path, api_path)
-    create_index_page(read_me_path, index_html_path)
+    if render_index:
+        read_me = traced("read readme", read_read_me, read_me_path)
+        traced("render index", create_index_page, read_me, index_html_path)
+        html_manifest["index.html"] = index_digest
     
-
-
+    if render_navigation:
+        traced("navigation", create_navigation, navigation_path, get_navigation(web_path, index_html, api_pages))
+        html_manifest[NAVIGATION_NAME] = navigation_digest
+        print(f'Processed: {NAVIGATION_NAME}')
+    
+    if render_search:
+        pages_docs = [(filename, load_doc_model(doc_model)) for filename, doc_model in doc_models.items()]
+        traced("search index", create_search_index, pages_docs, search_index_path)
+        html_manifest[SEARCH_INDEX_NAME] = search_digest
+        print(f'Processed: {SEARCH_INDEX_NAME}')
+    
+    update_manifest(build_path, "html", html_manifest)
@@ -1,10 +1,19 @@
+import itertools
 import json
 import os
 import re
 import sys
 
-tag_regex  = r'@(\S+)\s*(.*)'
-prop_regex = r'(\S+)\s*(\S*)'
+from docs.Jobs import map_jobs
+from docs.Trace import span
+from docs.Manifest import combine_digests, file_digest, is_fresh, load_manifest, update_manifest
+
+tag_pattern  = re.compile(r'@(\S+)\s*(.*)')
+prop_pattern = re.compile(r'(\S+)\s*(\S*)')
+local_function_pattern = re.compile(r"local function (\S+)\(")
+function_pattern = re.compile(r"function (\S+)\(")
+assignment_pattern = re.compile(r"(\S+)\s*=\s*(\S+)")
+definition_pattern = re.compile(r"(\(.*)")
 
 def read_class(doc, text):
     doc["tag"] = "className"
@@ -14,9 +23,7 @@ def read_grouporder(doc, text):
     doc["grouporder"] = json.loads(text)
 
 def read_prop(doc, text):
-    name_type = re.findall(prop_regex, text)
-    if name_type:
-        name, type_ = name_type[0]
+    name, type_ = prop_pattern.search(text).groups()
     doc["name"] = name
     doc["lua_type"] = type_
     doc["tag"] = "property"
@@ -64,77 +71,69 @@ tag_map = {
     
 }
 
-def parse_doc_line(doc_store, file, doc):
+def read_definition(doc, line):
+    if line.startswith("local function"):
+        doc["name"] = local_function_pattern.search(line).group(1)
+        doc["remove_first"] = True
+    elif line.startswith("function"):
+        find = function_pattern.search(line).group(1)
+        if "." in find:
+            doc["name"] = find.split(".")[-1].strip()
+            doc["remove_first"] = True
+        elif ":" in find:
+            doc["name"] = find.split(":")[-1].strip()
+            doc["remove_first"] = False
+        else:
+            doc["name"] = find.strip()
+            doc["remove_first"] = True
+    else:
+        dot_find = assignment_pattern.search(line)
+        if not dot_find:
+            return
+        setter, equals = dot_find.groups()
+        doc["name"] = setter.split(".")[-1]
+        doc["remove_first"] = True
+        if not equals.startswith("function("):
+            return
+    
+    doc["definition"] = definition_pattern.search(line).group(1)
+
+def parse_doc_line(lines, doc):
+    # consumes the lines of one doc comment (and the definition following it)
+    # returns whether the doc is complete and a line that still needs reading
     read_desc = False # have we already read the description
     reading_desc = False # are we currently reading the docs description
-    function_definition = ""
-    read_function_definition = False #read the literal code defition of function
-    name_found = False
     
-    prev_line = file.tell()
-    while True:
-        line = file.readline()
-        if not line:
-            break
-        line = line.strip()
+    for line in lines:
         if line.startswith("@"):
-            tag, text = re.findall(tag_regex, line)[0]
-            if tag in tag_map:
-                tag_map[tag](doc, text)
+            tag_text = tag_pattern.match(line)
+            if tag_text:
+                tag, text = tag_text.groups()
+                if tag in tag_map:
+                    tag_map[tag](doc, text)
             if reading_desc:
                 read_desc = True
         elif line.endswith("]=]"):
-            reading_desc = False
-            read_desc = True
-            if len(doc.keys()) > 0:
-                doc_store.append(doc)
-            if doc["tag"] in ["method", "function", "alias"]:
-                read_function_definition = True
-            else:
-                return
-        elif read_function_definition:
-            if line == "":
-                continue
-            if line.endswith("[=["):
-                file.seek(prev_line)
-                return
-            if not name_found:
-                if line.startswith("local function"):
-                    doc["name"] = re.findall(r"local function (\S+)\(", line)[0]
-                    doc["remove_first"] = True
-                elif line.startswith("function"):
-                    find = re.findall(r"function (\S+)\(", line)[0]
-                    if "." in find:
-                        doc["name"] = find.split(".")[-1].strip()
-                        doc["remove_first"] = True
-                    elif ":" in find:
-                        doc["name"] = find.split(":")[-1].strip()
-                        doc["remove_first"] = False
-                    else:
-                        doc["name"] = find.strip()
-                        doc["remove_first"] = True
-                else:
-                    dot_find = re.findall(r"(\S+)\s*=\s*(\S+)", line)
-                    if dot_find:
-                        setter, equals = dot_find[0]
-                        doc["name"] = setter.split(".")[-1]
-                        doc["remove_first"] = True
-                        if not equals.startswith("function("):
-                            return
-                    else:
-                        return
-                
-                name_found = True
-                doc["definition"] = re.findall(r"(\(.*)", line)[0]
-            
-            return
-        else:
-            if not read_desc:
-                reading_desc = True
-                doc["desc"].append(line)
-        prev_line = file.tell()
-        
-        
+            if doc.get("tag") in ["method", "function", "alias"]:
+                return True, read_function_definition(lines, doc)
+            return True, None
+        elif not read_desc:
+            reading_desc = True
+            doc["desc"].append(line)
+    
+    return False, None
+
+def read_function_definition(lines, doc):
+    # the first non empty line after a function's doc is its definition,
+    # unless the next doc comment starts first
+    for line in lines:
+        if line == "":
+            continue
+        if line.endswith("[=["):
+            return line
+        read_definition(doc, line)
+        return None
+    return None
 
 def fix_doc_desc(doc):
     new_array = []
@@ -162,10 +161,12 @@ def fix_doc_desc(doc):
 
             
 
-def create_doc_json(doc_store):
+def create_doc_json(docs):
     doc_out_tab = []
-
-    head_doc = doc_store[0]
+    
+    head_doc = next(docs, None)
+    if head_doc is None:
+        return doc_out_tab
     grouporder = head_doc["grouporder"]
     grouporder.insert(0, "Properties")
 
@@ -175,47 +176,86 @@ def create_doc_json(doc_store):
         "desc": head_doc["desc"]
     })
 
+    group_lists = {}
     for group in grouporder:
-        doc_out_tab.append({
+        doc_group = {
             "purpose": "list",
             "name": group,
             "list": []
-        })
-
-    def get_list_to_append(name):
-        for doc_group in doc_out_tab:
-            if doc_group["name"] == name:
-                if "list" in doc_group:
-                    return doc_group
-        return None
+        }
+        doc_out_tab.append(doc_group)
+        group_lists.setdefault(group, doc_group["list"])
 
-    for doc in doc_store:
+    for doc in itertools.chain([head_doc], docs):
         if "group" in doc:
-            name = doc["group"]
-            target_list = get_list_to_append(name)
-            if target_list:
-                target_list["list"].append(doc)
+            target_list = group_lists.get(doc["group"])
+            if target_list is not None:
+                target_list.append(doc)
     
     return doc_out_tab
     
     
 
-def read_file(file):
-    doc_store = []
-    while True:
-        line = file.readline()
-        if not line:
-            break
-        line = line.strip()
-        if line[0:5] == "--[=[":
+def read_docs(file):
+    # yields each doc of a source as soon as it is complete, reading the
+    # source exactly once
+    lines = (line.strip() for line in file)
+    for line in lines:
+        while line is not None and line[0:5] == "--[=[":
             doc = {"desc": []}
-            parse_doc_line(doc_store, file, doc)
+            complete, line = parse_doc_line(lines, doc)
             fix_doc_desc(doc)
-    return create_doc_json(doc_store)
+            if complete:
+                yield doc
+
+def read_file(file):
+    return create_doc_json(read_docs(file))
+
+def extract_file(src_file_path):
+    with span("extract", os.path.basename(src_file_path)), open(src_file_path) as src_file:
+        return read_file(src_file)
 
+def write_json_file(doc_out_tab, target_file_path):
+    with span("write json", os.path.basename(target_file_path)), open(target_file_path, "w") as target_file:
+        json.dump(doc_out_tab, target_file, indent=4)
 
+def write_json_files(build_path, json_manifest, written):
+    for filename, doc_out_tab, target_file_path, digest in written:
+        write_json_file(doc_out_tab, target_file_path)
+        json_manifest[filename] = digest
+    update_manifest(build_path, "json", json_manifest)
+
+def get_doc_digest(src_file_path):
+    return combine_digests(file_digest(src_file_path), file_digest(__file__))
+
+def get_doc_sources(src_path, target_path, ignore_lua):
+    doc_sources = []
+    for filename in sorted(os.listdir(src_path)):
+        if filename.endswith('.lua'):
+            json_name = filename[:-3] + "json"
+        elif filename.endswith('.luau'):
+            json_name = filename[:-4] + "json"
+        else:
+            continue
+        
+        continue_outer = False
+        for ignore in ignore_lua:
+            if filename.startswith(ignore):
+                continue_outer = True
+                break
+        
+        if continue_outer:
+            continue
+        
+        src_file_path = os.path.join(src_path, filename)
+        target_file_path = os.path.join(target_path, json_name)
+        doc_sources.append((filename, json_name, src_file_path, target_file_path))
+    return doc_sources
 
-def JSON(u_src_path, u_build_path, u_json_path, ignore_lua=["init"]):
+def JSON(u_src_path, u_build_path, u_json_path, ignore_lua=["init"], force=False, jobs=1, write_json=True, background=False):
+    # returns the doc model of every source keyed by its json filename, so
+    # that HTML can render straight from memory, and the pending json side
+    # output when it is written in the background (otherwise None)
     print("Creating JSON API from lua(u).")
     assert(isinstance(u_src_path, str))
     assert(isinstance(u_build_path, str))
@@ -226,41 +266,56 @@ def JSON(u_src_path, u_build_path, u_json_path, ignore_lua=["init"]):
     json_path = os.path.normpath(u_json_path)
     target_path = os.path.join(build_path, json_path)
     
-    if not os.path.exists(target_path):
+    if write_json and not os.path.exists(target_path):
         print("Created JSON target folder.")
         os.makedirs(target_path)
     
-    for filename in os.listdir(src_path):
-        src_file_path = None
-        target_file_path = None
-        
-        if filename.endswith('.lua'):
-            src_file_path = os.path.join(src_path, filename)
-            target_file_path = os.path.join(target_path, filename[:-3] + "json")
-        elif filename.endswith('.luau'):
-            src_file_path = os.path.join(src_path, filename)
-            target_file_path = os.path.join(target_path, filename[:-4] + "json")
-        else:
+    json_manifest = load_manifest(build_path).get("json", {})
+    doc_models = {}
+    skipped = 0
+    pending = []
+    
+    for filename, json_name, src_file_path, target_file_path in get_doc_sources(src_path, target_path, ignore_lua):
+        digest = get_doc_digest(src_file_path)
+        # docs are only extracted here when the json is written, a renderer
+        # that needs an unchanged file extracts it from "src" itself
+        doc_models[json_name] = {"digest": digest, "src": src_file_path, "docs": None}
+        if not write_json:
             continue
-        
-        continue_outer = False
-        for ignore in ignore_lua:
-            if filename.startswith(ignore):
-                continue_outer = True
-                break
-        
-        if continue_outer:
+        if not force and is_fresh(json_manifest, filename, digest, target_file_path):
+            skipped += 1
             continue
         
-        with open(src_file_path) as src_file:
-            doc_out_tab = read_file(src_file)
-        
-        with open(target_file_path, "w") as target_file:
-            json.dump(doc_out_tab, target_file, indent=4)
-        
+        pending.append((filename, json_name, src_file_path, target_file_path, digest))
+    
+    extracted = map_jobs(
+        extract_file,
+        [(src_file_path,) for _, _, src_file_path, _, _ in pending],
+        jobs
+    )
+    
+    written = []
+    for (filename, json_name, _, target_file_path, digest), doc_out_tab in zip(pending, extracted):
+        doc_models[json_name]["docs"] = doc_out_tab
+        written.append((filename, doc_out_tab, target_file_path, digest))
         print(f'Processed: {filename} -> json')
-
+    
+    json_output = None
+    if write_json:
+        if background:
+            # nothing reads the artifacts during the build, so they are
+            # serialized on a thread while the pages are rendered
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(1)
+            json_output = executor.submit(write_json_files, build_path, json_manifest, written)
+            executor.shutdown(wait=False)
+        else:
+            write_json_files(build_path, json_manifest, written)
+    
+    if skipped > 0:
+        print(f'Unchanged: {skipped} file(s) skipped.')
     print('All files processed.')
+    return doc_models, json_output
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,20 @@
+import os
+
+def resolve_jobs(jobs):
+    if jobs is None or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+def map_jobs(function, arg_tuples, jobs=1, initializer=None, initargs=()):
+    # results are returned in submission order so that callers can log and
+    # record them exactly as the serial build would
+    arg_tuples = list(arg_tuples)
+    if jobs <= 1 or len(arg_tuples) < 2:
+        return [function(*args) for args in arg_tuples]
+
+    # multiprocessing is slow to import, and serial builds never need it
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(jobs, len(arg_tuples))
+    with ProcessPoolExecutor(workers, initializer=initializer, initargs=initargs) as executor:
+        return list(executor.map(function, *zip(*arg_tuples)))
@@ -0,0 +1,68 @@
+import hashlib
+import json
+import os
+import threading
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# stages may record their sections from different threads
+manifest_lock = threading.Lock()
+
+def file_digest(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(65536), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def files_digest(paths):
+    hasher = hashlib.sha256()
+    for path in paths:
+        hasher.update(file_digest(path).encode())
+    return hasher.hexdigest()
+
+def combine_digests(*parts):
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(str(part).encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+def get_manifest_path(build_path):
+    return os.path.join(build_path, MANIFEST_NAME)
+
+def load_manifest(build_path):
+    manifest_path = get_manifest_path(build_path)
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path, "r") as manifest_file:
+                manifest = json.load(manifest_file)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+    return {"version": MANIFEST_VERSION}
+
+def save_json(path, data, **dump_args):
+    # replaced in one step, so a concurrent reader never sees a partial file
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as json_file:
+        json.dump(data, json_file, **dump_args)
+    os.replace(temp_path, path)
+
+def save_manifest(build_path, manifest):
+    if not os.path.exists(build_path):
+        os.makedirs(build_path)
+    save_json(get_manifest_path(build_path), manifest, indent=4, sort_keys=True)
+
+def update_manifest(build_path, section_name, section):
+    # only the given section is replaced, whatever other stages have saved
+    # since this one loaded the manifest is kept
+    with manifest_lock:
+        manifest = load_manifest(build_path)
+        manifest[section_name] = section
+        save_manifest(build_path, manifest)
+
+def is_fresh(section, key, digest, output_path):
+    return section.get(key) == digest and os.path.exists(output_path)
@@ -0,0 +1,49 @@
+import json
+
+SEARCH_INDEX_NAME = "search-index.js"
+SEARCH_INDEX_VERSION = 1
+SEARCH_KINDS = ["class", "group", "property", "function", "method", "operation", "alias"]
+# queries up to this length are answered from prefix postings, longer ones
+# from the intersection of their trigram postings
+PREFIX_LENGTH = 2
+
+def get_trigrams(key):
+    return [key[i:i + 3] for i in range(len(key) - 2)]
+
+def add_posting(postings, key, entry_id):
+    posting = postings.setdefault(key, [])
+    # a key repeated within one name is only posted once
+    if not posting or posting[-1] != entry_id:
+        posting.append(entry_id)
+
+def build_search_index(pages):
+    # pages are (page path, [(name, kind)]) in sidebar order, the name of an
+    # entry is also its anchor on the page
+    search_index = {
+        "v": SEARCH_INDEX_VERSION,
+        "n": PREFIX_LENGTH,
+        "k": SEARCH_KINDS,
+        "p": [],
+        "e": [],
+        "x": {},
+        "t": {},
+    }
+    for page_id, (page, entries) in enumerate(pages):
+        search_index["p"].append(page)
+        for name, kind in entries:
+            entry_id = len(search_index["e"])
+            search_index["e"].append([name, SEARCH_KINDS.index(kind), page_id])
+            key = name.lower()
+            for length in range(1, min(len(key), PREFIX_LENGTH) + 1):
+                add_posting(search_index["x"], key[:length], entry_id)
+            for trigram in get_trigrams(key):
+                add_posting(search_index["t"], trigram, entry_id)
+    return search_index
+
+def write_search_index(search_index_path, search_index):
+    # a script rather than json, so it also loads from file:// urls where
+    # the browser refuses to fetch
+    with open(search_index_path, "w") as search_index_file:
+        search_index_file.write("window.SEARCH_INDEX = ")
+        json.dump(search_index, search_index_file, separators=(",", ":"))
+        search_index_file.write(";\n")
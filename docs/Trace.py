@@ -0,0 +1,113 @@
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+TRACE_FOLDER = "profiles"
+TRACE_NAME = "build.trace.json"
+TOP_SPANS = 20
+
+# the spans of this process, only recorded once start() is called
+events = []
+stack = []
+state = {"enabled": False, "origin": 0.0}
+
+def start():
+    events.clear()
+    stack.clear()
+    tracemalloc.start()
+    state["enabled"] = True
+    state["origin"] = time.perf_counter()
+
+def stop():
+    state["enabled"] = False
+    tracemalloc.stop()
+
+@contextmanager
+def span(name, detail=None):
+    # records the wall time of the block and the most memory it allocated on
+    # top of what was allocated when it started, nested spans included
+    if not state["enabled"]:
+        yield
+        return
+
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        # the peak is reset for the nested span, so the outer one keeps the
+        # peak it had reached so far
+        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+    tracemalloc.reset_peak()
+    frame = {"peak": current}
+    stack.append(frame)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        ended = time.perf_counter()
+        peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+        stack.pop()
+        if stack:
+            stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+        events.append({
+            "name": name,
+            "detail": detail,
+            "start": started - state["origin"],
+            "duration": ended - started,
+            "memory": peak - current,
+            "depth": len(stack),
+        })
+
+def traced(name, function, *args, **kwargs):
+    with span(name):
+        return function(*args, **kwargs)
+
+def chrome_trace(trace_events):
+    # complete ("X") events in microseconds, opened by chrome://tracing and
+    # https://ui.perfetto.dev
+    converted = []
+    for event in sorted(trace_events, key=lambda event: (event["start"], event["depth"])):
+        args = {"peak_memory_bytes": event["memory"]}
+        if event["detail"] is not None:
+            args["detail"] = event["detail"]
+        converted.append({
+            "name": event["name"] if event["detail"] is None else f"{event['name']} {event['detail']}",
+            "cat": event["name"],
+            "ph": "X",
+            "ts": round(event["start"] * 1e6, 3),
+            "dur": round(event["duration"] * 1e6, 3),
+            "pid": os.getpid(),
+            "tid": 1,
+            "args": args,
+        })
+    return {"traceEvents": converted, "displayTimeUnit": "ms"}
+
+def write_trace(trace_path):
+    os.makedirs(os.path.dirname(trace_path) or ".", exist_ok=True)
+    with open(trace_path, "w") as trace_file:
+        json.dump(chrome_trace(events), trace_file)
+
+def print_summary(count=TOP_SPANS):
+    # spans of the same name are added up, the slowest first
+    totals = {}
+    for event in events:
+        total = totals.setdefault(event["name"], {"calls": 0, "seconds": 0.0, "memory": 0})
+        total["calls"] += 1
+        total["seconds"] += event["duration"]
+        total["memory"] = max(total["memory"], event["memory"])
+
+    print(f"{'stage':<24} {'calls':>6} {'total ms':>10} {'ms/call':>9} {'peak KiB':>10}")
+    for name, total in sorted(totals.items(), key=lambda item: -item[1]["seconds"])[:count]:
+        milliseconds = total["seconds"] * 1000
+        print(
+            f"{name:<24} {total['calls']:>6} {milliseconds:>10.2f} "
+            f"{milliseconds / total['calls']:>9.3f} {total['memory'] / 1024:>10.1f}"
+        )
+
+def Trace():
+    # writes the spans recorded since start() and prints their summary
+    trace_path = os.path.join(TRACE_FOLDER, TRACE_NAME)
+    stop()
+    write_trace(trace_path)
+    print_summary()
+    print(f"Times include the overhead of tracing memory. Wrote {trace_path}")
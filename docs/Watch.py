@@ -0,0 +1,230 @@
+import os
+import threading
+import time
+import traceback
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from docs import HTML as html_stage
+from docs.JSON import JSON, extract_file, get_doc_digest, get_doc_sources, write_json_file
+from docs.Manifest import combine_digests, file_digest, load_manifest, update_manifest
+from docs.Search import SEARCH_INDEX_NAME
+
+POLL_INTERVAL = 0.5
+sep = "-" * 50
+
+def get_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def snapshot_sources(src_path, target_path, ignore_lua):
+    sources = {}
+    for filename, json_name, src_file_path, target_file_path in get_doc_sources(src_path, target_path, ignore_lua):
+        sources[json_name] = (filename, src_file_path, target_file_path, get_mtime(src_file_path))
+    return sources
+
+def serve(build_path, port):
+    handler = partial(SimpleHTTPRequestHandler, directory=build_path)
+    server = ThreadingHTTPServer(("localhost", port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    print(f"Serving {build_path} at http://localhost:{port}/")
+    return server
+
+def create_watch_state(paths, doc_models):
+    # everything a rebuild needs stays loaded between changes: the compiled
+    # template, the README and the doc model of every source
+    state = {
+        "sources": snapshot_sources(paths["src"], paths["json"], paths["ignore_lua"]),
+        "template_mtime": get_mtime(paths["template"]),
+        "read_me_mtime": get_mtime(paths["read_me"]),
+        "read_me": html_stage.read_read_me(paths["read_me"]),
+        "doc_models": {},
+        # the mtime each source last failed to rebuild at
+        "failed": {},
+    }
+    for json_name, doc_model in doc_models.items():
+        state["doc_models"][json_name] = {
+            "digest": doc_model["digest"],
+            "docs": html_stage.load_doc_model(doc_model),
+        }
+    html_stage.load_templates(paths["template"], paths["web"], paths["template_cache"])
+    return state
+
+def get_api_pages(state):
+    return html_stage.get_api_pages(sorted(state["doc_models"]))
+
+def is_changed(state, json_name, source):
+    # a source that failed to rebuild keeps its last built snapshot, so it
+    # stays stale, but it is only tried again once it is saved again
+    built = state["sources"].get(json_name)
+    if built is not None and built[3] == source[3]:
+        return False
+    return state["failed"].get(json_name) != source[3]
+
+def rebuild_source(paths, state, json_name, source, shared_digest, json_manifest, html_manifest):
+    filename, src_file_path, target_file_path, _ = source
+    docs = extract_file(src_file_path)
+    digest = get_doc_digest(src_file_path)
+    if paths["write_json"]:
+        write_json_file(docs, target_file_path)
+        json_manifest[filename] = digest
+    print(f'Processed: {filename} -> json')
+    render_page(paths, json_name, {"digest": digest, "docs": docs}, shared_digest, html_manifest)
+    state["doc_models"][json_name] = {"digest": digest, "docs": docs}
+
+def render_page(paths, json_name, doc_model, shared_digest, html_manifest):
+    api_file = os.path.join(paths["api"], json_name[:-4] + "html")
+    html_stage.api_page(doc_model["docs"], api_file)
+    html_manifest[json_name] = combine_digests(shared_digest, doc_model["digest"])
+    print(f'Processed: {json_name} -> html')
+
+def report_failure(json_name):
+    traceback.print_exc()
+    print(f'Failed: {json_name}, it is rebuilt once it is saved again.')
+
+def rebuild(paths, state, json_manifest, html_manifest):
+    sources = snapshot_sources(paths["src"], paths["json"], paths["ignore_lua"])
+    template_mtime = get_mtime(paths["template"])
+    read_me_mtime = get_mtime(paths["read_me"])
+
+    old_sources = state["sources"]
+    changed = [json_name for json_name in sources if is_changed(state, json_name, sources[json_name])]
+    removed = [json_name for json_name in old_sources if json_name not in sources]
+    template_changed = template_mtime != state["template_mtime"]
+    read_me_changed = read_me_mtime != state["read_me_mtime"]
+
+    if not (changed or removed or template_changed or read_me_changed):
+        return False
+
+    for json_name in removed:
+        filename, _, target_file_path, _ = old_sources.pop(json_name)
+        del state["doc_models"][json_name]
+        json_manifest.pop(filename, None)
+        html_manifest.pop(json_name, None)
+        api_file = os.path.join(paths["api"], json_name[:-4] + "html")
+        for output_path in [target_file_path, api_file]:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+        print(f'Removed: {json_name[:-4]}html')
+    for json_name in list(state["failed"]):
+        if json_name not in sources:
+            del state["failed"][json_name]
+
+    if template_changed:
+        html_stage.load_templates(paths["template"], paths["web"], paths["template_cache"])
+
+    # every source is saved to the state only once its json and page are
+    # written, a source that fails does not hold back the others
+    shared_digest = html_stage.get_shared_digest(paths["template"], paths["web"], paths["index_html"])
+    built = []
+    for json_name in changed:
+        try:
+            rebuild_source(paths, state, json_name, sources[json_name], shared_digest, json_manifest, html_manifest)
+        except Exception:
+            state["failed"][json_name] = sources[json_name][3]
+            report_failure(json_name)
+            continue
+        state["failed"].pop(json_name, None)
+        built.append(json_name)
+
+    # a new template touches every page, otherwise only the pages of the
+    # changed sources are stale, and a page added or removed only changes
+    # the shared navigation
+    added = [json_name for json_name in built if json_name not in old_sources]
+    for json_name in built:
+        old_sources[json_name] = sources[json_name]
+
+    if template_changed:
+        for json_name in sorted(state["doc_models"]):
+            if json_name in built:
+                continue
+            try:
+                render_page(paths, json_name, state["doc_models"][json_name], shared_digest, html_manifest)
+            except Exception:
+                report_failure(json_name)
+
+    if read_me_changed:
+        state["read_me"] = html_stage.read_read_me(paths["read_me"])
+
+    if template_changed or read_me_changed:
+        html_stage.create_index_page(state["read_me"], paths["index_html_path"])
+        html_manifest["index.html"] = combine_digests(shared_digest, file_digest(paths["read_me"]))
+        state["template_mtime"] = template_mtime
+        state["read_me_mtime"] = read_me_mtime
+        print('Processed: index.html')
+
+    if added or removed:
+        api_pages = get_api_pages(state)
+        navigation = html_stage.get_navigation(paths["web"], paths["index_html"], api_pages)
+        html_stage.create_navigation(paths["navigation_path"], navigation)
+        html_manifest[html_stage.NAVIGATION_NAME] = html_stage.get_navigation_digest(paths["web"], paths["index_html"], api_pages)
+        print(f'Processed: {html_stage.NAVIGATION_NAME}')
+
+    if built or removed:
+        doc_models = {json_name: state["doc_models"][json_name] for json_name in sorted(state["doc_models"])}
+        pages_docs = [(json_name, doc_model["docs"]) for json_name, doc_model in doc_models.items()]
+        html_stage.create_search_index(pages_docs, paths["search_index_path"])
+        html_manifest[SEARCH_INDEX_NAME] = html_stage.get_search_digest(doc_models)
+        print(f'Processed: {SEARCH_INDEX_NAME}')
+
+    if paths["write_json"]:
+        update_manifest(paths["build"], "json", json_manifest)
+    update_manifest(paths["build"], "html", html_manifest)
+    return True
+
+def start_watch(src_path, read_me_path, template_html_path, build_path, json_path, web_path, index_html, write_json=True, ignore_lua=["init"]):
+    # the first build is an ordinary incremental one, after that only the
+    # pages affected by a change are rendered again from the warm state
+    doc_models, _ = JSON(src_path, build_path, json_path, ignore_lua, write_json=write_json)
+    print(sep)
+    html_stage.HTML(read_me_path, template_html_path, build_path, web_path, index_html, doc_models=doc_models)
+
+    build_path = os.path.normpath(build_path)
+    paths = {
+        "src": os.path.normpath(src_path),
+        "read_me": os.path.normpath(read_me_path),
+        "template": os.path.normpath(template_html_path),
+        "build": build_path,
+        "json": os.path.join(build_path, os.path.normpath(json_path)),
+        "api": os.path.join(build_path, "api"),
+        "index_html_path": os.path.join(build_path, "index.html"),
+        "search_index_path": os.path.join(build_path, SEARCH_INDEX_NAME),
+        "template_cache": os.path.join(build_path, html_stage.TEMPLATE_CACHE_NAME),
+        "navigation_path": os.path.join(build_path, html_stage.NAVIGATION_NAME),
+        "web": web_path,
+        "index_html": index_html,
+        "write_json": write_json,
+        "ignore_lua": ignore_lua,
+    }
+    state = create_watch_state(paths, doc_models)
+    manifest = load_manifest(build_path)
+    json_manifest = manifest.get("json", {})
+    html_manifest = manifest.get("html", {})
+    return paths, state, json_manifest, html_manifest
+
+def Watch(src_path, read_me_path, template_html_path, build_path, json_path, web_path, index_html, write_json=True, port=None, ignore_lua=["init"]):
+    paths, state, json_manifest, html_manifest = start_watch(
+        src_path, read_me_path, template_html_path, build_path, json_path, web_path, index_html, write_json, ignore_lua
+    )
+    build_path = paths["build"]
+    server = serve(build_path, port) if port is not None else None
+    print("Watching for changes, press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            try:
+                started = time.perf_counter()
+                if rebuild(paths, state, json_manifest, html_manifest):
+                    print(f'Rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms.')
+            except Exception:
+                # a half written source must not end the session, the next
+                # save will trigger another rebuild
+                traceback.print_exc()
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        if server is not None:
+            server.shutdown()
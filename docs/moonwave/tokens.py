@@ -5,149 +5,132 @@
 
 import re
 
+PUNC_PATTERN = re.compile(r'[\{\}<>\-\|&()\[\]]')
+WHITESPACE_PATTERN = re.compile(r'\s')
+BRACKET_PATTERN = re.compile(r'[()\[\]{}]')
+
+# One scanner per context: inside a group a comma separates entries, at the
+# top level it is an ordinary atom character.
+TOP_SCANNER = re.compile(
+    r'(?P<space>\s+)'
+    r'|(?P<arrow>->)'
+    r'|(?P<open>[(\[{])'
+    r'|(?P<punc>[\{\}<>\-\|&()\[\]])'
+    r'|(?P<atom>[^\s\{\}<>\-\|&()\[\]]+)'
+)
+GROUP_SCANNER = re.compile(
+    r'(?P<space>\s+)'
+    r'|(?P<arrow>->)'
+    r'|(?P<open>[(\[{])'
+    r'|(?P<separator>,)'
+    r'|(?P<punc>[\{\}<>\-\|&()\[\]])'
+    r'|(?P<atom>[^\s\{\}<>\-\|&()\[\],]+)'
+)
+
+GROUP_TYPES = {"(": "tuple", "[": "indexer", "{": "table"}
+CLOSERS = {")": "(", "]": "[", "}": "{"}
+PUNC_TYPES = {"|": "union", "&": "intersection"}
+
 def is_punc(char):
-    return re.match(r'[\{\}<>\-\|&()\[\]]', char) is not None
+    return PUNC_PATTERN.match(char) is not None
 
 def is_whitespace(char):
-    return re.match(r'\s', char) is not None
+    return WHITESPACE_PATTERN.match(char) is not None
 
 def is_atom(char):
     return not is_whitespace(char) and not is_punc(char)
 
+def match_brackets(code):
+    # Each bracket kind is balanced on its own, ignoring the other kinds,
+    # which is how moonwave's read_balanced finds the end of a group.
+    closing = {}
+    open_stacks = {"(": [], "[": [], "{": []}
+    for match in BRACKET_PATTERN.finditer(code):
+        char = match.group()
+        position = match.start()
+        if char in open_stacks:
+            open_stacks[char].append(position)
+        else:
+            stack = open_stacks[CLOSERS[char]]
+            if stack:
+                closing[stack.pop()] = position
+    return closing
+
+def atom_tokens(tokens, atom):
+    if atom[-1] == ":":
+        tokens.append({
+            "type": "identifier",
+            "identifier": atom[:-1],
+        })
+    elif ":" in atom:
+        identifier, type_ = atom.split(":", 1)
+        tokens.append({
+            "type": "identifier",
+            "identifier": identifier
+        })
+        tokens.append({
+            "type": "lua_type",
+            "lua_type": type_
+        })
+    else:
+        tokens.append({
+            "type": "lua_type",
+            "lua_type": atom
+        })
+
 def tokenize(code, is_group=False):
+    closing = match_brackets(code)
+
+    root = []
+    tokens = root
+    end = len(code)
+    scanner = GROUP_SCANNER if is_group else TOP_SCANNER
     position = 0
-    tokens = []
-    
-    def next_():
-        nonlocal position
-        if position < len(code):
-            result = code[position]
-        else:
-            result = ""
-        position += 1
-        return result
-    
-    def peek():
-        if position < len(code):
-            return code[position]
-        return ""
-    
-    def read(condition):
-        buffer = ""
-        
-        while peek() and condition(peek()):
-            buffer += next_()
-        
-        return buffer
-    
-    def read_balanced(left, right):
-        buffer = ""
-        depth = 0
-        
-        while peek():
-            if peek() == left:
-                depth += 1
-            elif peek() == right:
-                if depth == 0:
-                    break
-                else:
-                    depth -= 1
-            
-            buffer += next_()
-        
-        return buffer
-    
-    
-    while position < len(code):
-        read(is_whitespace)
-        
-        if position >= len(code):
-            break
-        
-        if peek() == "(":
-            next_()
-            tokens.append({
-                "type": "tuple",
-                "unseparated_tokens": tokenize(read_balanced("(", ")"), True),
-            })
-            next_()
-            continue
-        
-        if peek() == "[":
-            next_()
-            tokens.append({
-                "type": "indexer",
-                "unseparated_tokens": tokenize(read_balanced("[", "]"), True),
-            })
-            next_()
+    # (tokens, end, scanner) of every enclosing group
+    stack = []
+
+    while True:
+        if position >= end:
+            if not stack:
+                break
+            # resume the enclosing group just past this group's closer
+            position = end + 1
+            tokens, end, scanner = stack.pop()
             continue
-        
-        if peek() == "{":
-            next_()
-            tokens.append({
-                "type": "table",
-                "unseparated_tokens": tokenize(read_balanced("{", "}"), True),
-            })
-            next_()
+
+        match = scanner.match(code, position, end)
+        kind = match.lastgroup
+        text = match.group()
+        position = match.end()
+
+        if kind == "space":
             continue
-        
-        if (is_group and peek() == ","):
-            next_()
+
+        if kind == "open":
+            group_tokens = []
             tokens.append({
-                "type": "separator"
+                "type": GROUP_TYPES[text],
+                "unseparated_tokens": group_tokens,
             })
+            stack.append((tokens, end, scanner))
+
+            close = closing.get(position - 1)
+            if close is not None and close < end:
+                end = close
+            tokens = group_tokens
+            scanner = GROUP_SCANNER
             continue
-        
-        if is_punc(peek()):
-            punc = next_()
-            
-            if punc == "-" and peek() == ">":
-                tokens.append({
-                    "type": "arrow"
-                })
-                next_()
-                continue
-            
-            if punc == "|":
-                tokens.append({"type": "union"})
-                continue
-            
-            if punc == "&":
-                tokens.append({"type": "intersection"})
-                continue
-            
-            tokens.append({"type": "punc", "token": punc})
-            continue
-        
-        atom = read(lambda char: char != "," and is_atom(char) if is_group else is_atom(char))
-        
-        if atom:
-            if atom[-1] == ":":
-                tokens.append({
-                    "type": "identifier", 
-                    "identifier": atom[:-1],
-                })
-            elif ":" in atom:
-                identifier, type_ = atom.split(":", 1)
-                tokens.append({
-                    "type": "identifier",
-                    "identifier": identifier
-                })
-                tokens.append({
-                    "type": "lua_type",
-                    "lua_type": type_
-                })
-            else:
-                tokens.append({
-                    "type": "lua_type", 
-                    "lua_type": atom
-                })
-            continue
-        
-        raise ValueError(f"Reached bottom of tokenizer with no match: {peek()}")
-        
-        
-    return tokens
-    
 
+        if kind == "separator":
+            tokens.append({"type": "separator"})
+        elif kind == "arrow":
+            tokens.append({"type": "arrow"})
+        elif kind == "punc":
+            if text in PUNC_TYPES:
+                tokens.append({"type": PUNC_TYPES[text]})
+            else:
+                tokens.append({"type": "punc", "token": text})
+        else:
+            atom_tokens(tokens, text)
 
+    return root
@@ -90,6 +90,45 @@ end
 CFrame.GetComponents = GetComponents
 CFrame.components = GetComponents
 
+local function Orthonormalize(self)
+    local matrix = self.matrix
+    local right = Vector3.new(matrix[1], matrix[4], matrix[7]).Unit
+    local up = Vector3.new(matrix[2], matrix[5], matrix[8])
+    local back = right:Cross(up).Unit
+    up = back:Cross(right)
+    return fromMatrix(Vector3.new(self.X, self.Y, self.Z), right, up, back)
+end
+
+CFrame.Orthonormalize = Orthonormalize
+
+local function ToAxisAngle(self)
+    -- through the quaternion of the rotation, assumes an orthonormal matrix
+    local m00, m01, m02, m10, m11, m12, m20, m21, m22 = table.unpack(self.matrix)
+    local qX, qY, qZ, qW
+    local trace = m00 + m11 + m22
+    if trace > 0 then
+        local S = math.sqrt(trace + 1) * 2
+        qX, qY, qZ, qW = (m21 - m12) / S, (m02 - m20) / S, (m10 - m01) / S, 0.25 * S
+    elseif m00 > m11 and m00 > m22 then
+        local S = math.sqrt(1 + m00 - m11 - m22) * 2
+        qX, qY, qZ, qW = 0.25 * S, (m01 + m10) / S, (m02 + m20) / S, (m21 - m12) / S
+    elseif m11 > m22 then
+        local S = math.sqrt(1 + m11 - m00 - m22) * 2
+        qX, qY, qZ, qW = (m01 + m10) / S, 0.25 * S, (m12 + m21) / S, (m02 - m20) / S
+    else
+        local S = math.sqrt(1 + m22 - m00 - m11) * 2
+        qX, qY, qZ, qW = (m02 + m20) / S, (m12 + m21) / S, 0.25 * S, (m10 - m01) / S
+    end
+
+    local s = math.sqrt(1 - qW * qW)
+    if s < 1e-12 then
+        return Vector3.xAxis, 0
+    end
+    return Vector3.new(qX / s, qY / s, qZ / s), 2 * math.acos(qW)
+end
+
+CFrame.ToAxisAngle = ToAxisAngle
+
 local function toString(self)
     return table.concat({GetComponents(self)}, ", ")
 end
@@ -0,0 +1,33 @@
+/*
+    Source: https://github.com/probablytukars/LuaQuaternion
+    [MIT LICENSE]
+*/
+
+type QuaternionLike = { X: number; Y: number; Z: number; W: number };
+
+interface QuaternionBuffer {
+    Count: number;
+    X: number[];
+    Y: number[];
+    Z: number[];
+    W: number[];
+    
+    Get(this: QuaternionBuffer, index: number): Quaternion;
+    Set(this: QuaternionBuffer, index: number, q0: QuaternionLike): void;
+    
+    MulBuffers(this: QuaternionBuffer, b0: QuaternionBuffer, b1: QuaternionBuffer): QuaternionBuffer;
+    SlerpBuffers(this: QuaternionBuffer, b0: QuaternionBuffer, b1: QuaternionBuffer, alpha: number): QuaternionBuffer;
+    NormalizeAll(this: QuaternionBuffer): QuaternionBuffer;
+    FromEulerAnglesBatch(this: QuaternionBuffer, rx: number[], ry: number[], rz: number[], rotationOrder?: Enum.RotationOrder): QuaternionBuffer;
+    RotateVectors(this: QuaternionBuffer, vX: number[], vY: number[], vZ: number[]): void;
+    
+    ToQuaternions(this: QuaternionBuffer): Quaternion[];
+}
+
+interface QuaternionBufferConstructor {
+    new: (count: number) => QuaternionBuffer;
+    fromQuaternions: (quaternions: QuaternionLike[]) => QuaternionBuffer;
+}
+
+declare const QuaternionBuffer: QuaternionBufferConstructor;
+export = QuaternionBuffer
\ No newline at end of file
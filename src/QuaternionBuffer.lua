@@ -0,0 +1,359 @@
+--!strict
+--[[
+    Source: https://github.com/probablytukars/LuaQuaternion
+    [MIT LICENSE]
+]]
+
+local Quaternion = require(script.Parent.Quaternion)
+type Quaternion = Quaternion.Quaternion
+
+local QuaternionBuffer = {_type = "QuaternionBuffer"}
+QuaternionBuffer.__index = QuaternionBuffer
+
+type QuaternionLike = {X: number, Y: number, Z: number, W: number}
+
+type t_QuaternionBuffer = {
+	new: (count: number) -> QuaternionBuffer,
+	fromQuaternions: (quaternions: {QuaternionLike}) -> QuaternionBuffer,
+
+	Count: number,
+	X: {number},
+	Y: {number},
+	Z: {number},
+	W: {number},
+
+	Get: (self: QuaternionBuffer, index: number) -> Quaternion,
+	Set: (self: QuaternionBuffer, index: number, q0: QuaternionLike) -> (),
+	MulBuffers: (self: QuaternionBuffer, b0: QuaternionBuffer, b1: QuaternionBuffer) -> QuaternionBuffer,
+	SlerpBuffers: (
+		self: QuaternionBuffer, b0: QuaternionBuffer, b1: QuaternionBuffer, alpha: number
+	) -> QuaternionBuffer,
+	NormalizeAll: (self: QuaternionBuffer) -> QuaternionBuffer,
+	FromEulerAnglesBatch: (
+		self: QuaternionBuffer, rx: {number}, ry: {number}, rz: {number}, rotationOrder: Enum.RotationOrder?
+	) -> QuaternionBuffer,
+	RotateVectors: (self: QuaternionBuffer, vX: {number}, vY: {number}, vZ: {number}) -> (),
+	ToQuaternions: (self: QuaternionBuffer) -> {Quaternion},
+}
+
+export type QuaternionBuffer = typeof(setmetatable({} :: t_QuaternionBuffer, QuaternionBuffer))
+
+-- the signs of the second term of each component in fromEulerAngles
+local EULER_ANGLE_SIGNS = {
+	XYZ = {1, -1, 1, -1},
+	YXZ = {1, -1, -1, 1},
+	ZXY = {-1, 1, 1, -1},
+	ZYX = {-1, 1, -1, 1},
+	YZX = {1, 1, -1, -1},
+	XZY = {-1, -1, 1, 1},
+}
+
+--[=[
+    @class QuaternionBuffer
+    @grouporder ["Constructors", "Methods", "Bulk Operations", "Deconstructors"]
+
+    Stores many quaternions as four flat arrays of numbers, one for each
+    component, so that whole sets of rotations can be combined, blended and
+    applied to vectors in a single loop. The bulk operations write their
+    results into the buffer they are called on without allocating anything
+    per quaternion, and give the same results as the Quaternion method of
+    the same name applied to each index.
+
+    ```lua
+    local rotations = QuaternionBuffer.new(#parts)
+    rotations:FromEulerAnglesBatch(pitches, yaws, rolls, Enum.RotationOrder.YXZ)
+    rotations:SlerpBuffers(previous, rotations, alpha)
+    ```
+]=]
+--[=[
+    @prop Count number
+
+    The number of quaternions in the buffer.
+]=]
+--[=[
+    @prop X {number}
+
+    The X component of every quaternion, can be written to directly.
+]=]
+--[=[
+    @prop Y {number}
+
+    The Y component of every quaternion, can be written to directly.
+]=]
+--[=[
+    @prop Z {number}
+
+    The Z component of every quaternion, can be written to directly.
+]=]
+--[=[
+    @prop W {number}
+
+    The W (real) component of every quaternion, can be written to directly.
+]=]
+
+--[=[
+    @function
+    @group Constructors
+
+    Creates a buffer of `count` identity quaternions.
+]=]
+local function new(count: number): QuaternionBuffer
+	local self = {
+		Count = count,
+		X = table.create(count, 0),
+		Y = table.create(count, 0),
+		Z = table.create(count, 0),
+		W = table.create(count, 1),
+	}
+	return setmetatable(self, QuaternionBuffer) :: any
+end
+
+QuaternionBuffer.new = new
+
+--[=[
+    @function
+    @group Constructors
+
+    Creates a buffer holding the components of the given quaternions.
+]=]
+local function fromQuaternions(quaternions: {QuaternionLike}): QuaternionBuffer
+	local count = #quaternions
+	local self = new(count)
+	local bX, bY, bZ, bW = self.X, self.Y, self.Z, self.W
+	for i = 1, count do
+		local q0 = quaternions[i]
+		bX[i], bY[i], bZ[i], bW[i] = q0.X, q0.Y, q0.Z, q0.W
+	end
+	return self
+end
+
+QuaternionBuffer.fromQuaternions = fromQuaternions
+
+--[=[
+    @method
+    @group Methods
+
+    Returns the quaternion at the given index.
+]=]
+local function Get(self: QuaternionBuffer, index: number): Quaternion
+	return Quaternion.new(self.X[index], self.Y[index], self.Z[index], self.W[index])
+end
+
+QuaternionBuffer.Get = Get
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the quaternion at the given index.
+]=]
+local function Set(self: QuaternionBuffer, index: number, q0: QuaternionLike)
+	self.X[index], self.Y[index], self.Z[index], self.W[index] = q0.X, q0.Y, q0.Z, q0.W
+end
+
+QuaternionBuffer.Set = Set
+
+--[=[
+    @method
+    @group Bulk Operations
+
+    Sets each quaternion of the buffer to the product `b0[i] * b1[i]`. The
+    buffer can be one of its inputs.
+]=]
+local function MulBuffers(self: QuaternionBuffer, b0: QuaternionBuffer, b1: QuaternionBuffer): QuaternionBuffer
+	local bX, bY, bZ, bW = self.X, self.Y, self.Z, self.W
+	local b0X, b0Y, b0Z, b0W = b0.X, b0.Y, b0.Z, b0.W
+	local b1X, b1Y, b1Z, b1W = b1.X, b1.Y, b1.Z, b1.W
+	for i = 1, self.Count do
+		local q0X, q0Y, q0Z, q0W = b0X[i], b0Y[i], b0Z[i], b0W[i]
+		local q1X, q1Y, q1Z, q1W = b1X[i], b1Y[i], b1Z[i], b1W[i]
+		bX[i] = q0W * q1X + q0X * q1W + q0Y * q1Z - q0Z * q1Y
+		bY[i] = q0W * q1Y - q0X * q1Z + q0Y * q1W + q0Z * q1X
+		bZ[i] = q0W * q1Z + q0X * q1Y - q0Y * q1X + q0Z * q1W
+		bW[i] = q0W * q1W - q0X * q1X - q0Y * q1Y - q0Z * q1Z
+	end
+	return self
+end
+
+QuaternionBuffer.MulBuffers = MulBuffers
+
+--[=[
+    @method
+    @group Bulk Operations
+
+    Sets each quaternion of the buffer to `b0[i]:Slerp(b1[i], alpha)`. The
+    buffer can be one of its inputs.
+]=]
+local function SlerpBuffers(self: QuaternionBuffer, b0: QuaternionBuffer, b1: QuaternionBuffer, alpha: number): QuaternionBuffer
+	local bX, bY, bZ, bW = self.X, self.Y, self.Z, self.W
+	local b0X, b0Y, b0Z, b0W = b0.X, b0.Y, b0.Z, b0.W
+	local b1X, b1Y, b1Z, b1W = b1.X, b1.Y, b1.Z, b1.W
+	for i = 1, self.Count do
+		local q0X, q0Y, q0Z, q0W = b0X[i], b0Y[i], b0Z[i], b0W[i]
+		local q1X, q1Y, q1Z, q1W = b1X[i], b1Y[i], b1Z[i], b1W[i]
+
+		local length0 = (q0X * q0X + q0Y * q0Y + q0Z * q0Z + q0W * q0W) ^ 0.5
+		if length0 > 0 then
+			q0X, q0Y, q0Z, q0W = q0X / length0, q0Y / length0, q0Z / length0, q0W / length0
+		else
+			q0X, q0Y, q0Z, q0W = 0, 0, 0, 1
+		end
+		local length1 = (q1X * q1X + q1Y * q1Y + q1Z * q1Z + q1W * q1W) ^ 0.5
+		if length1 > 0 then
+			q1X, q1Y, q1Z, q1W = q1X / length1, q1Y / length1, q1Z / length1, q1W / length1
+		else
+			q1X, q1Y, q1Z, q1W = 0, 0, 0, 1
+		end
+
+		local dot = q0X * q1X + q0Y * q1Y + q0Z * q1Z + q0W * q1W
+
+		if dot < 0 then
+			q0X, q0Y, q0Z, q0W = -q0X, -q0Y, -q0Z, -q0W
+			dot = -dot
+		end
+
+		local qX, qY, qZ, qW
+		if dot >= 1 then
+			qX = q0X + (q1X - q0X) * alpha
+			qY = q0Y + (q1Y - q0Y) * alpha
+			qZ = q0Z + (q1Z - q0Z) * alpha
+			qW = q0W + (q1W - q0W) * alpha
+		else
+			local theta0 = math.acos(dot)
+			local sinTheta0 = math.sin(theta0)
+
+			local theta = theta0 * alpha
+			local sinTheta = math.sin(theta)
+
+			local s0 = math.cos(theta) - dot * sinTheta / sinTheta0
+			local s1 = sinTheta / sinTheta0
+			qX = q0X * s0 + q1X * s1
+			qY = q0Y * s0 + q1Y * s1
+			qZ = q0Z * s0 + q1Z * s1
+			qW = q0W * s0 + q1W * s1
+		end
+
+		local length = (qX * qX + qY * qY + qZ * qZ + qW * qW) ^ 0.5
+		if length > 0 then
+			bX[i], bY[i], bZ[i], bW[i] = qX / length, qY / length, qZ / length, qW / length
+		else
+			bX[i], bY[i], bZ[i], bW[i] = 0, 0, 0, 1
+		end
+	end
+	return self
+end
+
+QuaternionBuffer.SlerpBuffers = SlerpBuffers
+
+--[=[
+    @method
+    @group Bulk Operations
+
+    Normalizes every quaternion of the buffer in place. Zero quaternions
+    become the identity, like `Quaternion.Normalize`.
+]=]
+local function NormalizeAll(self: QuaternionBuffer): QuaternionBuffer
+	local bX, bY, bZ, bW = self.X, self.Y, self.Z, self.W
+	for i = 1, self.Count do
+		local qX, qY, qZ, qW = bX[i], bY[i], bZ[i], bW[i]
+		local length = (qX * qX + qY * qY + qZ * qZ + qW * qW) ^ 0.5
+		if length > 0 then
+			bX[i], bY[i], bZ[i], bW[i] = qX / length, qY / length, qZ / length, qW / length
+		else
+			bX[i], bY[i], bZ[i], bW[i] = 0, 0, 0, 1
+		end
+	end
+	return self
+end
+
+QuaternionBuffer.NormalizeAll = NormalizeAll
+
+--[=[
+    @method
+    @group Bulk Operations
+
+    Sets each quaternion of the buffer to
+    `Quaternion.fromEulerAngles(rx[i], ry[i], rz[i], rotationOrder)`.
+]=]
+local function FromEulerAnglesBatch(self: QuaternionBuffer, rx: {number}, ry: {number}, rz: {number}, rotationOrder: Enum.RotationOrder?): QuaternionBuffer
+	local l_rotationOrder = rotationOrder or Enum.RotationOrder.XYZ
+	local signs = EULER_ANGLE_SIGNS[l_rotationOrder.Name]
+	local sX, sY, sZ, sW = signs[1], signs[2], signs[3], signs[4]
+
+	local bX, bY, bZ, bW = self.X, self.Y, self.Z, self.W
+	for i = 1, self.Count do
+		local x, y, z = rx[i], ry[i], rz[i]
+		local xCos = math.cos(x / 2)
+		local yCos = math.cos(y / 2)
+		local zCos = math.cos(z / 2)
+
+		local xSin = math.sin(x / 2)
+		local ySin = math.sin(y / 2)
+		local zSin = math.sin(z / 2)
+
+		local xSinyCos = xSin * yCos
+		local xCosySin = xCos * ySin
+		local xCosyCos = xCos * yCos
+		local xSinySin = xSin * ySin
+
+		bX[i] = xSinyCos * zCos + sX * (xCosySin * zSin)
+		bY[i] = xCosySin * zCos + sY * (xSinyCos * zSin)
+		bZ[i] = xCosyCos * zSin + sZ * (xSinySin * zCos)
+		bW[i] = xCosyCos * zCos + sW * (xSinySin * zSin)
+	end
+	return self
+end
+
+QuaternionBuffer.FromEulerAnglesBatch = FromEulerAnglesBatch
+
+--[=[
+    @method
+    @group Bulk Operations
+
+    Rotates each vector, given as arrays of its X, Y and Z components, by the
+    quaternion at the same index, like `Quaternion.RotateVector`. The arrays
+    are overwritten with the rotated vectors.
+]=]
+local function RotateVectors(self: QuaternionBuffer, vX: {number}, vY: {number}, vZ: {number})
+	local bX, bY, bZ, bW = self.X, self.Y, self.Z, self.W
+	for i = 1, self.Count do
+		local qX, qY, qZ, qW = bX[i], bY[i], bZ[i], bW[i]
+		local x, y, z = vX[i], vY[i], vZ[i]
+
+		-- q * v, with v as a quaternion with no real part
+		local pX = qW * x + qY * z - qZ * y
+		local pY = qW * y - qX * z + qZ * x
+		local pZ = qW * z + qX * y - qY * x
+		local pW = -qX * x - qY * y - qZ * z
+
+		-- (q * v) * q:Conjugate()
+		vX[i] = -pW * qX + pX * qW - pY * qZ + pZ * qY
+		vY[i] = -pW * qY + pX * qZ + pY * qW - pZ * qX
+		vZ[i] = -pW * qZ - pX * qY + pY * qX + pZ * qW
+	end
+end
+
+QuaternionBuffer.RotateVectors = RotateVectors
+
+--[=[
+    @method
+    @group Deconstructors
+
+    Returns a new array with a Quaternion for each index of the buffer.
+]=]
+local function ToQuaternions(self: QuaternionBuffer): {Quaternion}
+	local count = self.Count
+	local quaternions = table.create(count)
+	for i = 1, count do
+		quaternions[i] = Get(self, i)
+	end
+	return quaternions
+end
+
+QuaternionBuffer.ToQuaternions = ToQuaternions
+
+function QuaternionBuffer.__tostring(self: QuaternionBuffer): string
+	return "QuaternionBuffer(" .. tostring(self.Count) .. ")"
+end
+
+return QuaternionBuffer
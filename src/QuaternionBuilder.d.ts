@@ -0,0 +1,36 @@
+/*
+    Source: https://github.com/probablytukars/LuaQuaternion
+    [MIT LICENSE]
+*/
+
+type QuaternionLike = { X: number; Y: number; Z: number; W: number };
+
+interface QuaternionBuilder {
+    X: number;
+    Y: number;
+    Z: number;
+    W: number;
+    
+    Set(this: QuaternionBuilder, qX: number, qY: number, qZ: number, qW: number): QuaternionBuilder;
+    Copy(this: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder;
+    AddInto(this: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike): QuaternionBuilder;
+    SubInto(this: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike): QuaternionBuilder;
+    MulInto(this: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike): QuaternionBuilder;
+    ScaleInto(this: QuaternionBuilder, q0: QuaternionLike, scale: number): QuaternionBuilder;
+    NegateInto(this: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder;
+    ConjugateInto(this: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder;
+    InverseInto(this: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder;
+    NormalizeInto(this: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder;
+    SlerpInto(this: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike, alpha: number): QuaternionBuilder;
+    
+    ToQuaternion(this: QuaternionBuilder): Quaternion;
+    GetComponents(this: QuaternionBuilder): LuaTuple<[number, number, number, number]>;
+}
+
+interface QuaternionBuilderConstructor {
+    new: (qX?: number, qY?: number, qZ?: number, qW?: number) => QuaternionBuilder;
+    fromQuaternion: (q0: QuaternionLike) => QuaternionBuilder;
+}
+
+declare const QuaternionBuilder: QuaternionBuilderConstructor;
+export = QuaternionBuilder
\ No newline at end of file
@@ -0,0 +1,344 @@
+--!strict
+--[[
+    Source: https://github.com/probablytukars/LuaQuaternion
+    [MIT LICENSE]
+]]
+
+local Quaternion = require(script.Parent.Quaternion)
+type Quaternion = Quaternion.Quaternion
+
+local QuaternionBuilder = {_type = "QuaternionBuilder"}
+QuaternionBuilder.__index = QuaternionBuilder
+
+type QuaternionLike = {X: number, Y: number, Z: number, W: number}
+
+type t_QuaternionBuilder = {
+	new: (qX: number?, qY: number?, qZ: number?, qW: number?) -> QuaternionBuilder,
+	fromQuaternion: (q0: QuaternionLike) -> QuaternionBuilder,
+
+	X: number,
+	Y: number,
+	Z: number,
+	W: number,
+
+	Set: (self: QuaternionBuilder, qX: number, qY: number, qZ: number, qW: number) -> QuaternionBuilder,
+	Copy: (self: QuaternionBuilder, q0: QuaternionLike) -> QuaternionBuilder,
+	AddInto: (self: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike) -> QuaternionBuilder,
+	SubInto: (self: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike) -> QuaternionBuilder,
+	MulInto: (self: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike) -> QuaternionBuilder,
+	ScaleInto: (self: QuaternionBuilder, q0: QuaternionLike, scale: number) -> QuaternionBuilder,
+	NegateInto: (self: QuaternionBuilder, q0: QuaternionLike) -> QuaternionBuilder,
+	ConjugateInto: (self: QuaternionBuilder, q0: QuaternionLike) -> QuaternionBuilder,
+	InverseInto: (self: QuaternionBuilder, q0: QuaternionLike) -> QuaternionBuilder,
+	NormalizeInto: (self: QuaternionBuilder, q0: QuaternionLike) -> QuaternionBuilder,
+	SlerpInto: (
+		self: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike, alpha: number
+	) -> QuaternionBuilder,
+	ToQuaternion: (self: QuaternionBuilder) -> Quaternion,
+	GetComponents: (self: QuaternionBuilder) -> (number, number, number, number),
+}
+
+export type QuaternionBuilder = typeof(setmetatable({} :: t_QuaternionBuilder, QuaternionBuilder))
+
+--[=[
+    @class QuaternionBuilder
+    @grouporder ["Constructors", "Methods", "Deconstructors"]
+
+    A mutable quaternion for tight loops. Every Quaternion operation returns
+    a new frozen Quaternion, while the `Into` methods of a QuaternionBuilder
+    write their result into the builder itself and return it, so a chain of
+    operations allocates nothing. Inputs can be Quaternions or builders,
+    including the builder being written to, and each method gives the same
+    result as the Quaternion method of the same name.
+
+    ```lua
+    local builder = QuaternionBuilder.new()
+    for _, part in parts do
+        builder:SlerpInto(part.from, part.to, alpha):MulInto(builder, offset)
+        part.rotation = builder:ToQuaternion()
+    end
+    ```
+]=]
+--[=[
+    @prop X number
+
+    The X component, can be assigned.
+]=]
+--[=[
+    @prop Y number
+
+    The Y component, can be assigned.
+]=]
+--[=[
+    @prop Z number
+
+    The Z component, can be assigned.
+]=]
+--[=[
+    @prop W number
+
+    The W (real) component, can be assigned.
+]=]
+
+--[=[
+    @function
+    @group Constructors
+
+    Creates a new builder with X, Y, Z, W values, which default to the
+    identity like `Quaternion.new`.
+]=]
+local function new(qX: number?, qY: number?, qZ: number?, qW: number?): QuaternionBuilder
+	local self = {
+		X = qX or 0,
+		Y = qY or 0,
+		Z = qZ or 0,
+		W = qW or 1,
+	}
+	return setmetatable(self, QuaternionBuilder) :: any
+end
+
+QuaternionBuilder.new = new
+
+--[=[
+    @function
+    @group Constructors
+
+    Creates a new builder holding the components of the given quaternion.
+]=]
+local function fromQuaternion(q0: QuaternionLike): QuaternionBuilder
+	return new(q0.X, q0.Y, q0.Z, q0.W)
+end
+
+QuaternionBuilder.fromQuaternion = fromQuaternion
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the components of the builder.
+]=]
+local function Set(self: QuaternionBuilder, qX: number, qY: number, qZ: number, qW: number): QuaternionBuilder
+	self.X = qX
+	self.Y = qY
+	self.Z = qZ
+	self.W = qW
+	return self
+end
+
+QuaternionBuilder.Set = Set
+
+local function _normalize(self: QuaternionBuilder, qX: number, qY: number, qZ: number, qW: number): QuaternionBuilder
+	local length = (qX * qX + qY * qY + qZ * qZ + qW * qW) ^ 0.5
+	if length > 0 then
+		return Set(self, qX / length, qY / length, qZ / length, qW / length)
+	else
+		return Set(self, 0, 0, 0, 1)
+	end
+end
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to the components of the given quaternion.
+]=]
+local function Copy(self: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder
+	return Set(self, q0.X, q0.Y, q0.Z, q0.W)
+end
+
+QuaternionBuilder.Copy = Copy
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to `q0 + q1`.
+]=]
+local function AddInto(self: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike): QuaternionBuilder
+	return Set(self, q0.X + q1.X, q0.Y + q1.Y, q0.Z + q1.Z, q0.W + q1.W)
+end
+
+QuaternionBuilder.AddInto = AddInto
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to `q0 - q1`.
+]=]
+local function SubInto(self: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike): QuaternionBuilder
+	return Set(self, q0.X - q1.X, q0.Y - q1.Y, q0.Z - q1.Z, q0.W - q1.W)
+end
+
+QuaternionBuilder.SubInto = SubInto
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to the product `q0 * q1`.
+]=]
+local function MulInto(self: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike): QuaternionBuilder
+	local q0X, q0Y, q0Z, q0W = q0.X, q0.Y, q0.Z, q0.W
+	local q1X, q1Y, q1Z, q1W = q1.X, q1.Y, q1.Z, q1.W
+	return Set(self,
+		q0W * q1X + q0X * q1W + q0Y * q1Z - q0Z * q1Y,
+		q0W * q1Y - q0X * q1Z + q0Y * q1W + q0Z * q1X,
+		q0W * q1Z + q0X * q1Y - q0Y * q1X + q0Z * q1W,
+		q0W * q1W - q0X * q1X - q0Y * q1Y - q0Z * q1Z
+	)
+end
+
+QuaternionBuilder.MulInto = MulInto
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to the components of `q0` multiplied by `scale`.
+]=]
+local function ScaleInto(self: QuaternionBuilder, q0: QuaternionLike, scale: number): QuaternionBuilder
+	return Set(self, q0.X * scale, q0.Y * scale, q0.Z * scale, q0.W * scale)
+end
+
+QuaternionBuilder.ScaleInto = ScaleInto
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to `-q0`.
+]=]
+local function NegateInto(self: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder
+	return Set(self, -q0.X, -q0.Y, -q0.Z, -q0.W)
+end
+
+QuaternionBuilder.NegateInto = NegateInto
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to the conjugate of `q0`.
+]=]
+local function ConjugateInto(self: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder
+	return Set(self, -q0.X, -q0.Y, -q0.Z, q0.W)
+end
+
+QuaternionBuilder.ConjugateInto = ConjugateInto
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to the inverse of `q0`.
+]=]
+local function InverseInto(self: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder
+	local qX, qY, qZ, qW = q0.X, q0.Y, q0.Z, q0.W
+	local length = qX * qX + qY * qY + qZ * qZ + qW * qW
+
+	return Set(self, -qX / length, -qY / length, -qZ / length, qW / length)
+end
+
+QuaternionBuilder.InverseInto = InverseInto
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to `q0` with a length of one. The zero quaternion
+    gives the identity.
+]=]
+local function NormalizeInto(self: QuaternionBuilder, q0: QuaternionLike): QuaternionBuilder
+	return _normalize(self, q0.X, q0.Y, q0.Z, q0.W)
+end
+
+QuaternionBuilder.NormalizeInto = NormalizeInto
+
+--[=[
+    @method
+    @group Methods
+
+    Sets the builder to the quaternion `alpha` of the way along the great
+    circle arc from `q0` to `q1`, like `Quaternion.Slerp`.
+]=]
+local function SlerpInto(self: QuaternionBuilder, q0: QuaternionLike, q1: QuaternionLike, alpha: number): QuaternionBuilder
+	local q0X, q0Y, q0Z, q0W = q0.X, q0.Y, q0.Z, q0.W
+	local q1X, q1Y, q1Z, q1W = q1.X, q1.Y, q1.Z, q1.W
+
+	local length0 = (q0X * q0X + q0Y * q0Y + q0Z * q0Z + q0W * q0W) ^ 0.5
+	if length0 > 0 then
+		q0X, q0Y, q0Z, q0W = q0X / length0, q0Y / length0, q0Z / length0, q0W / length0
+	else
+		q0X, q0Y, q0Z, q0W = 0, 0, 0, 1
+	end
+	local length1 = (q1X * q1X + q1Y * q1Y + q1Z * q1Z + q1W * q1W) ^ 0.5
+	if length1 > 0 then
+		q1X, q1Y, q1Z, q1W = q1X / length1, q1Y / length1, q1Z / length1, q1W / length1
+	else
+		q1X, q1Y, q1Z, q1W = 0, 0, 0, 1
+	end
+
+	local dot = q0X * q1X + q0Y * q1Y + q0Z * q1Z + q0W * q1W
+
+	if dot < 0 then
+		q0X, q0Y, q0Z, q0W = -q0X, -q0Y, -q0Z, -q0W
+		dot = -dot
+	end
+
+	if dot >= 1 then
+		return _normalize(self,
+			q0X + (q1X - q0X) * alpha,
+			q0Y + (q1Y - q0Y) * alpha,
+			q0Z + (q1Z - q0Z) * alpha,
+			q0W + (q1W - q0W) * alpha
+		)
+	end
+
+	local theta0 = math.acos(dot)
+	local sinTheta0 = math.sin(theta0)
+
+	local theta = theta0 * alpha
+	local sinTheta = math.sin(theta)
+
+	local s0 = math.cos(theta) - dot * sinTheta / sinTheta0
+	local s1 = sinTheta / sinTheta0
+	return _normalize(self,
+		q0X * s0 + q1X * s1,
+		q0Y * s0 + q1Y * s1,
+		q0Z * s0 + q1Z * s1,
+		q0W * s0 + q1W * s1
+	)
+end
+
+QuaternionBuilder.SlerpInto = SlerpInto
+
+--[=[
+    @method
+    @group Deconstructors
+
+    Returns a new Quaternion with the components of the builder.
+]=]
+local function ToQuaternion(self: QuaternionBuilder): Quaternion
+	return Quaternion.new(self.X, self.Y, self.Z, self.W)
+end
+
+QuaternionBuilder.ToQuaternion = ToQuaternion
+
+--[=[
+    @method
+    @group Deconstructors
+
+    Returns the components of the builder in X, Y, Z, W order.
+]=]
+local function GetComponents(self: QuaternionBuilder): (number, number, number, number)
+	return self.X, self.Y, self.Z, self.W
+end
+
+QuaternionBuilder.GetComponents = GetComponents
+
+function QuaternionBuilder.__tostring(self: QuaternionBuilder): string
+	return tostring(self.X) .. ", " .. tostring(self.Y) .. ", " .. tostring(self.Z) .. ", " .. tostring(self.W)
+end
+
+return QuaternionBuilder
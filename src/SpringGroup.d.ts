@@ -0,0 +1,33 @@
+/*
+    Source: https://github.com/probablytukars/LuaQuaternion
+    Based on: https://github.com/Quenty/NevermoreEngine/tree/main/src/spring
+    [MIT LICENSE]
+*/
+
+type nlerpable = number | Vector2 | Vector3 | UDim | UDim2
+
+interface SpringGroup {
+    AddSpring(this: SpringGroup, initial: nlerpable, damping?: number, speed?: number): number;
+    AddRadianSpring(this: SpringGroup, initial?: number, damping?: number, speed?: number): number;
+    AddQuaternionSpring(this: SpringGroup, initial?: Quaternion, damping?: number, speed?: number): number;
+    Step(this: SpringGroup): void;
+    
+    GetPosition(this: SpringGroup, index: number): nlerpable | Quaternion;
+    GetVelocity(this: SpringGroup, index: number): nlerpable;
+    GetTarget(this: SpringGroup, index: number): nlerpable | Quaternion;
+    SetTarget(this: SpringGroup, index: number, target: nlerpable | Quaternion): void;
+    SetDamping(this: SpringGroup, index: number, damping: number): void;
+    SetSpeed(this: SpringGroup, index: number, speed: number): void;
+    Impulse(this: SpringGroup, index: number, velocity: nlerpable): void;
+    Reset(this: SpringGroup, index: number, target?: nlerpable | Quaternion): void;
+    
+    Count: number;
+    Clock(): number;
+}
+
+interface SpringGroupConstructor {
+    new: (clock?: () => number) => SpringGroup;
+}
+
+declare const SpringGroup: SpringGroupConstructor;
+export = SpringGroup
\ No newline at end of file
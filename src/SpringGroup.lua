@@ -0,0 +1,394 @@
+--!strict
+--[[
+    Source: https://github.com/probablytukars/LuaQuaternion
+    Based on: https://github.com/Quenty/NevermoreEngine/tree/main/src/spring
+    [MIT LICENSE]
+]]
+
+local Quaternion = require(script.Parent.Quaternion)
+type Quaternion = Quaternion.Quaternion
+
+local pi = math.pi
+local tau = pi * 2
+
+local function wrap(x: number): number return ((x + tau) % (2 * tau)) - tau end
+
+-- the kind of each member, which decides how it is stepped
+local SPRING = 1
+local RADIAN_SPRING = 2
+local QUATERNION_SPRING = 3
+
+local SpringGroup = {_type = "SpringGroup"}
+SpringGroup.__index = SpringGroup
+
+type Coefficients = {number}
+
+type t_SpringGroup = {
+	new: (clock: (() -> number)?) -> SpringGroup,
+	AddSpring: (self: SpringGroup, initial: any, damping: number?, speed: number?) -> number,
+	AddRadianSpring: (self: SpringGroup, initial: number?, damping: number?, speed: number?) -> number,
+	AddQuaternionSpring: (self: SpringGroup, initial: Quaternion?, damping: number?, speed: number?) -> number,
+	Step: (self: SpringGroup) -> (),
+	GetPosition: (self: SpringGroup, index: number) -> any,
+	GetVelocity: (self: SpringGroup, index: number) -> any,
+	GetTarget: (self: SpringGroup, index: number) -> any,
+	SetTarget: (self: SpringGroup, index: number, target: any) -> (),
+	SetDamping: (self: SpringGroup, index: number, damping: number) -> (),
+	SetSpeed: (self: SpringGroup, index: number, speed: number) -> (),
+	Impulse: (self: SpringGroup, index: number, velocity: any) -> (),
+	Reset: (self: SpringGroup, index: number, target: any?) -> (),
+
+	Count: number,
+	Clock: () -> number,
+
+	_time: number,
+	_kind: {number},
+	_position: {any},
+	_velocity: {any},
+	_target: {any},
+	_damping: {number},
+	_speed: {number},
+	_initial: {any},
+	_coefficients: {[number]: {[number]: Coefficients}},
+	_coefficientsDelta: number,
+}
+
+export type SpringGroup = typeof(setmetatable({} :: t_SpringGroup, SpringGroup))
+
+--[=[
+    @class SpringGroup
+    @grouporder ["Constructors", "Members", "Methods"]
+
+    Steps many springs together. Each member is stepped exactly like a
+    Spring, RadianSpring or QuaternionSpring with the same settings, but
+    the state of every member is kept in flat arrays, the clock is read
+    once per step, and the damping coefficients are only computed once
+    for each damping and speed shared by members.
+
+    Unlike the springs, a group is not lazily evaluated: positions and
+    velocities are the ones from the last call to `Step`.
+
+    ```lua
+    local group = SpringGroup.new()
+    local index = group:AddQuaternionSpring(part.rotation, 0.5, 4)
+    group:SetTarget(index, target)
+    RunService.Heartbeat:Connect(function()
+        group:Step()
+        part.rotation = group:GetPosition(index)
+    end)
+    ```
+]=]
+--[=[
+    @prop Count number
+
+    The number of members in the group.
+]=]
+--[=[
+    @prop Clock
+
+    The clock read by `Step`, defaults to `os.clock`.
+]=]
+
+--[=[
+    @function
+    @group Constructors
+
+    Constructs a new empty SpringGroup which reads the given clock.
+]=]
+local function new(clock: (() -> number)?): SpringGroup
+	local l_clock = clock or os.clock
+
+	local self = {
+		Count = 0,
+		Clock = l_clock,
+		_time = l_clock(),
+		_kind = {},
+		_position = {},
+		_velocity = {},
+		_target = {},
+		_damping = {},
+		_speed = {},
+		_initial = {},
+		_coefficients = {},
+		_coefficientsDelta = 0,
+	}
+
+	return setmetatable(self :: t_SpringGroup, SpringGroup)
+end
+
+SpringGroup.new = new
+
+local function _add(self: SpringGroup, kind: number, initial: any, velocity: any, damping: number?, speed: number?): number
+	local index = self.Count + 1
+	self.Count = index
+	self._kind[index] = kind
+	self._position[index] = initial
+	self._velocity[index] = velocity
+	self._target[index] = initial
+	self._damping[index] = damping or 1
+	self._speed[index] = speed or 1
+	self._initial[index] = initial
+	return index
+end
+
+--[=[
+    @method
+    @group Members
+
+    Adds a member stepped like a Spring, of any n-lerpable type, and returns
+    its index.
+]=]
+local function AddSpring(self: SpringGroup, initial: any, damping: number?, speed: number?): number
+	return _add(self, SPRING, initial, initial * 0, damping, speed)
+end
+
+SpringGroup.AddSpring = AddSpring
+
+--[=[
+    @method
+    @group Members
+
+    Adds a member stepped like a RadianSpring, which always targets zero,
+    and returns its index.
+]=]
+local function AddRadianSpring(self: SpringGroup, initial: number?, damping: number?, speed: number?): number
+	local l_initial = initial or 0
+	local index = _add(self, RADIAN_SPRING, l_initial, 0 * l_initial, damping, speed)
+	self._target[index] = 0
+	return index
+end
+
+SpringGroup.AddRadianSpring = AddRadianSpring
+
+--[=[
+    @method
+    @group Members
+
+    Adds a member stepped like a QuaternionSpring and returns its index.
+]=]
+local function AddQuaternionSpring(self: SpringGroup, initial: Quaternion?, damping: number?, speed: number?): number
+	return _add(self, QUATERNION_SPRING, initial or Quaternion.identity, Vector3.zero, damping, speed)
+end
+
+SpringGroup.AddQuaternionSpring = AddQuaternionSpring
+
+local function _computeCoefficients(dampingFactor: number, speed: number, delta: number): Coefficients
+	local deltaTime = speed * delta
+	local dampingSquared = dampingFactor * dampingFactor
+
+	local angFreq, sinTheta, cosTheta
+	if dampingSquared < 1 then
+		angFreq = math.sqrt(1 - dampingSquared)
+		local exponential = math.exp(-dampingFactor * deltaTime) / angFreq
+		cosTheta = exponential * math.cos(angFreq * deltaTime)
+		sinTheta = exponential * math.sin(angFreq * deltaTime)
+	elseif dampingSquared == 1 then
+		angFreq = 1
+		local exponential = math.exp(-dampingFactor * deltaTime) / angFreq
+		cosTheta, sinTheta = exponential, exponential * deltaTime
+	else
+		angFreq = math.sqrt(dampingSquared - 1)
+		local angFreq2 = 2 * angFreq
+		local u = math.exp((-dampingFactor + angFreq) * deltaTime) / angFreq2
+		local v = math.exp((-dampingFactor - angFreq) * deltaTime) / angFreq2
+		cosTheta, sinTheta = u + v, u - v
+	end
+
+	local pullToTarget = 1 - (angFreq * cosTheta + dampingFactor * sinTheta)
+	local velPosPush = sinTheta / speed
+	local velPushRate = speed * sinTheta
+	local velocityDecay = angFreq * cosTheta - dampingFactor * sinTheta
+
+	return {pullToTarget, velPosPush, velPushRate, velocityDecay}
+end
+
+--[=[
+    @method
+    @group Methods
+
+    Reads the clock and steps every member forwards to that time.
+]=]
+local function Step(self: SpringGroup)
+	local now = self.Clock()
+	local delta = now - self._time
+	self._time = now
+
+	-- coefficients only depend on damping, speed and delta, so they are
+	-- kept while the delta stays the same, as it does for a fixed timestep
+	local coefficients = self._coefficients
+	if delta ~= self._coefficientsDelta then
+		coefficients = {}
+		self._coefficients = coefficients
+		self._coefficientsDelta = delta
+	end
+
+	local kinds = self._kind
+	local positions = self._position
+	local velocities = self._velocity
+	local targets = self._target
+	local dampings = self._damping
+	local speeds = self._speed
+
+	for i = 1, self.Count do
+		local damping, speed = dampings[i], speeds[i]
+		local bySpeed = coefficients[damping]
+		if not bySpeed then
+			bySpeed = {}
+			coefficients[damping] = bySpeed
+		end
+		local coefficient = bySpeed[speed]
+		if not coefficient then
+			coefficient = _computeCoefficients(damping, speed, delta)
+			bySpeed[speed] = coefficient
+		end
+		local pullToTarget, velPosPush = coefficient[1], coefficient[2]
+		local velPushRate, velocityDecay = coefficient[3], coefficient[4]
+
+		local kind = kinds[i]
+		local currentPosition = positions[i]
+		local currentVelocity = velocities[i]
+		if kind == SPRING then
+			local positionDifference = targets[i] - currentPosition
+
+			positions[i] =
+				currentPosition +
+				positionDifference * pullToTarget +
+				currentVelocity * velPosPush
+
+			velocities[i] =
+				positionDifference * velPushRate +
+				currentVelocity * velocityDecay
+		elseif kind == RADIAN_SPRING then
+			local positionDifference = wrap(-currentPosition)
+
+			positions[i] = currentPosition + (positionDifference * pullToTarget) + (currentVelocity * velPosPush)
+			velocities[i] = (positionDifference * velPushRate) + (currentVelocity * velocityDecay)
+		else
+			local targetRotation = targets[i]
+			local posQuat = currentPosition:Slerp(targetRotation, pullToTarget)
+			positions[i] = posQuat:Integrate(currentVelocity, velPosPush)
+
+			local difQuat = currentPosition:Difference(targetRotation)
+			local axis, angle = difQuat:ToAxisAngle()
+			local velPush = (axis * angle) * velPushRate
+			local velDecay = currentVelocity * velocityDecay
+
+			velocities[i] = velPush + velDecay
+		end
+	end
+end
+
+SpringGroup.Step = Step
+
+--[=[
+    @method
+    @group Members
+
+    Returns the position of the member as of the last step.
+]=]
+local function GetPosition(self: SpringGroup, index: number): any
+	return self._position[index]
+end
+
+SpringGroup.GetPosition = GetPosition
+
+--[=[
+    @method
+    @group Members
+
+    Returns the velocity of the member as of the last step.
+]=]
+local function GetVelocity(self: SpringGroup, index: number): any
+	return self._velocity[index]
+end
+
+SpringGroup.GetVelocity = GetVelocity
+
+--[=[
+    @method
+    @group Members
+
+    Returns the target of the member.
+]=]
+local function GetTarget(self: SpringGroup, index: number): any
+	return self._target[index]
+end
+
+SpringGroup.GetTarget = GetTarget
+
+--[=[
+    @method
+    @group Members
+
+    Sets the target of the member from the next step on. Members added with
+    `AddRadianSpring` always target zero.
+]=]
+local function SetTarget(self: SpringGroup, index: number, target: any)
+	self._target[index] = target
+end
+
+SpringGroup.SetTarget = SetTarget
+
+--[=[
+    @method
+    @group Members
+
+    Sets the damping of the member from the next step on.
+]=]
+local function SetDamping(self: SpringGroup, index: number, damping: number)
+	self._damping[index] = damping
+end
+
+SpringGroup.SetDamping = SetDamping
+
+--[=[
+    @method
+    @group Members
+
+    Sets the speed of the member from the next step on, which should be
+    between [0, infinity).
+]=]
+local function SetSpeed(self: SpringGroup, index: number, speed: number)
+	self._speed[index] = speed < 0 and 0 or speed
+end
+
+SpringGroup.SetSpeed = SetSpeed
+
+--[=[
+    @method
+    @group Members
+
+    Impulses the member, increasing velocity by the amount given.
+]=]
+local function Impulse(self: SpringGroup, index: number, velocity: any)
+	self._velocity[index] = self._velocity[index] + velocity
+end
+
+SpringGroup.Impulse = Impulse
+
+--[=[
+    @method
+    @group Members
+
+    Resets the member's position and target to the target value provided, or
+    to the initial value the member was added with if target is not
+    specified. Sets the velocity to zero.
+]=]
+local function Reset(self: SpringGroup, index: number, target: any?)
+	local kind = self._kind[index]
+	local setTo = target or self._initial[index]
+	if kind == RADIAN_SPRING then
+		setTo = 0
+	end
+	self._position[index] = setTo
+	self._target[index] = setTo
+	if kind == QUATERNION_SPRING then
+		self._velocity[index] = Vector3.zero
+	else
+		self._velocity[index] = 0 * setTo
+	end
+end
+
+SpringGroup.Reset = Reset
+
+return SpringGroup
@@ -1,8 +1,11 @@
 import Quaternion from "./Quaternion"
+import QuaternionBuffer from "./QuaternionBuffer"
+import QuaternionBuilder from "./QuaternionBuilder"
 import QuaternionSpring from "./QuaternionSpring"
 import RadianSpring from "./RadianSpring"
 import Spring from "./Spring"
+import SpringGroup from "./SpringGroup"
 
-export { Quaternion, QuaternionSpring, RadianSpring, Spring }
+export { Quaternion, QuaternionBuffer, QuaternionBuilder, QuaternionSpring, RadianSpring, Spring, SpringGroup }
 
-export type { Quaternion, QuaternionSpring, RadianSpring, Spring }
\ No newline at end of file
+export type { Quaternion, QuaternionBuffer, QuaternionBuilder, QuaternionSpring, RadianSpring, Spring, SpringGroup }
\ No newline at end of file
@@ -1,18 +1,27 @@
 local Quaternion = require(script.Quaternion)
+local QuaternionBuffer = require(script.QuaternionBuffer)
+local QuaternionBuilder = require(script.QuaternionBuilder)
 local QuaternionSpring = require(script.QuaternionSpring)
 local RadianSpring = require(script.RadianSpring)
 local Spring = require(script.Spring)
+local SpringGroup = require(script.SpringGroup)
 
 export type Quaternion = Quaternion.Quaternion
+export type QuaternionBuffer = QuaternionBuffer.QuaternionBuffer
+export type QuaternionBuilder = QuaternionBuilder.QuaternionBuilder
 export type QuaternionSpring = QuaternionSpring.QuaternionSpring
 export type RadianSpring = RadianSpring.RadianSpring
 
 export type nlerpable = Spring.nlerpable
 export type Spring<T = nlerpable> = Spring.Spring<T>
+export type SpringGroup = SpringGroup.SpringGroup
 
 return {
 	Quaternion = Quaternion,
+	QuaternionBuffer = QuaternionBuffer,
+	QuaternionBuilder = QuaternionBuilder,
 	QuaternionSpring = QuaternionSpring,
 	RadianSpring = RadianSpring,
-	Spring = Spring
+	Spring = Spring,
+	SpringGroup = SpringGroup
 }
\ No newline at end of file
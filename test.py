@@ -1,8 +1,13 @@
+from argparse import ArgumentParser
 from configparser import ConfigParser
 import os
 import shutil
 import subprocess
+from docs.Jobs import resolve_jobs
+from tests.ConvertTestData import ConvertTestData, is_converted
+from tests.Instrument import Instrument
 from tests.PrepareTest import PrepareTest
+from tests.Profile import DEFAULT_FREQUENCY, PROFILE_FOLDER, TOP_FUNCTIONS, Profile, profile_command
 
 def run_python_script(script, on_succ, on_err):
 	try:
@@ -14,10 +19,141 @@ def run_python_script(script, on_succ, on_err):
 		on_succ(0)
 
 CONFIG = "config.conf"
+TEST_SCRIPT = "tests/test.lua"
 sep = "-" * 50
 sep_n = sep + "\n"
 
+def parse_args():
+	parser = ArgumentParser(description="Run the luau test suite.")
+	parser.add_argument(
+		"-j", "--jobs", type=int, default=1,
+		help="number of luau processes to shard the tests across, 0 uses every available core"
+	)
+	parser.add_argument(
+		"--fuzz", type=float, metavar="SECONDS",
+		help="instead of the tests, compare random inputs against tests/reference for this many seconds"
+	)
+	parser.add_argument(
+		"--seed", type=int,
+		help="seed for --fuzz, to repeat a run"
+	)
+	parser.add_argument(
+		"--profile", type=int, nargs="?", const=DEFAULT_FREQUENCY, metavar="HZ",
+		help=f"run the tests under the luau sampling profiler (default {DEFAULT_FREQUENCY} Hz) and write flamegraphs to {PROFILE_FOLDER}/"
+	)
+	parser.add_argument(
+		"--instrument", type=int, nargs="?", const=TOP_FUNCTIONS, metavar="N",
+		help=f"count the calls and time of every library function, print the top N (default {TOP_FUNCTIONS}) and write them to {PROFILE_FOLDER}/instrument.json"
+	)
+	args = parser.parse_args()
+	if args.profile and args.jobs != 1:
+		parser.error("--profile runs a single luau process and can't be combined with --jobs")
+	if args.instrument and args.jobs != 1:
+		parser.error("--instrument runs a single luau process and can't be combined with --jobs")
+	if args.instrument and args.profile:
+		parser.error("--instrument and --profile can't be combined, the wrappers would show up in the profile")
+	return args
+
+def get_luau():
+	if os.name == 'nt':
+		return "binaries/windows/luau.exe"
+	return "binaries/ubuntu/luau"
+
+def get_result_string(total_tests, tests_passed, tests_failed, unhandled_exceptions):
+	# same summary as getResultString in tests/Tester.lua
+	return (
+		f"[{tests_passed} / {total_tests}] tests passed."
+		f"\nFailures: {tests_failed}"
+		f"\nUnhandled Exceptions: {unhandled_exceptions}"
+	)
+
+def write_shard_drivers(temp_test_folder, jobs):
+	# luau takes no arguments, so each shard gets a copy of the test script
+	# that sets the SHARD global before running
+	with open(TEST_SCRIPT, "r") as test_script:
+		test_source = test_script.read()
+	
+	drivers = []
+	for index in range(1, jobs + 1):
+		driver_path = os.path.join(temp_test_folder, f"shard_{index}.lua")
+		with open(driver_path, "w") as driver:
+			driver.write(f"SHARD = {{index = {index}, count = {jobs}}}\n")
+			driver.write(test_source)
+		drivers.append(driver_path)
+	return drivers
+
+def parse_shard_output(output):
+	# returns {position: (group name, group display name, output, counts)}
+	results = {}
+	current = None
+	for line in output.splitlines():
+		fields = line.split("\t")
+		if fields[0] == "@@begin":
+			current = (int(fields[1]), fields[2], fields[3], [])
+		elif fields[0] == "@@end" and current is not None:
+			position, group_name, group_display_name, lines = current
+			counts = [int(field) for field in fields[1:5]]
+			results[position] = (group_name, group_display_name, "\n".join(lines), counts)
+			current = None
+		elif current is not None:
+			current[3].append(line)
+	return results
+
+def print_merged_report(results):
+	# reassembles the shards in the order of a single run, printing exactly
+	# what Tester:ExecuteTests prints
+	totals = [0, 0, 0, 0]
+	group_name = None
+	group_display_name = None
+	group_totals = None
+	
+	def print_group_summary():
+		print(f"\n{group_display_name}\n{get_result_string(*group_totals)}\n")
+	
+	stars = "*" * 15
+	for position in sorted(results):
+		name, display_name, output, counts = results[position]
+		if name != group_name:
+			if group_name is not None:
+				print_group_summary()
+			group_name = name
+			group_display_name = display_name
+			group_totals = [0, 0, 0, 0]
+			print(f"{stars} {display_name} {stars}")
+		print(output)
+		for i in range(4):
+			group_totals[i] += counts[i]
+			totals[i] += counts[i]
+	
+	if group_name is not None:
+		print_group_summary()
+	print("Final results:")
+	print(get_result_string(*totals))
+
+def run_sharded(temp_test_folder, jobs):
+	drivers = write_shard_drivers(temp_test_folder, jobs)
+	processes = [
+		subprocess.Popen([get_luau(), driver], stdout=subprocess.PIPE, text=True, encoding="utf-8")
+		for driver in drivers
+	]
+	
+	results = {}
+	failed = None
+	for process, driver in zip(processes, drivers):
+		output, _ = process.communicate()
+		if process.returncode != 0:
+			print(output)
+			failed = failed or subprocess.CalledProcessError(process.returncode, [get_luau(), driver])
+		results.update(parse_shard_output(output))
+	
+	if failed is not None:
+		raise failed
+	print_merged_report(results)
+
 def Test():
+	args = parse_args()
+	jobs = resolve_jobs(args.jobs)
+	
 	on_err = lambda code: print(f"{sep_n}An error occurred during build: {code}")
 	on_succ = lambda code: None
 	on_fin = lambda code: print(f"{sep_n}Build finished successfully.")
@@ -31,15 +167,33 @@ def Test():
 	
 	print(f"{sep_n}Preprocessing luau files for testing")
 	
-	run_python_script(lambda: PrepareTest(src_folder, temp_test_folder), on_succ, on_err)
+	run_python_script(lambda: PrepareTest(src_folder, temp_test_folder, bool(args.instrument)), on_succ, on_err)
+	
+	if args.fuzz is not None:
+		# the fuzzer needs numpy, which plain test runs do not
+		from tests.Fuzz import Fuzz
+		print(f"{sep_n}Fuzzing for {args.fuzz:g} seconds.")
+		try:
+			failures = Fuzz(get_luau(), args.fuzz, args.seed)
+		finally:
+			shutil.rmtree(temp_test_folder)
+		print(f"{sep_n}Fuzzing finished {'with failures' if failures else 'successfully'}.")
+		exit(1 if failures else 0)
+	
+	if not is_converted("tests/TestData.lua", "tests/TestDataPacked.lua"):
+		print(f"{sep_n}Packing test data")
+		run_python_script(ConvertTestData, on_succ, on_err)
 	
 	print(f"{sep_n}Executing tests.")
-	if os.name == 'nt':
-		command = ["binaries/windows/luau.exe", "tests/test.lua"]
+	if jobs > 1:
+		run_sharded(temp_test_folder, jobs)
+	elif args.profile:
+		subprocess.run(profile_command(get_luau(), TEST_SCRIPT, args.profile), check=True)
+		Profile("test", src_folder, temp_test_folder)
+	elif args.instrument:
+		Instrument(get_luau(), TEST_SCRIPT, temp_test_folder, args.instrument)
 	else:
-		command = ["binaries/ubuntu/luau", "tests/test.lua"]
-	
-	subprocess.run(command, check=True)
+		subprocess.run([get_luau(), TEST_SCRIPT], check=True)
 	
 	print(f"{sep_n}Testing finished successfully.")
 	
@@ -0,0 +1,195 @@
+import hashlib
+import os
+import re
+import struct
+
+TEST_DATA_PATH = "tests/TestData.lua"
+PACKED_TEST_DATA_PATH = "tests/TestDataPacked.lua"
+PACKED_VERSION = 2
+
+# bytes a quoted lua string can hold without an escape, the column indices
+# are written as base len(SYMBOLS) numbers in these bytes
+SYMBOLS = bytes(byte for byte in range(1, 256) if byte not in (0x0A, 0x0D, 0x22, 0x5C))
+
+# the test data is a table literal of tables, numbers and string keys only
+TOKEN_PATTERN = re.compile(
+    r'\s*(?:'
+    r'(?P<open>\{)'
+    r'|(?P<close>\})'
+    r'|(?P<separator>[,;])'
+    r'|\["(?P<key>[^"\\]*)"\]\s*='
+    r'|(?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    r')'
+)
+
+def parse_table_literal(source):
+    # tables become lists of (key, value) in source order, positional values
+    # are keyed by their 1-based index like in lua
+    source = source.strip()
+    if not source.startswith("return"):
+        raise ValueError("Test data must return a table literal.")
+
+    position = len("return")
+    root = None
+    stack = []
+    key = None
+    while True:
+        match = TOKEN_PATTERN.match(source, position)
+        if match is None:
+            break
+        position = match.end()
+        kind = match.lastgroup
+        if kind == "open":
+            table = []
+            if stack:
+                append_value(stack[-1], key, table)
+            else:
+                root = table
+            stack.append([table, 0])
+            key = None
+        elif kind == "close":
+            stack.pop()
+        elif kind == "key":
+            key = match.group("key")
+        elif kind == "number":
+            append_value(stack[-1], key, float(match.group("number")))
+            key = None
+        else:
+            key = None
+
+    if source[position:].strip() or stack or root is None:
+        raise ValueError(f"Unsupported test data near: {source[position:position + 40]!r}")
+    return root
+
+def append_value(frame, key, value):
+    table = frame[0]
+    if key is None:
+        frame[1] += 1
+        key = frame[1]
+    table.append((key, value))
+
+def get_shape(value):
+    if isinstance(value, float):
+        return 0
+    return [(key, get_shape(child)) for key, child in value]
+
+def get_columns(value, columns):
+    if isinstance(value, float):
+        columns.append(value)
+    else:
+        for _, child in value:
+            get_columns(child, columns)
+    return columns
+
+def to_lua(value):
+    if isinstance(value, str):
+        return '"' + value + '"'
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "{" + ", ".join(to_lua(item) for item in value) + "}"
+
+def escape_bytes(data):
+    # the packed values are stored in a quoted lua string, only the quote,
+    # the backslash and the bytes the lexer would reinterpret are escaped
+    escaped = bytearray()
+    for byte in data:
+        if byte == 0x5C:
+            escaped += b"\\\\"
+        elif byte == 0x22:
+            escaped += b'\\"'
+        elif byte in (0x00, 0x0A, 0x0D):
+            escaped += b"\\%03d" % byte
+        else:
+            escaped.append(byte)
+    return bytes(escaped)
+
+def get_index_width(count):
+    width = 1
+    while len(SYMBOLS) ** width < count:
+        width += 1
+    return width
+
+def encode_index(index, width):
+    symbols = bytearray(width)
+    for position in range(width - 1, -1, -1):
+        index, digit = divmod(index, len(SYMBOLS))
+        symbols[position] = SYMBOLS[digit]
+    return bytes(symbols)
+
+def get_source_digest(source_path):
+    with open(source_path, "rb") as source_file:
+        return hashlib.sha256(source_file.read()).hexdigest()
+
+def write_source_digest(target_path, source_path=TEST_DATA_PATH):
+    # tests/test.lua checks the packed copy against this, lua cannot hash
+    # the source itself
+    with open(target_path, "w") as target_file:
+        target_file.write(f'return {{digest = "{get_source_digest(source_path)}"}}\n')
+
+def get_header(digest):
+    return f"-- Generated by tests/ConvertTestData.py version {PACKED_VERSION} from {digest}, do not edit.\n"
+
+def is_converted(source_path, target_path):
+    if not os.path.exists(target_path):
+        return False
+    with open(target_path, "rb") as target_file:
+        header = target_file.readline().decode("utf-8", "replace")
+    return header == get_header(get_source_digest(source_path))
+
+def ConvertTestData(source_path=TEST_DATA_PATH, target_path=PACKED_TEST_DATA_PATH):
+    # every collection is an array of cases sharing one shape, so each number
+    # field of the shape is stored as one column. The data holds few distinct
+    # numbers (0, 1, pi / 2...), so the columns index into a single array of
+    # little-endian doubles rather than repeating them.
+    with open(source_path, "r") as source_file:
+        test_data = parse_table_literal(source_file.read())
+
+    collections = []
+    columns = []
+    for name, cases in test_data:
+        shape = get_shape(cases[0][1])
+        rows = []
+        for index, case in cases:
+            if get_shape(case) != shape:
+                raise ValueError(f"Case {index} of {name} does not match the shape of the first case.")
+            rows.append(get_columns(case, []))
+
+        column_count = len(rows[0])
+        for column in range(column_count):
+            columns.extend(row[column] for row in rows)
+        collections.append(
+            f"        {{name = {to_lua(name)}, count = {len(rows)}, columns = {column_count}, "
+            f"shape = {to_lua(shape)}}},\n"
+        )
+
+    # keyed by their bytes, so that -0.0 keeps its own entry
+    value_indices = {}
+    column_values = [struct.pack("<d", value) for value in columns]
+    for value in column_values:
+        value_indices.setdefault(value, len(value_indices))
+    values = b"".join(value_indices)
+    width = get_index_width(len(value_indices))
+    data = b"".join(encode_index(value_indices[value], width) for value in column_values)
+
+    digest = get_source_digest(source_path)
+    with open(target_path, "wb") as target_file:
+        target_file.write(get_header(digest).encode())
+        target_file.write(b"return {\n")
+        target_file.write(f"    version = {PACKED_VERSION},\n".encode())
+        target_file.write(f'    source = "{digest}",\n'.encode())
+        target_file.write(b"    collections = {\n")
+        target_file.write("".join(collections).encode())
+        target_file.write(b"    },\n")
+        target_file.write(b'    symbols = "' + SYMBOLS + b'",\n')
+        target_file.write(f"    width = {width},\n".encode())
+        target_file.write(b'    values = "' + escape_bytes(values) + b'",\n')
+        target_file.write(b'    data = "' + data + b'",\n')
+        target_file.write(b"}\n")
+
+    print(
+        f'Converted: {source_path} -> {target_path} '
+        f'({len(columns)} numbers, {len(value_indices)} distinct)'
+    )
+
+if __name__ == "__main__":
+    ConvertTestData()
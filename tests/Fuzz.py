@@ -0,0 +1,368 @@
+import re
+import subprocess
+import time
+
+import numpy as np
+
+from tests.reference import Quaternion
+
+WORKER_SCRIPT = "tests/FuzzWorker.lua"
+# same tolerance as tests/QuaternionTest.lua, relative for results above one
+EPSILON = 5e-4
+BATCH_SIZE = 2000
+SHRINK_ROUNDS = 100
+# the most decimals a shrunk component is rounded to
+SHRINK_DECIMALS = 16
+REPORTED_FAILURES = 3
+
+sep = "-" * 50
+sep_n = sep + "\n"
+
+# bytes escaped in the quoted batch data, a raw control byte could end the
+# line early or be translated by a text mode stdin
+ESCAPED_BYTES = re.compile(rb'[\x00-\x1f\x7f"\\]')
+
+def lua_string(data):
+    return b'"' + ESCAPED_BYTES.sub(lambda match: b"\\%03d" % match[0][0], data) + b'"'
+
+class LuauWorker:
+    # one luau process with tests/FuzzWorker.lua loaded, batches are written
+    # to its REPL and it replies with one line per batch
+    def __init__(self, luau):
+        self.process = subprocess.Popen(
+            [luau, "-i", WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self.buffer = b""
+        if self.read_reply() != b"ready":
+            raise RuntimeError("The fuzz worker failed to start.")
+
+    def read_reply(self):
+        # replies are followed by blank lines that only flush the output
+        while True:
+            self.buffer = self.buffer.lstrip(b"\n")
+            reply, newline, rest = self.buffer.partition(b"\n")
+            if newline:
+                self.buffer = rest
+                return reply
+            chunk = self.process.stdout.read1(1 << 16)
+            if not chunk:
+                raise RuntimeError("The fuzz worker exited: " + self.buffer.decode("utf-8", "replace"))
+            self.buffer += chunk
+
+    def run(self, name, inputs, width):
+        # returns width results per case, NaN rows for cases that raised
+        data = np.ascontiguousarray(inputs, dtype="<f8").tobytes()
+        self.process.stdin.write(b'batch("%s", %d, ' % (name.encode(), inputs.shape[1]) + lua_string(data) + b")\n")
+        self.process.stdin.flush()
+        return parse_reply(self.read_reply(), len(inputs), width)
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+def parse_reply(reply, count, width):
+    cases = reply.decode().split(" ")
+    if len(cases) != count:
+        raise RuntimeError(f"Expected {count} results from the fuzz worker, got {len(cases)}.")
+    errors = np.array([case == "!" for case in cases])
+    results = np.full((count, width), np.nan)
+    for i, case in enumerate(cases):
+        if case != "!":
+            results[i] = [float(value) for value in case.split(",")]
+    return results, errors
+
+# Input generators, each draws count rows from a mix of kinds of input chosen
+# per row
+
+def choose(rng, candidates):
+    candidates = np.stack(candidates)
+    kinds = rng.integers(0, len(candidates), candidates.shape[1])
+    return candidates[kinds, np.arange(candidates.shape[1])]
+
+def magnitudes(rng, count, low, high):
+    return 10.0 ** rng.uniform(low, high, (count, 1))
+
+def with_special_values(rng, values):
+    # one component of the row becomes NaN, infinite or zero
+    values = values.copy()
+    rows = np.arange(len(values))
+    columns = rng.integers(0, values.shape[1], len(values))
+    values[rows, columns] = rng.choice([np.nan, np.inf, -np.inf, 0.0], len(values))
+    return values
+
+def random_quaternions(rng, count):
+    unit = Quaternion.RandomQuaternion(count, rng)
+    near_identity = Quaternion.IDENTITY + rng.normal(size=(count, 4)) * magnitudes(rng, count, -12, -3)
+    rx, rz = rng.uniform(-np.pi, np.pi, (2, count))
+    ry = rng.choice([-np.pi / 2, np.pi / 2], count) + rng.normal(size=count) * magnitudes(rng, count, -12, -3)[:, 0]
+    polar = Quaternion.fromEulerAngles(rx, ry, rz, rng.choice(Quaternion.ROTATION_ORDERS))
+    return choose(rng, [
+        unit,
+        near_identity,
+        -near_identity,
+        polar,
+        unit * magnitudes(rng, count, -6, 6),
+        np.zeros((count, 4)),
+        with_special_values(rng, unit),
+    ])
+
+def random_vectors(rng, count):
+    direction = rng.normal(size=(count, 3))
+    axes = np.concatenate([np.eye(3), -np.eye(3)])[rng.integers(0, 6, count)]
+    return choose(rng, [
+        direction * magnitudes(rng, count, -3, 3),
+        axes,
+        axes + rng.normal(size=(count, 3)) * magnitudes(rng, count, -12, -6),
+        direction * (Quaternion.EPSILON * rng.uniform(0.5, 2, (count, 1))),
+        np.zeros((count, 3)),
+        with_special_values(rng, direction),
+    ])
+
+def random_angles(rng, count, width):
+    return choose(rng, [
+        rng.uniform(-np.pi, np.pi, (count, width)),
+        rng.uniform(-100, 100, (count, width)),
+        rng.choice([0, np.pi / 2, -np.pi / 2, np.pi, -np.pi], (count, width)),
+        with_special_values(rng, rng.uniform(-np.pi, np.pi, (count, width))),
+    ])
+
+def random_frames(rng, count):
+    # the columns of a matrix, orthonormal or scaled, collinear, reflected,
+    # missing a column or pointing the right vector along the y axis
+    matrix = Quaternion.ToMatrix(Quaternion.RandomQuaternion(count, rng)).reshape(-1, 3, 3)
+    vX, vY, vZ = matrix[:, :, 0], matrix[:, :, 1], matrix[:, :, 2]
+    noise = rng.normal(size=(count, 3)) * magnitudes(rng, count, -12, -6)
+    frame = np.concatenate([vX, vY, vZ], axis=1)
+    return choose(rng, [
+        frame,
+        np.concatenate([vX * magnitudes(rng, count, -3, 3), vY * magnitudes(rng, count, -3, 3), vZ], axis=1),
+        np.concatenate([vX, vX * rng.uniform(-2, 2, (count, 1)) + noise, vZ], axis=1),
+        np.concatenate([vX, vY, -vZ], axis=1),
+        np.concatenate([np.zeros((count, 3)), vY, vZ], axis=1),
+        np.concatenate([vX, np.zeros((count, 3)), vZ], axis=1),
+        np.concatenate([np.broadcast_to(Quaternion.Y_AXIS, (count, 3)) + noise, vY, vZ], axis=1),
+        with_special_values(rng, frame),
+    ])
+
+def random_look_at(rng, count):
+    # from, at and up, with the look direction parallel to up, to the x
+    # axis or of zero length
+    origin = rng.normal(size=(count, 3)) * 10
+    up = choose(rng, [
+        np.broadcast_to(Quaternion.Y_AXIS, (count, 3)),
+        random_vectors(rng, count),
+    ])
+    direction = choose(rng, [
+        random_vectors(rng, count),
+        up * rng.uniform(-10, 10, (count, 1)),
+        np.broadcast_to(Quaternion.X_AXIS, (count, 3)) * rng.choice([-1, 1], (count, 1)),
+        np.zeros((count, 3)),
+    ])
+    return np.concatenate([origin, origin + direction, up], axis=1)
+
+def random_slerps(rng, count):
+    q0 = random_quaternions(rng, count)
+    noise = rng.normal(size=(count, 4)) * magnitudes(rng, count, -12, -3)
+    q1 = choose(rng, [
+        random_quaternions(rng, count),
+        -q0 + noise,
+        q0 + noise,
+        q0 * magnitudes(rng, count, -3, 3),
+    ])
+    alpha = choose(rng, [
+        rng.uniform(-1, 2, (count, 1)),
+        rng.choice([0.0, 0.5, 1.0], (count, 1)),
+    ])
+    return np.concatenate([q0, q1, alpha], axis=1)
+
+def random_powers(rng, count):
+    number = choose(rng, [
+        rng.uniform(-3, 3, (count, 1)),
+        rng.choice([-1.0, 0.0, 0.5, 1.0, 2.0], (count, 1)),
+    ])
+    return np.concatenate([random_quaternions(rng, count), number], axis=1)
+
+# Comparisons, a result matches if it is within EPSILON of the reference or
+# if both are NaN
+
+def approx_equal(result, expected):
+    tolerance = EPSILON * np.maximum(1, np.abs(expected))
+    with np.errstate(invalid="ignore"):
+        close = (np.abs(result - expected) <= tolerance) | (result == expected)
+    return np.all(close | (np.isnan(result) & np.isnan(expected)), axis=-1)
+
+def quaternions_equal(result, expected):
+    # q and -q are the same rotation, like Assert.QuaternionsEqualApprox
+    return approx_equal(result, expected) | approx_equal(-result, expected)
+
+def angles_equal(rotationOrder):
+    # angles near a pole can take either branch and still be the same
+    # rotation, so they are compared by the rotation they describe
+    def compare(result, expected):
+        return approx_equal(result, expected) | quaternions_equal(
+            Quaternion.fromEulerAngles(*result.T, rotationOrder),
+            Quaternion.fromEulerAngles(*expected.T, rotationOrder),
+        )
+    return compare
+
+def axis_angles_equal(result, expected):
+    return approx_equal(result, expected) | quaternions_equal(
+        Quaternion.fromAxisAngle(result[:, :3], result[:, 3]),
+        Quaternion.fromAxisAngle(expected[:, :3], expected[:, 3]),
+    )
+
+def euler_operations():
+    operations = {}
+    for rotationOrder in Quaternion.ROTATION_ORDERS:
+        operations["fromEulerAngles" + rotationOrder] = (
+            lambda rng, count: random_angles(rng, count, 3),
+            lambda inputs, rotationOrder=rotationOrder: Quaternion.fromEulerAngles(*inputs.T, rotationOrder),
+            quaternions_equal,
+        )
+        operations["ToEulerAngles" + rotationOrder] = (
+            random_quaternions,
+            lambda inputs, rotationOrder=rotationOrder: Quaternion.ToEulerAngles(inputs, rotationOrder),
+            angles_equal(rotationOrder),
+        )
+    return operations
+
+def to_axis_angle(inputs):
+    axis, angle = Quaternion.ToAxisAngle(inputs)
+    return np.concatenate([axis, angle[:, None]], axis=1)
+
+# name: (generate(rng, count), reference(inputs), compare(result, expected))
+OPERATIONS = {
+    "fromAxisAngle": (
+        lambda rng, count: np.concatenate([random_vectors(rng, count), random_angles(rng, count, 1)], axis=1),
+        lambda inputs: Quaternion.fromAxisAngle(inputs[:, :3], inputs[:, 3]),
+        quaternions_equal,
+    ),
+    "fromMatrix": (
+        random_frames,
+        lambda inputs: Quaternion.fromMatrix(inputs[:, 0:3], inputs[:, 3:6], inputs[:, 6:9]),
+        quaternions_equal,
+    ),
+    "lookAt": (
+        random_look_at,
+        lambda inputs: Quaternion.lookAt(inputs[:, 0:3], inputs[:, 3:6], inputs[:, 6:9]),
+        quaternions_equal,
+    ),
+    **euler_operations(),
+    "ToAxisAngle": (random_quaternions, to_axis_angle, axis_angles_equal),
+    "Slerp": (
+        random_slerps,
+        lambda inputs: Quaternion.Slerp(inputs[:, 0:4], inputs[:, 4:8], inputs[:, 8]),
+        quaternions_equal,
+    ),
+    "Log": (random_quaternions, Quaternion.Log, quaternions_equal),
+    "Exp": (random_quaternions, Quaternion.Exp, quaternions_equal),
+    "Pow": (
+        random_powers,
+        lambda inputs: Quaternion.Pow(inputs[:, 0:4], inputs[:, 4]),
+        quaternions_equal,
+    ),
+}
+
+def check(worker, name, inputs):
+    # returns a mask of the failing cases with the luau and reference results
+    _, reference, compare = OPERATIONS[name]
+    with np.errstate(all="ignore"):
+        expected = reference(inputs)
+    results, errors = worker.run(name, inputs, expected.shape[1])
+    with np.errstate(all="ignore"):
+        failed = errors | ~compare(results, expected)
+    return failed, results, expected
+
+def simplicity(value):
+    # lower is simpler: zero, then one, then fewer and fewer decimals, then
+    # any other value
+    if value == 0:
+        return 0
+    if abs(value) == 1:
+        return 1
+    if np.isfinite(value):
+        for decimals in range(SHRINK_DECIMALS):
+            if np.round(value, decimals) == value:
+                return 2 + decimals
+    return 2 + SHRINK_DECIMALS
+
+def shrink_candidates(case):
+    # strictly simpler versions of the case, simplest first: components
+    # replaced by small integers, then rounded to fewer and fewer decimals
+    candidates = []
+    replacements = [np.full(len(case), value) for value in (0.0, 1.0, -1.0)]
+    with np.errstate(invalid="ignore"):
+        replacements += [np.round(case, decimals) for decimals in range(SHRINK_DECIMALS)]
+    proposed = [set() for _ in case]
+    for values in replacements:
+        for i, value in enumerate(values):
+            if value in proposed[i] or simplicity(value) >= simplicity(case[i]):
+                continue
+            proposed[i].add(value)
+            candidate = case.copy()
+            candidate[i] = value
+            candidates.append(candidate)
+    return candidates
+
+def shrink(worker, name, case):
+    # every candidate of a round is checked in one batch, the first one that
+    # still fails becomes the case for the next round. Each round makes the
+    # case simpler, so it ends once no simpler case fails
+    for _ in range(SHRINK_ROUNDS):
+        candidates = shrink_candidates(case)
+        if not candidates:
+            break
+        failed, _, _ = check(worker, name, np.array(candidates))
+        if not failed.any():
+            break
+        case = candidates[int(np.argmax(failed))]
+    return case
+
+def format_values(values):
+    return "(" + ", ".join(repr(float(value)) for value in values) + ")"
+
+def report_failure(worker, name, case):
+    shrunk = shrink(worker, name, case)
+    _, results, expected = check(worker, name, shrunk[None, :])
+    print(f"{name} failed")
+    print(f"    input:     {format_values(case)}")
+    print(f"    shrunk:    {format_values(shrunk)}")
+    print(f"    luau:      {format_values(results[0])}")
+    print(f"    reference: {format_values(expected[0])}")
+
+def Fuzz(luau, seconds, seed=None):
+    # returns the number of failing cases
+    rng = np.random.default_rng(seed)
+    names = list(OPERATIONS)
+    checks = {name: 0 for name in names}
+    failures = {name: 0 for name in names}
+    reported = {name: 0 for name in names}
+
+    worker = LuauWorker(luau)
+    try:
+        start = time.perf_counter()
+        batch = 0
+        while time.perf_counter() - start < seconds:
+            name = names[batch % len(names)]
+            batch += 1
+            generate, _, _ = OPERATIONS[name]
+            inputs = generate(rng, BATCH_SIZE)
+            failed, _, _ = check(worker, name, inputs)
+            checks[name] += len(inputs)
+            failures[name] += int(failed.sum())
+            for case in inputs[failed][:REPORTED_FAILURES - reported[name]]:
+                reported[name] += 1
+                report_failure(worker, name, case)
+        elapsed = time.perf_counter() - start
+    finally:
+        worker.close()
+
+    total_checks = sum(checks.values())
+    total_failures = sum(failures.values())
+    print(sep)
+    for name in names:
+        print(f"{name:>20} {checks[name]:>9} checks {failures[name]:>7} failed")
+    print(f"{total_checks} checks in {elapsed:.1f}s ({total_checks / elapsed * 60:.0f} per minute), {total_failures} failed")
+    return total_failures
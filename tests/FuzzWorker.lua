@@ -0,0 +1,94 @@
+-- Persistent worker for tests/Fuzz.py. It is run with `luau -i`, so after
+-- this file has loaded the REPL reads one batch call per line from stdin and
+-- the process stays alive for the whole fuzzing run.
+
+local Quaternion = require("test_build/Quaternion")
+local Vector3 = require("mocks/Vector3")
+
+-- luau block buffers stdout when it is a pipe, a run of blank lines after
+-- every reply fills the buffer so that the reply is flushed
+local FLUSH = string.rep("\n", 65536)
+
+local ROTATION_ORDERS = {"XYZ", "XZY", "YZX", "YXZ", "ZXY", "ZYX"}
+
+local function quaternion(values, i)
+    return Quaternion.new(values[i], values[i + 1], values[i + 2], values[i + 3])
+end
+
+local function vector(values, i)
+    return Vector3.new(values[i], values[i + 1], values[i + 2])
+end
+
+local function components(q0)
+    return q0.X, q0.Y, q0.Z, q0.W
+end
+
+local OPERATIONS = {
+    fromAxisAngle = function(values)
+        return components(Quaternion.fromAxisAngle(vector(values, 1), values[4]))
+    end,
+    fromMatrix = function(values)
+        return components(Quaternion.fromMatrix(vector(values, 1), vector(values, 4), vector(values, 7)))
+    end,
+    lookAt = function(values)
+        return components(Quaternion.lookAt(vector(values, 1), vector(values, 4), vector(values, 7)))
+    end,
+    ToAxisAngle = function(values)
+        local axis, angle = Quaternion.ToAxisAngle(quaternion(values, 1))
+        return axis.X, axis.Y, axis.Z, angle
+    end,
+    Slerp = function(values)
+        return components(Quaternion.Slerp(quaternion(values, 1), quaternion(values, 5), values[9]))
+    end,
+    Log = function(values)
+        return components(Quaternion.Log(quaternion(values, 1)))
+    end,
+    Exp = function(values)
+        return components(Quaternion.Exp(quaternion(values, 1)))
+    end,
+    Pow = function(values)
+        return components(Quaternion.Pow(quaternion(values, 1), values[5]))
+    end,
+}
+
+for _, order in ipairs(ROTATION_ORDERS) do
+    local rotationOrder = {Name = order}
+    OPERATIONS["fromEulerAngles" .. order] = function(values)
+        return components(Quaternion.fromEulerAngles(values[1], values[2], values[3], rotationOrder))
+    end
+    OPERATIONS["ToEulerAngles" .. order] = function(values)
+        return Quaternion.ToEulerAngles(quaternion(values, 1), rotationOrder)
+    end
+end
+
+local function formatResults(ok, ...)
+    if not ok then
+        return "!"
+    end
+    local results = table.pack(...)
+    for i = 1, results.n do
+        results[i] = string.format("%.17g", results[i])
+    end
+    return table.concat(results, ",", 1, results.n)
+end
+
+-- data holds the inputs of every case as little-endian doubles, width per
+-- case. Prints one line with the results of each case separated by spaces,
+-- or "!" for a case that raised an error.
+function batch(name, width, data)
+    local operation = OPERATIONS[name]
+    local values = table.create(width)
+    local position = 1
+    local replies = {}
+    for case = 1, #data / (8 * width) do
+        for i = 1, width do
+            values[i], position = string.unpack("<d", data, position)
+        end
+        replies[case] = formatResults(pcall(operation, values))
+    end
+    print(table.concat(replies, " "))
+    print(FLUSH)
+end
+
+print("ready")
+print(FLUSH)
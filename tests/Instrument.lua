@@ -0,0 +1,41 @@
+-- Call counts and times of the library functions, for test.py --instrument.
+-- PrepareTest wraps every top level function of the modules it copies to
+-- test_build with Instrument.wrap, and Report prints what was collected as
+-- one line of JSON, as luau has no way to write a file.
+
+local Instrument = {}
+
+local stats = {}
+local names = {}
+
+local function finish(stat, start, ...)
+    stat.seconds += os.clock() - start
+    return ...
+end
+
+function Instrument.wrap(name, func)
+    local stat = stats[name]
+    if not stat then
+        stat = {calls = 0, seconds = 0}
+        stats[name] = stat
+        table.insert(names, name)
+    end
+    return function(...)
+        stat.calls += 1
+        local start = os.clock()
+        return finish(stat, start, func(...))
+    end
+end
+
+-- the times include the functions called from inside, and a call that
+-- throws is counted without its time
+function Instrument.Report()
+    local entries = table.create(#names)
+    for i, name in names do
+        local stat = stats[name]
+        entries[i] = string.format('"%s":{"calls":%d,"seconds":%.17g}', name, stat.calls, stat.seconds)
+    end
+    print("@@instrument\t{" .. table.concat(entries, ",") .. "}")
+end
+
+return Instrument
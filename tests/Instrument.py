@@ -0,0 +1,63 @@
+import json
+import os
+import subprocess
+
+from tests.Profile import PROFILE_FOLDER, TOP_FUNCTIONS
+
+# tests/Instrument.lua prints the collected stats as one line starting with
+# this marker, when the script it is appended to finishes
+REPORT_MARKER = "@@instrument\t"
+REPORT_NAME = "instrument.json"
+
+sep = "-" * 50
+sep_n = sep + "\n"
+
+def write_driver(temp_test_folder, script):
+    # a copy of the script that prints the report once it has run
+    with open(script, "r") as script_file:
+        source = script_file.read()
+    driver_path = os.path.join(temp_test_folder, "instrument.lua")
+    with open(driver_path, "w") as driver:
+        driver.write(source)
+        driver.write('\nrequire("tests/Instrument").Report()\n')
+    return driver_path
+
+def run_instrumented(luau, driver_path):
+    # echoes the output of the script and returns the report
+    process = subprocess.run([luau, driver_path], capture_output=True, text=True, encoding="utf-8")
+    report = None
+    for line in process.stdout.splitlines():
+        if line.startswith(REPORT_MARKER):
+            report = json.loads(line[len(REPORT_MARKER):])
+        else:
+            print(line)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, [luau, driver_path])
+    return report
+
+def print_top(report, key, count):
+    ranked = sorted(report.items(), key=lambda item: -item[1][key])[:count]
+    print(f"{'calls':>10} {'seconds':>10} {'us/call':>10}  function")
+    for name, stat in ranked:
+        per_call = stat["seconds"] / stat["calls"] * 1e6 if stat["calls"] else 0
+        print(f"{stat['calls']:>10} {stat['seconds']:>10.4f} {per_call:>10.2f}  {name}")
+
+def Instrument(luau, script, temp_test_folder, count=TOP_FUNCTIONS):
+    # runs the script against modules prepared with PrepareTest(instrumented=True)
+    # and writes the call counts and times to profiles/instrument.json
+    report = run_instrumented(luau, write_driver(temp_test_folder, script))
+    if report is None:
+        print(f"{sep_n}The script finished without a report, nothing was instrumented.")
+        return
+
+    os.makedirs(PROFILE_FOLDER, exist_ok=True)
+    report_path = os.path.join(PROFILE_FOLDER, REPORT_NAME)
+    with open(report_path, "w") as report_file:
+        json.dump(report, report_file, indent=1)
+
+    called = {name: stat for name, stat in report.items() if stat["calls"]}
+    print(f"{sep_n}Functions with the most total time, including the functions they call:")
+    print_top(called, "seconds", count)
+    print(f"{sep_n}Most called functions:")
+    print_top(called, "calls", count)
+    print(f"{sep_n}{len(called)} of {len(report)} functions were called. Wrote {report_path}")
@@ -1,4 +1,6 @@
 import os
+import re
+from tests.ConvertTestData import write_source_digest
 
 constant_string = '''
 local Vector3 = require("mocks/Vector3")
@@ -14,11 +16,65 @@ Enum.RotationOrder = {
 }
 '''
 
+# modules require their siblings through script.Parent, which is mocked to
+# resolve to the same file in the temp test folder
+script_string = '''local script = {{Parent = setmetatable({{}}, {{
+    __index = function(_, name) return "{folder}/" .. name end
+}})}}
+'''
+
+instrument_string = '''local __instrument = require("tests/Instrument").wrap
+'''
+
+# top level function definitions, the body of each ends at the next line
+# that is only "end", unless the whole function is on one line
+local_function_pattern = re.compile(r"^local function (\w+)")
+function_pattern = re.compile(r"^function ([\w.]+)")
+
+
+def instrument(module_name, file_contents):
+    # reassigns every top level function to a wrapper that counts its calls
+    # and time, right after its definition, so that the functions calling
+    # it and the tables it is stored in all use the wrapper
+    lines = file_contents.split("\n")
+    instrumented = []
+    wrap_line = None
+    for line in lines:
+        instrumented.append(line)
+        if wrap_line is None:
+            local_match = local_function_pattern.match(line)
+            if local_match:
+                name = local_match[1]
+                wrap_line = f'{name} = __instrument("{module_name}.{name}", {name})'
+            else:
+                function_match = function_pattern.match(line)
+                if function_match:
+                    name = function_match[1]
+                    wrap_line = f'{name} = __instrument("{name}", {name})'
+            if wrap_line is not None and not line.rstrip().endswith(" end"):
+                continue
+        elif line.rstrip() != "end":
+            continue
+        if wrap_line is not None:
+            instrumented.append(wrap_line)
+            wrap_line = None
+    return "\n".join(instrumented)
 
-def PrepareTest(src_folder, temp_test_folder):
+
+def get_header(temp_test_folder):
+    # the lines prepended to every module, tests/Profile.py takes them off
+    # line numbers again
+    return constant_string + script_string.format(folder=temp_test_folder.replace("\\", "/").rstrip("/"))
+
+
+def PrepareTest(src_folder, temp_test_folder, instrumented=False):
     if not os.path.exists(temp_test_folder):
         os.makedirs(temp_test_folder)
     
+    header = get_header(temp_test_folder)
+    if instrumented:
+        header += instrument_string
+    
     for filename in os.listdir(src_folder):
         if filename.endswith('.lua') or filename.endswith('.luau'):
             source_file_path = os.path.join(src_folder, filename)
@@ -27,11 +83,16 @@ def PrepareTest(src_folder, temp_test_folder):
             with open(source_file_path, 'r') as source_file:
                 file_contents = source_file.read()
             
-            modified_contents = constant_string + file_contents
+            if instrumented:
+                module_name = os.path.splitext(filename)[0]
+                file_contents = instrument(module_name, file_contents)
+            
+            modified_contents = header + file_contents
             
             with open(target_file_path, 'w') as target_file:
                 target_file.write(modified_contents)
             
             print(f'Processed: {filename}')
     
+    write_source_digest(os.path.join(temp_test_folder, 'TestDataDigest.lua'))
     print('All files processed.')
\ No newline at end of file
@@ -0,0 +1,148 @@
+import json
+import os
+
+from tests.PrepareTest import get_header
+
+# luau --profile always writes its samples here, in the working directory
+PROFILE_PATH = "profile.out"
+PROFILE_FOLDER = "profiles"
+DEFAULT_FREQUENCY = 10000
+TOP_FUNCTIONS = 15
+
+sep = "-" * 50
+sep_n = sep + "\n"
+
+def profile_command(luau, script, frequency):
+    return [luau, f"--profile={frequency}", script]
+
+def read_profile(profile_path):
+    # each line is the total microseconds sampled in a stack, then the stack
+    # from the innermost frame out, as "source,function,line" frames joined
+    # by semicolons
+    samples = []
+    with open(profile_path, "r") as profile_file:
+        for line in profile_file:
+            weight, _, stack = line.rstrip("\n").partition(" ")
+            if not stack:
+                continue
+            frames = [tuple(frame.rsplit(",", 2)) for frame in stack.split(";")]
+            samples.append((int(weight), frames[::-1]))
+    return samples
+
+def source_mapper(src_folder, temp_test_folder, scripts):
+    # modules in the temp test folder are mapped back to src, with the lines
+    # of the prepended mock header taken off, and scripts generated from
+    # another file to that file
+    module_prefix = temp_test_folder.replace("\\", "/").rstrip("/") + "/"
+    header_lines = get_header(temp_test_folder).count("\n")
+
+    def find_file(module):
+        for extension in ("", ".lua", ".luau"):
+            if os.path.isfile(module + extension):
+                return module + extension
+        return module
+
+    def map_frame(frame):
+        source, function, line = frame
+        if source in scripts:
+            source = scripts[source]
+        elif source.startswith(module_prefix):
+            source = find_file(os.path.join(src_folder, source[len(module_prefix):]).replace("\\", "/"))
+            if line:
+                line = str(int(line) - header_lines)
+        elif source not in ("[C]", "GC"):
+            source = find_file(source)
+        return source, function or "(anonymous)", line
+
+    return map_frame
+
+def frame_name(frame):
+    source, function, line = frame
+    if source in ("[C]", "GC"):
+        return function
+    return f"{function} ({source}:{line})" if line else f"{function} ({source})"
+
+def collapsed_stacks(samples):
+    # the folded format read by flamegraph.pl, inferno and speedscope
+    stacks = {}
+    for weight, frames in samples:
+        stack = ";".join(frame_name(frame) for frame in frames)
+        stacks[stack] = stacks.get(stack, 0) + weight
+    return "".join(f"{stack} {weight}\n" for stack, weight in sorted(stacks.items()))
+
+def speedscope_profile(samples, name):
+    frames = []
+    frame_indices = {}
+    stacks = []
+    weights = []
+    for weight, sample_frames in samples:
+        stack = []
+        for frame in sample_frames:
+            if frame not in frame_indices:
+                frame_indices[frame] = len(frames)
+                source, function, line = frame
+                entry = {"name": frame_name(frame)}
+                if source not in ("[C]", "GC"):
+                    entry["file"] = source
+                    if line:
+                        entry["line"] = int(line)
+                frames.append(entry)
+            stack.append(frame_indices[frame])
+        stacks.append(stack)
+        weights.append(weight)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "microseconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": stacks,
+            "weights": weights,
+        }],
+        "name": name,
+        "exporter": "LuaQuaternion tests/Profile.py",
+    }
+
+def print_top_functions(samples, count=TOP_FUNCTIONS):
+    # self time is the time with the function as the innermost frame, total
+    # time counts every sample with the function anywhere on the stack
+    self_times = {}
+    total_times = {}
+    for weight, frames in samples:
+        self_times[frames[-1]] = self_times.get(frames[-1], 0) + weight
+        for frame in set(frames):
+            total_times[frame] = total_times.get(frame, 0) + weight
+
+    profiled = sum(weight for weight, _ in samples) or 1
+    print(f"{'self':>8} {'total':>8}  function")
+    for frame, self_time in sorted(self_times.items(), key=lambda item: -item[1])[:count]:
+        print(f"{self_time / profiled:>8.1%} {total_times[frame] / profiled:>8.1%}  {frame_name(frame)}")
+
+def Profile(name, src_folder, temp_test_folder, scripts=None):
+    # converts the profile.out of a finished luau --profile run into
+    # profiles/<name>.collapsed.txt and profiles/<name>.speedscope.json
+    if not os.path.exists(PROFILE_PATH):
+        print(f"{sep_n}luau did not write {PROFILE_PATH}, nothing to convert.")
+        return
+
+    map_frame = source_mapper(src_folder, temp_test_folder, scripts or {})
+    samples = [
+        (weight, [map_frame(frame) for frame in frames])
+        for weight, frames in read_profile(PROFILE_PATH)
+    ]
+    os.remove(PROFILE_PATH)
+
+    os.makedirs(PROFILE_FOLDER, exist_ok=True)
+    collapsed_path = os.path.join(PROFILE_FOLDER, f"{name}.collapsed.txt")
+    with open(collapsed_path, "w") as collapsed_file:
+        collapsed_file.write(collapsed_stacks(samples))
+    speedscope_path = os.path.join(PROFILE_FOLDER, f"{name}.speedscope.json")
+    with open(speedscope_path, "w") as speedscope_file:
+        json.dump(speedscope_profile(samples, name), speedscope_file)
+
+    print(f"{sep_n}Hottest functions of the profile:")
+    print_top_functions(samples)
+    print(f"{sep_n}Wrote {collapsed_path} and {speedscope_path}")
@@ -1,6 +1,12 @@
 local Assert = require("tests/Assert")
 local Vector3 = require("mocks/Vector3")
 local CFrame = require("mocks/CFrame")
+local QuaternionBuffer = require("test_build/QuaternionBuffer")
+local QuaternionBuilder = require("test_build/QuaternionBuilder")
+local QuaternionSpring = require("test_build/QuaternionSpring")
+local RadianSpring = require("test_build/RadianSpring")
+local Spring = require("test_build/Spring")
+local SpringGroup = require("test_build/SpringGroup")
 
 local Enum = {}
 Enum.RotationOrder = {
@@ -19,7 +25,10 @@ QuaternionTest._order = {
     "ConstructorGroup",
     "DeconstructorGroup",
     "MathGroup",
-    "MethodsGroup"
+    "MethodsGroup",
+    "BuilderGroup",
+    "BufferGroup",
+    "SpringsGroup"
 }
 
 local rotationOrders = {"XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX"}
@@ -3510,4 +3519,772 @@ IsNaN.NotNaN = {
 
 
 
+local BuilderGroup = {}
+QuaternionTest.BuilderGroup = BuilderGroup
+BuilderGroup._order = {
+    "BuilderConstructors", "BuilderMath", "BuilderNormalize", "BuilderSlerp",
+    "BuilderDeconstructors"
+}
+BuilderGroup._DisplayName = "Builder Tests"
+
+-- the builder methods use the same arithmetic as the Quaternion methods, so
+-- their results are compared exactly
+local function builderInputs()
+    return Quaternion.new(0.3, -0.5, 0.2, 0.7), Quaternion.new(-0.1, 0.4, 0.8, 0.3)
+end
+
+local BuilderConstructors = {}
+BuilderGroup.BuilderConstructors = BuilderConstructors
+BuilderConstructors._order = {
+    "Default", "Components", "fromQuaternion"
+}
+
+BuilderConstructors.Default = {
+    DisplayName = "new (identity)",
+    test = function()
+        local builder = QuaternionBuilder.new()
+
+        return Assert.KeyValues(builder, Quaternion.identity)
+    end
+}
+
+BuilderConstructors.Components = {
+    DisplayName = "new (components)",
+    test = function()
+        local builder = QuaternionBuilder.new(2, 3, 4, 5)
+
+        return Assert.KeyValues(builder, Quaternion.new(2, 3, 4, 5))
+    end
+}
+
+BuilderConstructors.fromQuaternion = {
+    DisplayName = "fromQuaternion",
+    test = function()
+        local q0 = Quaternion.new(2, 3, 4, 5)
+        local builder = QuaternionBuilder.fromQuaternion(q0)
+
+        return Assert.KeyValues(builder, q0)
+    end
+}
+
+
+
+local BuilderMath = {}
+BuilderGroup.BuilderMath = BuilderMath
+BuilderMath._order = {
+    "Set", "Copy", "AddInto", "SubInto", "MulInto", "MulIntoAliased",
+    "ScaleInto", "NegateInto", "ConjugateInto", "InverseInto", "Chained"
+}
+
+BuilderMath.Set = {
+    DisplayName = "Set",
+    test = function()
+        local builder = QuaternionBuilder.new()
+        local result = builder:Set(2, 3, 4, 5)
+
+        return result == builder
+            and Assert.KeyValues(builder, Quaternion.new(2, 3, 4, 5))
+    end
+}
+
+BuilderMath.Copy = {
+    DisplayName = "Copy",
+    test = function()
+        local q0 = builderInputs()
+        local builder = QuaternionBuilder.new():Copy(q0)
+
+        return Assert.KeyValues(builder, q0)
+    end
+}
+
+BuilderMath.AddInto = {
+    DisplayName = "AddInto",
+    test = function()
+        local q0, q1 = builderInputs()
+        local builder = QuaternionBuilder.new():AddInto(q0, q1)
+
+        return Assert.KeyValues(builder, q0 + q1)
+    end
+}
+
+BuilderMath.SubInto = {
+    DisplayName = "SubInto",
+    test = function()
+        local q0, q1 = builderInputs()
+        local builder = QuaternionBuilder.new():SubInto(q0, q1)
+
+        return Assert.KeyValues(builder, q0 - q1)
+    end
+}
+
+BuilderMath.MulInto = {
+    DisplayName = "MulInto",
+    test = function()
+        local q0, q1 = builderInputs()
+        local builder = QuaternionBuilder.new():MulInto(q0, q1)
+
+        return Assert.KeyValues(builder, q0 * q1)
+    end
+}
+
+BuilderMath.MulIntoAliased = {
+    DisplayName = "MulInto (builder as both inputs)",
+    test = function()
+        local q0 = builderInputs()
+        local builder = QuaternionBuilder.fromQuaternion(q0)
+        builder:MulInto(builder, builder)
+
+        return Assert.KeyValues(builder, q0 * q0)
+    end
+}
+
+BuilderMath.ScaleInto = {
+    DisplayName = "ScaleInto",
+    test = function()
+        local q0 = builderInputs()
+        local builder = QuaternionBuilder.new():ScaleInto(q0, 2.5)
+
+        return Assert.KeyValues(builder, q0:Scale(2.5))
+    end
+}
+
+BuilderMath.NegateInto = {
+    DisplayName = "NegateInto",
+    test = function()
+        local q0 = builderInputs()
+        local builder = QuaternionBuilder.new():NegateInto(q0)
+
+        return Assert.KeyValues(builder, -q0)
+    end
+}
+
+BuilderMath.ConjugateInto = {
+    DisplayName = "ConjugateInto",
+    test = function()
+        local q0 = builderInputs()
+        local builder = QuaternionBuilder.new():ConjugateInto(q0)
+
+        return Assert.KeyValues(builder, q0:Conjugate())
+    end
+}
+
+BuilderMath.InverseInto = {
+    DisplayName = "InverseInto",
+    test = function()
+        local q0 = builderInputs()
+        local builder = QuaternionBuilder.new():InverseInto(q0)
+
+        return Assert.KeyValues(builder, q0:Inverse())
+    end
+}
+
+BuilderMath.Chained = {
+    DisplayName = "Chained",
+    test = function()
+        local q0, q1 = builderInputs()
+        local builder = QuaternionBuilder.new()
+        builder:MulInto(q0, q1):NormalizeInto(builder):MulInto(builder, q0)
+
+        return Assert.KeyValues(builder, (q0 * q1):Normalize() * q0)
+    end
+}
+
+
+
+local BuilderNormalize = {}
+BuilderGroup.BuilderNormalize = BuilderNormalize
+BuilderNormalize._order = {
+    "NonUnit", "Aliased", "Zero"
+}
+
+BuilderNormalize.NonUnit = {
+    DisplayName = "NormalizeInto (non unit)",
+    test = function()
+        local q0 = Quaternion.new(2, -5, 7, 3)
+        local builder = QuaternionBuilder.new():NormalizeInto(q0)
+
+        return Assert.KeyValues(builder, q0:Normalize())
+    end
+}
+
+BuilderNormalize.Aliased = {
+    DisplayName = "NormalizeInto (builder as input)",
+    test = function()
+        local q0 = Quaternion.new(2, -5, 7, 3)
+        local builder = QuaternionBuilder.fromQuaternion(q0)
+        builder:NormalizeInto(builder)
+
+        return Assert.KeyValues(builder, q0:Normalize())
+    end
+}
+
+BuilderNormalize.Zero = {
+    DisplayName = "NormalizeInto (zero)",
+    test = function()
+        local builder = QuaternionBuilder.new():NormalizeInto(Quaternion.zero)
+
+        return Assert.KeyValues(builder, Quaternion.zero:Normalize())
+            and Assert.KeyValues(builder, Quaternion.identity)
+    end
+}
+
+
+
+local BuilderSlerp = {}
+BuilderGroup.BuilderSlerp = BuilderSlerp
+BuilderSlerp._order = {
+    "Alphas", "Opposite", "Same", "NonUnit", "Aliased"
+}
+
+local function slerpMatches(q0, q1, alpha)
+    local builder = QuaternionBuilder.new():SlerpInto(q0, q1, alpha)
+    return Assert.KeyValues(builder, q0:Slerp(q1, alpha))
+end
+
+BuilderSlerp.Alphas = {
+    DisplayName = "SlerpInto (alphas)",
+    test = function()
+        local q0, q1 = builderInputs()
+        q0, q1 = q0:Normalize(), q1:Normalize()
+
+        return slerpMatches(q0, q1, 0)
+            and slerpMatches(q0, q1, 0.3)
+            and slerpMatches(q0, q1, 1)
+            and slerpMatches(q0, q1, 1.5)
+            and slerpMatches(q0, q1, -0.5)
+    end
+}
+
+BuilderSlerp.Opposite = {
+    DisplayName = "SlerpInto (opposite hemisphere)",
+    test = function()
+        local q0, q1 = builderInputs()
+        q0, q1 = q0:Normalize(), -q1:Normalize()
+
+        return slerpMatches(q0, q1, 0.3)
+    end
+}
+
+BuilderSlerp.Same = {
+    DisplayName = "SlerpInto (same quaternion)",
+    test = function()
+        local q0 = builderInputs()
+        q0 = q0:Normalize()
+
+        return slerpMatches(q0, q0, 0.3)
+    end
+}
+
+BuilderSlerp.NonUnit = {
+    DisplayName = "SlerpInto (non unit and zero)",
+    test = function()
+        local q0, q1 = builderInputs()
+
+        return slerpMatches(q0:Scale(3), q1, 0.3)
+            and slerpMatches(Quaternion.zero, q1, 0.3)
+    end
+}
+
+BuilderSlerp.Aliased = {
+    DisplayName = "SlerpInto (builder as input)",
+    test = function()
+        local q0, q1 = builderInputs()
+        q0, q1 = q0:Normalize(), q1:Normalize()
+        local builder = QuaternionBuilder.fromQuaternion(q0)
+        builder:SlerpInto(builder, q1, 0.3)
+
+        return Assert.KeyValues(builder, q0:Slerp(q1, 0.3))
+    end
+}
+
+
+
+local BuilderDeconstructors = {}
+BuilderGroup.BuilderDeconstructors = BuilderDeconstructors
+BuilderDeconstructors._order = {
+    "ToQuaternion", "GetComponents"
+}
+
+BuilderDeconstructors.ToQuaternion = {
+    DisplayName = "ToQuaternion",
+    test = function()
+        local builder = QuaternionBuilder.new(2, 3, 4, 5)
+        local q0 = builder:ToQuaternion()
+        builder:Set(0, 0, 0, 1)
+
+        return Assert.HasMetatable(q0, getmetatable(Quaternion.identity))
+            and Assert.KeyValues(q0, Quaternion.new(2, 3, 4, 5))
+    end
+}
+
+BuilderDeconstructors.GetComponents = {
+    DisplayName = "GetComponents",
+    test = function()
+        local builder = QuaternionBuilder.new(2, 3, 4, 5)
+        local qX, qY, qZ, qW = builder:GetComponents()
+
+        return qX == 2 and qY == 3 and qZ == 4 and qW == 5
+    end
+}
+
+
+
+
+
+local BufferGroup = {}
+QuaternionTest.BufferGroup = BufferGroup
+BufferGroup._order = {
+    "BufferConstructors", "BufferBulk", "BufferDeconstructors"
+}
+BufferGroup._DisplayName = "Buffer Tests"
+
+-- the bulk operations use the same arithmetic as the Quaternion methods, so
+-- every index is compared exactly
+local function bufferInputs()
+    local q0s = {
+        Quaternion.new(0.3, -0.5, 0.2, 0.7),
+        Quaternion.new(2, -5, 7, 3),
+        Quaternion.new(0, 0, 0, 0),
+        Quaternion.new(-0.1, 0.4, 0.8, 0.3),
+        Quaternion.new(0, 0, 0, 1),
+        Quaternion.new(0.5, 0.5, -0.5, 0.5),
+    }
+    local q1s = {
+        Quaternion.new(-0.1, 0.4, 0.8, 0.3),
+        Quaternion.new(0.3, -0.5, 0.2, 0.7),
+        Quaternion.new(0.3, -0.5, 0.2, 0.7),
+        Quaternion.new(0.1, -0.4, -0.8, -0.3),
+        Quaternion.new(0, 0, 0, 1),
+        Quaternion.new(0.5, 0.5, -0.5, 0.5),
+    }
+    return q0s, q1s
+end
+
+local function bufferMatches(buffer, expected)
+    if buffer.Count ~= #expected then
+        return false
+    end
+    for i = 1, buffer.Count do
+        if not Assert.KeyValues(buffer:Get(i), expected[i]) then
+            return false, i
+        end
+    end
+    return true
+end
+
+local BufferConstructors = {}
+BufferGroup.BufferConstructors = BufferConstructors
+BufferConstructors._order = {
+    "new", "fromQuaternions", "Set"
+}
+
+BufferConstructors.new = {
+    DisplayName = "new (identities)",
+    test = function()
+        local buffer = QuaternionBuffer.new(3)
+
+        return bufferMatches(buffer, {
+            Quaternion.identity, Quaternion.identity, Quaternion.identity
+        })
+    end
+}
+
+BufferConstructors.fromQuaternions = {
+    DisplayName = "fromQuaternions",
+    test = function()
+        local q0s = bufferInputs()
+
+        return bufferMatches(QuaternionBuffer.fromQuaternions(q0s), q0s)
+    end
+}
+
+BufferConstructors.Set = {
+    DisplayName = "Set",
+    test = function()
+        local buffer = QuaternionBuffer.new(2)
+        buffer:Set(2, Quaternion.new(2, 3, 4, 5))
+
+        return bufferMatches(buffer, {Quaternion.identity, Quaternion.new(2, 3, 4, 5)})
+    end
+}
+
+
+
+local BufferBulk = {}
+BufferGroup.BufferBulk = BufferBulk
+BufferBulk._order = {
+    "MulBuffers", "MulBuffersAliased", "SlerpBuffers", "SlerpBuffersAliased",
+    "NormalizeAll", "FromEulerAnglesBatch", "RotateVectors"
+}
+
+BufferBulk.MulBuffers = {
+    DisplayName = "MulBuffers",
+    test = function()
+        local q0s, q1s = bufferInputs()
+        local buffer = QuaternionBuffer.new(#q0s)
+        buffer:MulBuffers(QuaternionBuffer.fromQuaternions(q0s), QuaternionBuffer.fromQuaternions(q1s))
+
+        local expected = {}
+        for i = 1, #q0s do
+            expected[i] = q0s[i] * q1s[i]
+        end
+        return bufferMatches(buffer, expected)
+    end
+}
+
+BufferBulk.MulBuffersAliased = {
+    DisplayName = "MulBuffers (buffer as both inputs)",
+    test = function()
+        local q0s = bufferInputs()
+        local buffer = QuaternionBuffer.fromQuaternions(q0s)
+        buffer:MulBuffers(buffer, buffer)
+
+        local expected = {}
+        for i = 1, #q0s do
+            expected[i] = q0s[i] * q0s[i]
+        end
+        return bufferMatches(buffer, expected)
+    end
+}
+
+BufferBulk.SlerpBuffers = {
+    DisplayName = "SlerpBuffers",
+    test = function()
+        local q0s, q1s = bufferInputs()
+        local b0 = QuaternionBuffer.fromQuaternions(q0s)
+        local b1 = QuaternionBuffer.fromQuaternions(q1s)
+        local buffer = QuaternionBuffer.new(#q0s)
+
+        for _, alpha in {0, 0.3, 1, 1.5, -0.5} do
+            buffer:SlerpBuffers(b0, b1, alpha)
+            local expected = {}
+            for i = 1, #q0s do
+                expected[i] = q0s[i]:Slerp(q1s[i], alpha)
+            end
+            if not bufferMatches(buffer, expected) then
+                return false, alpha
+            end
+        end
+        return true
+    end
+}
+
+BufferBulk.SlerpBuffersAliased = {
+    DisplayName = "SlerpBuffers (buffer as input)",
+    test = function()
+        local q0s, q1s = bufferInputs()
+        local buffer = QuaternionBuffer.fromQuaternions(q0s)
+        buffer:SlerpBuffers(buffer, QuaternionBuffer.fromQuaternions(q1s), 0.3)
+
+        local expected = {}
+        for i = 1, #q0s do
+            expected[i] = q0s[i]:Slerp(q1s[i], 0.3)
+        end
+        return bufferMatches(buffer, expected)
+    end
+}
+
+BufferBulk.NormalizeAll = {
+    DisplayName = "NormalizeAll (including zero)",
+    test = function()
+        local q0s = bufferInputs()
+        local buffer = QuaternionBuffer.fromQuaternions(q0s):NormalizeAll()
+
+        local expected = {}
+        for i = 1, #q0s do
+            expected[i] = q0s[i]:Normalize()
+        end
+        return bufferMatches(buffer, expected)
+    end
+}
+
+BufferBulk.FromEulerAnglesBatch = {
+    DisplayName = "FromEulerAnglesBatch (every rotation order)",
+    test = function()
+        local rx = {0, 0.3, -1.2, math.pi, 2.5, -math.pi / 2}
+        local ry = {0, -0.7, 0.4, math.pi / 2, -2.9, 1.1}
+        local rz = {0, 1.9, -0.2, -math.pi, 0.6, math.pi / 2}
+        local buffer = QuaternionBuffer.new(#rx)
+
+        for _, orderName in rotationOrders do
+            local order = Enum.RotationOrder[orderName]
+            buffer:FromEulerAnglesBatch(rx, ry, rz, order)
+            local expected = {}
+            for i = 1, #rx do
+                expected[i] = Quaternion.fromEulerAngles(rx[i], ry[i], rz[i], order)
+            end
+            if not bufferMatches(buffer, expected) then
+                return false, orderName
+            end
+        end
+
+        buffer:FromEulerAnglesBatch(rx, ry, rz)
+        local expected = {}
+        for i = 1, #rx do
+            expected[i] = Quaternion.fromEulerAngles(rx[i], ry[i], rz[i])
+        end
+        return bufferMatches(buffer, expected)
+    end
+}
+
+BufferBulk.RotateVectors = {
+    DisplayName = "RotateVectors",
+    test = function()
+        local q0s = bufferInputs()
+        local buffer = QuaternionBuffer.fromQuaternions(q0s):NormalizeAll()
+        local vX = {1, -2, 3, 0, 5, 0.25}
+        local vY = {2, 0.5, -1, 0, -4, 7}
+        local vZ = {3, 1, 2, 0, 1, -3}
+
+        local expected = {}
+        for i = 1, buffer.Count do
+            expected[i] = buffer:Get(i):RotateVector(Vector3.new(vX[i], vY[i], vZ[i]))
+        end
+        buffer:RotateVectors(vX, vY, vZ)
+        for i = 1, buffer.Count do
+            local vector = expected[i]
+            if vX[i] ~= vector.X or vY[i] ~= vector.Y or vZ[i] ~= vector.Z then
+                return false, i
+            end
+        end
+        return true
+    end
+}
+
+
+
+local BufferDeconstructors = {}
+BufferGroup.BufferDeconstructors = BufferDeconstructors
+BufferDeconstructors._order = {
+    "ToQuaternions"
+}
+
+BufferDeconstructors.ToQuaternions = {
+    DisplayName = "ToQuaternions",
+    test = function()
+        local q0s = bufferInputs()
+        local quaternions = QuaternionBuffer.fromQuaternions(q0s):ToQuaternions()
+
+        if #quaternions ~= #q0s then
+            return false
+        end
+        for i = 1, #q0s do
+            if not Assert.HasMetatable(quaternions[i], getmetatable(Quaternion.identity))
+                or not Assert.KeyValues(quaternions[i], q0s[i]) then
+                return false, i
+            end
+        end
+        return true
+    end
+}
+
+
+
+
+
+local SpringsGroup = {}
+QuaternionTest.SpringsGroup = SpringsGroup
+SpringsGroup._order = {
+    "SpringGroupStep", "SpringGroupMembers"
+}
+SpringsGroup._DisplayName = "Spring Group Tests"
+
+-- a clock which only moves when the test advances it
+local function manualClock()
+    local clock = {now = 0}
+    function clock.read()
+        return clock.now
+    end
+    return clock
+end
+
+local SpringGroupStep = {}
+SpringsGroup.SpringGroupStep = SpringGroupStep
+SpringGroupStep._order = {
+    "Spring", "RadianSpring", "QuaternionSpring", "SharedSettings", "Repeated"
+}
+
+SpringGroupStep.Spring = {
+    DisplayName = "Step matches Spring",
+    test = function()
+        local clock = manualClock()
+        local group = SpringGroup.new(clock.read)
+        local springs = {}
+        local indices = {}
+        for i, damping in {0.4, 1, 1.7} do
+            springs[i] = Spring.new(2, damping, 3, clock.read)
+            springs[i].Target = -1
+            indices[i] = group:AddSpring(2, damping, 3)
+            group:SetTarget(indices[i], -1)
+        end
+        clock.now = 0.1
+        group:Step()
+
+        for i, spring in springs do
+            if group:GetPosition(indices[i]) ~= spring.Position
+                or group:GetVelocity(indices[i]) ~= spring.Velocity then
+                return false, i
+            end
+        end
+        return true
+    end
+}
+
+SpringGroupStep.RadianSpring = {
+    DisplayName = "Step matches RadianSpring",
+    test = function()
+        local clock = manualClock()
+        local group = SpringGroup.new(clock.read)
+        local spring = RadianSpring.new(2.5, 0.6, 2, clock.read)
+        local index = group:AddRadianSpring(2.5, 0.6, 2)
+        clock.now = 0.1
+        group:Step()
+
+        return group:GetPosition(index) == spring.Position
+            and group:GetVelocity(index) == spring.Velocity
+            and group:GetTarget(index) == 0
+    end
+}
+
+SpringGroupStep.QuaternionSpring = {
+    DisplayName = "Step matches QuaternionSpring",
+    test = function()
+        local clock = manualClock()
+        local group = SpringGroup.new(clock.read)
+        local initial = Quaternion.fromEulerAnglesXYZ(0.3, -0.2, 1.1)
+        local target = Quaternion.fromEulerAnglesXYZ(-0.5, 0.4, 0.2)
+        local spring = QuaternionSpring.new(initial, 0.5, 4, clock.read)
+        spring.Target = target
+        local index = group:AddQuaternionSpring(initial, 0.5, 4)
+        group:SetTarget(index, target)
+        clock.now = 0.1
+        group:Step()
+
+        return Assert.KeyValues(group:GetPosition(index), spring.Position)
+            and Assert.VectorsApproxEqual(group:GetVelocity(index), spring.Velocity, 1e-12)
+    end
+}
+
+SpringGroupStep.SharedSettings = {
+    DisplayName = "Members sharing settings step independently",
+    test = function()
+        local clock = manualClock()
+        local group = SpringGroup.new(clock.read)
+        local a = group:AddSpring(0, 0.5, 2)
+        local b = group:AddSpring(10, 0.5, 2)
+        group:SetTarget(a, 1)
+        group:SetTarget(b, 5)
+        local springA = Spring.new(0, 0.5, 2, clock.read)
+        local springB = Spring.new(10, 0.5, 2, clock.read)
+        springA.Target = 1
+        springB.Target = 5
+        clock.now = 0.25
+        group:Step()
+
+        return group:GetPosition(a) == springA.Position
+            and group:GetPosition(b) == springB.Position
+    end
+}
+
+SpringGroupStep.Repeated = {
+    DisplayName = "Repeated fixed steps follow the spring",
+    test = function()
+        local clock = manualClock()
+        local group = SpringGroup.new(clock.read)
+        local spring = Spring.new(Vector3.new(1, 2, 3), 0.3, 5, clock.read)
+        spring.Target = Vector3.new(-4, 0, 2)
+        local index = group:AddSpring(Vector3.new(1, 2, 3), 0.3, 5)
+        group:SetTarget(index, Vector3.new(-4, 0, 2))
+        for step = 1, 60 do
+            clock.now = step / 60
+            group:Step()
+        end
+
+        return Assert.VectorsApproxEqual(group:GetPosition(index), spring.Position, EPSILON)
+            and Assert.VectorsApproxEqual(group:GetVelocity(index), spring.Velocity, EPSILON)
+    end
+}
+
+
+
+local SpringGroupMembers = {}
+SpringsGroup.SpringGroupMembers = SpringGroupMembers
+SpringGroupMembers._order = {
+    "Count", "Impulse", "Reset", "Settings"
+}
+
+SpringGroupMembers.Count = {
+    DisplayName = "Count",
+    test = function()
+        local group = SpringGroup.new()
+        group:AddSpring(1)
+        local radian = group:AddRadianSpring()
+        local index = group:AddQuaternionSpring()
+
+        return group.Count == 3 and index == 3
+            and group:GetPosition(radian) == 0 and group:GetVelocity(radian) == 0
+            and Assert.KeyValues(group:GetPosition(index), Quaternion.identity)
+    end
+}
+
+SpringGroupMembers.Impulse = {
+    DisplayName = "Impulse",
+    test = function()
+        local clock = manualClock()
+        local group = SpringGroup.new(clock.read)
+        local spring = Spring.new(1, 0.5, 2, clock.read)
+        local index = group:AddSpring(1, 0.5, 2)
+        spring:Impulse(3)
+        group:Impulse(index, 3)
+        clock.now = 0.1
+        group:Step()
+
+        return group:GetPosition(index) == spring.Position
+            and group:GetVelocity(index) == spring.Velocity
+    end
+}
+
+SpringGroupMembers.Reset = {
+    DisplayName = "Reset",
+    test = function()
+        local clock = manualClock()
+        local group = SpringGroup.new(clock.read)
+        local index = group:AddSpring(1)
+        group:SetTarget(index, 4)
+        clock.now = 0.5
+        group:Step()
+        group:Reset(index)
+        local resetInitial = group:GetPosition(index) == 1 and group:GetTarget(index) == 1
+            and group:GetVelocity(index) == 0
+        group:Reset(index, 7)
+
+        return resetInitial and group:GetPosition(index) == 7
+            and group:GetTarget(index) == 7 and group:GetVelocity(index) == 0
+    end
+}
+
+SpringGroupMembers.Settings = {
+    DisplayName = "Damping and speed",
+    test = function()
+        local clock = manualClock()
+        local group = SpringGroup.new(clock.read)
+        local spring = Spring.new(0, 1, 1, clock.read)
+        spring.Target = 1
+        spring.Damping = 0.2
+        spring.Speed = 6
+        local index = group:AddSpring(0)
+        group:SetTarget(index, 1)
+        group:SetDamping(index, 0.2)
+        group:SetSpeed(index, 6)
+        clock.now = 0.1
+        group:Step()
+
+        return group:GetPosition(index) == spring.Position
+    end
+}
+
+
+
+
+
 return QuaternionTest
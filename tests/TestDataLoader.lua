@@ -0,0 +1,96 @@
+-- Rebuilds the test data tables from tests/TestDataPacked.lua, which is
+-- generated by tests/ConvertTestData.py from tests/TestData.lua.
+
+local TestDataLoader = {}
+
+function TestDataLoader.isPacked(data)
+    return type(data.data) == "string" and type(data.values) == "string"
+end
+
+local function buildCase(shape, values, count, case, column)
+    if shape == 0 then
+        return values[column * count + case], column + 1
+    end
+
+    -- arrays are sized up front like a table constructor would, growing them
+    -- by insertion rounds their capacity up to a power of two
+    local first = shape[1]
+    local tbl
+    if first and type(first[1]) == "number" then
+        tbl = table.create(#shape)
+    else
+        tbl = {}
+    end
+    for _, entry in ipairs(shape) do
+        local value
+        value, column = buildCase(entry[2], values, count, case, column)
+        tbl[entry[1]] = value
+    end
+    return tbl, column
+end
+
+local function loadValues(packed)
+    local values = {}
+    local data = packed.values
+    local position = 1
+    for i = 1, #data / 8 do
+        values[i], position = string.unpack("<d", data, position)
+    end
+    return values
+end
+
+function TestDataLoader.load(packed)
+    local values = loadValues(packed)
+    local symbols = packed.symbols
+    local base = #symbols
+    local digits = {}
+    for i = 1, base do
+        digits[string.byte(symbols, i)] = i - 1
+    end
+
+    local data = packed.data
+    local width = packed.width
+    local position = 1
+    local testData = {}
+
+    for _, collection in ipairs(packed.collections) do
+        local count = collection.count
+        local columns = {}
+        -- the indices of one collection are stored column after column
+        for i = 1, collection.columns * count do
+            local index = 0
+            for offset = 0, width - 1 do
+                index = index * base + digits[string.byte(data, position + offset)]
+            end
+            columns[i] = values[index + 1]
+            position = position + width
+        end
+
+        local cases = {}
+        for case = 1, count do
+            cases[case] = buildCase(collection.shape, columns, count, case, 0)
+        end
+        testData[collection.name] = cases
+    end
+
+    return testData
+end
+
+-- the source is only loaded when the packed copy has not been generated, a
+-- packed copy that fails to load or was packed from other data is an error
+function TestDataLoader.require(packedPath, sourcePath, sourceDigest)
+    local loaded, packed = pcall(require, packedPath)
+    if not loaded then
+        if string.find(packed, "error loading " .. packedPath, 1, true) then
+            print(`{packedPath} has not been generated, loading {sourcePath}. Run python test.py to pack it.`)
+            return require(sourcePath)
+        end
+        error(`{packedPath} failed to load, run python test.py to pack it again: {packed}`)
+    end
+    if packed.source ~= sourceDigest then
+        error(`{packedPath} was packed from another {sourcePath}, run python test.py to pack it again.`)
+    end
+    return packed
+end
+
+return TestDataLoader
@@ -1,4 +1,5 @@
 local OutputBuffer = require("tests/OutputBuffer")
+local TestDataLoader = require("tests/TestDataLoader")
 
 local buffer = OutputBuffer.new()
 
@@ -8,6 +9,10 @@ Tester.__index = Tester
 function Tester.new(testLibrary, testModule, testData, unsafeMode, failThrowsError)
     local self = {}
     
+    if TestDataLoader.isPacked(testData) then
+        testData = TestDataLoader.load(testData)
+    end
+    
     self.testModule = testModule
     self.testData = testData
     self.unsafeMode = unsafeMode or false
@@ -57,6 +62,51 @@ function Tester:runTest(test, call)
     end
 end
 
+function Tester:testFunction(functionTests, functionIndexName)
+    local totalTests = 0
+    local testsPassed = 0
+    local testsFailed = 0
+    local unhandledExceptions = 0
+    
+    local order = functionTests._order
+    local nord = #order
+    local allPassed = true
+    
+    for i, testIndex in pairs(order) do
+        totalTests = totalTests + 1
+        local test = functionTests[testIndex]
+        local status, result = self:runTest(test)
+        if status == 0 then
+            testsPassed = testsPassed + 1
+        elseif status == 1 then
+            testsFailed = testsFailed + 1
+            allPassed = false
+        else
+            unhandledExceptions = unhandledExceptions + 1
+            allPassed = false
+        end
+        if i < nord then
+            buffer:AppendNL(result)
+        else
+            buffer:Append(result)
+        end
+    end
+    
+    local functionTestsOutput
+    if allPassed then
+        functionTestsOutput = "[✔] All tests passed - "
+            .. functionIndexName
+    else
+        functionTestsOutput = "[❌] Tests failed - "
+            .. functionIndexName
+    end
+    
+    buffer:PrependNL(functionTestsOutput)
+    buffer:Flush()
+    
+    return totalTests, testsPassed, testsFailed, unhandledExceptions
+end
+
 function Tester:testFunctionGroup(functionGroup)
     local totalTests = 0
     local testsPassed = 0
@@ -66,41 +116,13 @@ function Tester:testFunctionGroup(functionGroup)
     local functionGroupOrder = functionGroup._order
     for _, functionIndexName in pairs(functionGroupOrder) do
         local functionTests = functionGroup[functionIndexName]
-        local order = functionTests._order
-        local nord = #order
-        local allPassed = true
-        
-        for i, testIndex in pairs(order) do
-            totalTests = totalTests + 1
-            local test = functionTests[testIndex]
-            local status, result = self:runTest(test)
-            if status == 0 then
-                testsPassed = testsPassed + 1
-            elseif status == 1 then
-                testsFailed = testsFailed + 1
-                allPassed = false
-            else
-                unhandledExceptions = unhandledExceptions + 1
-                allPassed = false
-            end
-            if i < nord then
-                buffer:AppendNL(result)
-            else
-                buffer:Append(result)
-            end
-        end
+        local fTests, fPassed, fFailed, fUnhandled =
+            self:testFunction(functionTests, functionIndexName)
         
-        local functionTestsOutput
-        if allPassed then
-            functionTestsOutput = "[✔] All tests passed - "
-                .. functionIndexName
-        else
-            functionTestsOutput = "[❌] Tests failed - "
-                .. functionIndexName
-        end
-        
-        buffer:PrependNL(functionTestsOutput)
-        buffer:Flush()
+        totalTests = totalTests + fTests
+        testsPassed = testsPassed + fPassed
+        testsFailed = testsFailed + fFailed
+        unhandledExceptions = unhandledExceptions + fUnhandled
     end
     
     local resultString = getResultString(
@@ -145,4 +167,28 @@ function Tester:ExecuteTests()
     print(finalResultString)
 end
 
+-- Runs every count-th function test starting at index, for test.py to merge.
+-- Each function test's output is framed by marker lines carrying its
+-- position in the full run, its group and its counts.
+function Tester:ExecuteShard(index, count)
+    local position = 0
+    local testGroupOrder = self.testModule._order
+    
+    for _, groupName in pairs(testGroupOrder) do
+        local testGroupTable = self.testModule[groupName]
+        local groupDisplayName = testGroupTable._DisplayName
+        
+        for _, functionIndexName in pairs(testGroupTable._order) do
+            position = position + 1
+            if position % count == index % count then
+                print("@@begin", position, groupName, groupDisplayName)
+                local fnTests, fnPassed, fnFailed, fnUnhandled = self:testFunction(
+                    testGroupTable[functionIndexName], functionIndexName
+                )
+                print("@@end", fnTests, fnPassed, fnFailed, fnUnhandled)
+            end
+        end
+    end
+end
+
 return Tester
@@ -0,0 +1,97 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from docs.Watch import rebuild, start_watch
+
+TEMPLATE_HTML_PATH = "docs/template.html"
+READ_ME_PATH = "README.md"
+# a doc without @grouporder, extracting it raises a KeyError
+BROKEN_SOURCE = "--[=[\n    @class Broken\n]=]\n"
+
+sep = "-" * 50
+
+class WatchedTree:
+    # a copy of a few sources and a build folder that docs/Watch.py
+    # rebuilds, every write moves the mtime forward so each poll sees it
+    def __init__(self, folder):
+        self.src = os.path.join(folder, "src")
+        self.build = os.path.join(folder, "build")
+        self.mtime = time.time_ns()
+        os.makedirs(self.src)
+
+    def copy(self, source_name, name):
+        with open(os.path.join("src", source_name), "r") as source_file:
+            self.write(name, source_file.read())
+
+    def write(self, name, contents):
+        path = os.path.join(self.src, name)
+        with open(path, "w") as target_file:
+            target_file.write(contents)
+        self.mtime += 10 ** 9
+        os.utime(path, ns=(self.mtime, self.mtime))
+
+    def append(self, name, contents):
+        with open(os.path.join(self.src, name), "r") as source_file:
+            self.write(name, source_file.read() + contents)
+
+    def page_exists(self, name):
+        return os.path.exists(os.path.join(self.build, "api", name + ".html"))
+
+    def navigation(self):
+        with open(os.path.join(self.build, "navigation.js"), "r") as navigation_file:
+            return navigation_file.read()
+
+def run_quietly(function, *args):
+    # the watcher prints every file it processes and the traceback of the
+    # source that is expected to fail
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        return function(*args)
+
+def WatchTest():
+    failures = []
+    def check(condition, message):
+        print(f"{'ok' if condition else 'FAILED':>6}  {message}")
+        if not condition:
+            failures.append(message)
+
+    folder = tempfile.mkdtemp()
+    try:
+        tree = WatchedTree(folder)
+        tree.copy("Spring.lua", "Spring.lua")
+        tree.copy("RadianSpring.lua", "RadianSpring.lua")
+        paths, state, json_manifest, html_manifest = run_quietly(
+            start_watch, tree.src, READ_ME_PATH, TEMPLATE_HTML_PATH, tree.build, "json", "/", "index.html"
+        )
+
+        print("A poll where one of the changed sources fails to extract:")
+        tree.append("Spring.lua", "\n-- edited\n")
+        tree.copy("SpringGroup.lua", "SpringGroup.lua")
+        tree.write("Broken.lua", BROKEN_SOURCE)
+        run_quietly(rebuild, paths, state, json_manifest, html_manifest)
+        check(state["sources"]["Spring.json"][3] == tree.mtime - 2 * 10 ** 9, "the edited source is rebuilt")
+        check(tree.page_exists("SpringGroup"), "the added source is rendered")
+        check("api/SpringGroup.html" in tree.navigation(), "the added source is in the navigation")
+        check("Broken.json" not in state["sources"], "the failed source is not saved as built")
+        check(not tree.page_exists("Broken"), "the failed source has no page")
+        check(not run_quietly(rebuild, paths, state, json_manifest, html_manifest), "the failed source waits for its next save")
+
+        print("A poll after the failed source is fixed:")
+        tree.copy("QuaternionBuilder.lua", "Broken.lua")
+        check(run_quietly(rebuild, paths, state, json_manifest, html_manifest), "the fixed source is rebuilt")
+        check(tree.page_exists("Broken"), "the fixed source is rendered")
+        check("api/Broken.html" in tree.navigation(), "the fixed source is in the navigation")
+        check(not state["failed"], "no source is left failed")
+    finally:
+        shutil.rmtree(folder)
+
+    print(sep)
+    print(f"Watch test finished {'with ' + str(len(failures)) + ' failures' if failures else 'successfully'}.")
+    return len(failures)
+
+if __name__ == "__main__":
+    sys.exit(1 if WatchTest() else 0)
@@ -0,0 +1,22 @@
+import numpy as np
+
+from tests.reference import Quaternion
+
+def standard_cases(quaternions):
+    # the fields of a "standard" representation in tests/TestData.lua, one
+    # row per case
+    matrix = Quaternion.ToMatrix(quaternions)
+    axis, angle = Quaternion.ToAxisAngle(quaternions)
+    cases = {
+        "quaternion": Quaternion.Normalize(quaternions),
+        "matrix": matrix,
+        "ortho": matrix,
+        "axisAngle": (axis, angle),
+    }
+    for rotationOrder in Quaternion.ROTATION_ORDERS:
+        cases[rotationOrder] = Quaternion.ToEulerAngles(quaternions, rotationOrder)
+    return cases
+
+def random_standard_cases(count, seed=1):
+    rng = np.random.default_rng(seed)
+    return standard_cases(Quaternion.RandomQuaternion(count, rng))
@@ -0,0 +1,386 @@
+import numpy as np
+
+# Vectorized mirror of src/Quaternion.lua. Quaternions are (N, 4) float64
+# arrays in X, Y, Z, W order and vectors are (N, 3) arrays. Every function
+# takes the same branches as the lua implementation, per row, so a reference
+# result can be compared with what luau returns for the same input.
+
+EPSILON = 5e-7
+ROTATION_ORDERS = ["XYZ", "XZY", "YZX", "YXZ", "ZXY", "ZYX"]
+
+X_AXIS = np.array([1.0, 0.0, 0.0])
+Y_AXIS = np.array([0.0, 1.0, 0.0])
+Z_AXIS = np.array([0.0, 0.0, 1.0])
+IDENTITY = np.array([0.0, 0.0, 0.0, 1.0])
+
+def new(qX, qY, qZ, qW):
+    return np.stack(np.broadcast_arrays(qX, qY, qZ, qW), axis=-1).astype(np.float64)
+
+def components(q0):
+    return q0[..., 0], q0[..., 1], q0[..., 2], q0[..., 3]
+
+def column(value):
+    # scalar arguments (angles, alpha, exponents) broadcast against rows
+    return np.asarray(value, dtype=np.float64)[..., None]
+
+# sums are written out left to right like the lua code, np.sum may pair them
+# up differently and round differently
+
+def magnitude(vector):
+    x, y, z = vector[..., 0], vector[..., 1], vector[..., 2]
+    return np.sqrt(x * x + y * y + z * z)
+
+def unit(vector):
+    return vector / magnitude(vector)[..., None]
+
+def cross(v0, v1):
+    return np.cross(v0, v1)
+
+def dot(v0, v1):
+    return v0[..., 0] * v1[..., 0] + v0[..., 1] * v1[..., 1] + v0[..., 2] * v1[..., 2]
+
+def _safeUnit(vector, default):
+    length = magnitude(vector)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where((length > EPSILON)[..., None], vector / length[..., None], default)
+
+def Length(q0):
+    qX, qY, qZ, qW = components(q0)
+    return np.sqrt(qX * qX + qY * qY + qZ * qZ + qW * qW)
+
+def Normalize(q0):
+    # a zero (or NaN) length fails the comparison in lua too, and gives identity
+    length = Length(q0)
+    return np.where((length > 0)[..., None], q0 / length[..., None], IDENTITY)
+
+def Dot(q0, q1):
+    q0X, q0Y, q0Z, q0W = components(q0)
+    q1X, q1Y, q1Z, q1W = components(q1)
+    return q0X * q1X + q0Y * q1Y + q0Z * q1Z + q0W * q1W
+
+def Mul(q0, q1):
+    q0X, q0Y, q0Z, q0W = components(q0)
+    q1X, q1Y, q1Z, q1W = components(q1)
+    return new(
+        q0W * q1X + q0X * q1W + q0Y * q1Z - q0Z * q1Y,
+        q0W * q1Y - q0X * q1Z + q0Y * q1W + q0Z * q1X,
+        q0W * q1Z + q0X * q1Y - q0Y * q1X + q0Z * q1W,
+        q0W * q1W - q0X * q1X - q0Y * q1Y - q0Z * q1Z,
+    )
+
+def Inverse(q0):
+    qX, qY, qZ, qW = components(q0)
+    length = qX * qX + qY * qY + qZ * qZ + qW * qW
+    return new(-qX / length, -qY / length, -qZ / length, qW / length)
+
+def _Orthonormalize(rightVector, upVector, backVector):
+    xBasis = _safeUnit(rightVector, X_AXIS)
+    _upVector = _safeUnit(upVector, Y_AXIS)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        zBasis = cross(xBasis, _upVector)
+        fallback = cross(xBasis, Y_AXIS)
+        fallback = np.where((magnitude(fallback) > EPSILON)[..., None], unit(fallback), X_AXIS)
+        zBasis = np.where((magnitude(zBasis) > EPSILON)[..., None], unit(zBasis), fallback)
+        yBasis = unit(cross(zBasis, xBasis))
+
+    zBasis = np.where((dot(zBasis, backVector) < 0)[..., None], -zBasis, zBasis)
+    return xBasis, yBasis, zBasis
+
+def _fromOrthonormalizedMatrix(vX, vY, vZ):
+    m00, m10, m20 = vX[..., 0], vX[..., 1], vX[..., 2]
+    m01, m11, m21 = vY[..., 0], vY[..., 1], vY[..., 2]
+    m02, m12, m22 = vZ[..., 0], vZ[..., 1], vZ[..., 2]
+
+    trace = m00 + m11 + m22
+    # every branch is evaluated for every row and the lua branch is selected
+    # afterwards, the rows a branch doesn't apply to may take a sqrt of a
+    # negative number
+    with np.errstate(invalid="ignore", divide="ignore"):
+        S = np.sqrt(trace + 1) * 2
+        traceBranch = new((m21 - m12) / S, (m02 - m20) / S, (m10 - m01) / S, 0.25 * S)
+        S = np.sqrt(1 + m00 - m11 - m22) * 2
+        xBranch = new(0.25 * S, (m01 + m10) / S, (m02 + m20) / S, (m21 - m12) / S)
+        S = np.sqrt(1 + m11 - m00 - m22) * 2
+        yBranch = new((m01 + m10) / S, 0.25 * S, (m12 + m21) / S, (m02 - m20) / S)
+        S = np.sqrt(1 + m22 - m00 - m11) * 2
+        zBranch = new((m02 + m20) / S, (m12 + m21) / S, 0.25 * S, (m10 - m01) / S)
+
+    conditions = [trace > 0, (m00 > m11) & (m00 > m22), m11 > m22]
+    return np.select(
+        [condition[..., None] for condition in conditions],
+        [traceBranch, xBranch, yBranch],
+        zBranch,
+    )
+
+def fromAxisAngle(axis, angle):
+    axis = _safeUnit(axis, X_AXIS)
+    ha = np.asarray(angle, dtype=np.float64) / 2
+    sha = np.sin(ha)
+    return new(sha * axis[..., 0], sha * axis[..., 1], sha * axis[..., 2], np.cos(ha))
+
+def fromMatrix(vX, vY, vZ=None):
+    vZo = vZ if vZ is not None else cross(vX, vY)
+    return _fromOrthonormalizedMatrix(*_Orthonormalize(vX, vY, vZo))
+
+def lookAt(origin, target, up=None):
+    lookVector = _safeUnit(target - origin, Z_AXIS)
+    _up = _safeUnit(up if up is not None else Y_AXIS, Y_AXIS)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rightVector = cross(lookVector, _up)
+        useRight = magnitude(rightVector) > EPSILON
+        rightVector = unit(rightVector)
+
+        selectVector = cross(lookVector, X_AXIS)
+        useSelect = magnitude(selectVector) > EPSILON
+        selectVector = unit(selectVector)
+
+        # looking straight along the x axis, up is picked from the z axis
+        poleUp = cross(Z_AXIS, np.broadcast_to(lookVector, rightVector.shape))
+        poleUp = poleUp * poleUp[..., 1:2]
+        poleRight = cross(lookVector, poleUp)
+
+        rightVector = np.where(useRight[..., None], rightVector, selectVector)
+        upVector = unit(cross(rightVector, lookVector))
+        useSelect = (useRight | useSelect)[..., None]
+        rightVector = np.where(useSelect, rightVector, poleRight)
+        upVector = np.where(useSelect, upVector, poleUp)
+
+    return _fromOrthonormalizedMatrix(rightVector, upVector, -lookVector)
+
+# the sign of the second term of each component, per rotation order
+EULER_ANGLE_SIGNS = {
+    "XYZ": (1, -1, 1, -1),
+    "YXZ": (1, -1, -1, 1),
+    "ZXY": (-1, 1, 1, -1),
+    "ZYX": (-1, 1, -1, 1),
+    "YZX": (1, 1, -1, -1),
+    "XZY": (-1, -1, 1, 1),
+}
+
+def fromEulerAngles(rx, ry, rz, rotationOrder="XYZ"):
+    rx, ry, rz = (np.asarray(angle, dtype=np.float64) for angle in (rx, ry, rz))
+    xCos, yCos, zCos = np.cos(rx / 2), np.cos(ry / 2), np.cos(rz / 2)
+    xSin, ySin, zSin = np.sin(rx / 2), np.sin(ry / 2), np.sin(rz / 2)
+
+    xSinyCos = xSin * yCos
+    xCosySin = xCos * ySin
+    xCosyCos = xCos * yCos
+    xSinySin = xSin * ySin
+
+    signs = EULER_ANGLE_SIGNS[rotationOrder]
+    return new(
+        xSinyCos * zCos + signs[0] * xCosySin * zSin,
+        xCosySin * zCos + signs[1] * xSinyCos * zSin,
+        xCosyCos * zSin + signs[2] * xSinySin * zCos,
+        xCosyCos * zCos + signs[3] * xSinySin * zSin,
+    )
+
+def fromEulerAnglesXYZ(rx, ry, rz):
+    return fromEulerAngles(rx, ry, rz, "XYZ")
+
+def fromEulerAnglesYXZ(rx, ry, rz):
+    return fromEulerAngles(rx, ry, rz, "YXZ")
+
+def _gimbalSign(test, inclusive):
+    if inclusive:
+        return np.where(test >= 0, 1.0, -1.0)
+    return np.where(test > 0, 1.0, -1.0)
+
+def _toEulerAngles(test, inclusive, locked, solved):
+    # locked gives the angles at the poles, solved everywhere else, both as
+    # (rX, rY, rZ) and both are evaluated for every row
+    sign = _gimbalSign(test, inclusive)
+    with np.errstate(invalid="ignore"):
+        lockedAngles = np.stack(np.broadcast_arrays(*locked(sign)), axis=-1)
+        solvedAngles = np.stack(solved(), axis=-1)
+    polar = (np.abs(test) > 0.5 - EPSILON)[..., None]
+    return np.where(polar, lockedAngles, solvedAngles)
+
+def ToEulerAnglesXYZ(q0):
+    qX, qY, qZ, qW = components(Normalize(q0))
+    test = qY * qW + qX * qZ
+    sqy = qY * qY
+    return _toEulerAngles(
+        test, False,
+        lambda sign: (sign * 2 * np.arctan2(qZ, qW), sign * np.pi / 2, 0.0),
+        lambda: (
+            np.arctan2(2 * (qX * qW - qY * qZ), 1 - 2 * (qX * qX + sqy)),
+            np.arcsin(2 * test),
+            np.arctan2(2 * (qZ * qW - qX * qY), 1 - 2 * (qZ * qZ + sqy)),
+        ),
+    )
+
+def ToEulerAnglesXZY(q0):
+    qX, qY, qZ, qW = components(Normalize(q0))
+    test = qZ * qW - qX * qY
+    sqz = qZ * qZ
+    return _toEulerAngles(
+        test, True,
+        lambda sign: (sign * 2 * -np.arctan2(qY, qW), 0.0, sign * np.pi / 2),
+        lambda: (
+            np.arctan2(2 * (qX * qW + qY * qZ), 1 - 2 * (qX * qX + sqz)),
+            np.arctan2(2 * (qX * qZ + qY * qW), 1 - 2 * (qY * qY + sqz)),
+            np.arcsin(2 * test),
+        ),
+    )
+
+def ToEulerAnglesYXZ(q0):
+    qX, qY, qZ, qW = components(Normalize(q0))
+    test = qX * qW - qY * qZ
+    sqx = qX * qX
+    return _toEulerAngles(
+        test, True,
+        lambda sign: (sign * np.pi / 2, sign * 2 * -np.arctan2(qZ, qW), 0.0),
+        lambda: (
+            np.arcsin(2 * test),
+            np.arctan2(2 * (qX * qZ + qY * qW), 1 - 2 * (qY * qY + sqx)),
+            np.arctan2(2 * (qX * qY + qZ * qW), 1 - 2 * (qZ * qZ + sqx)),
+        ),
+    )
+
+def ToEulerAnglesYZX(q0):
+    qX, qY, qZ, qW = components(Normalize(q0))
+    test = qZ * qW + qX * qY
+    sqz = qZ * qZ
+    return _toEulerAngles(
+        test, True,
+        lambda sign: (0.0, sign * 2 * np.arctan2(qX, qW), sign * np.pi / 2),
+        lambda: (
+            np.arctan2(2 * (qX * qW - qY * qZ), 1 - 2 * (qX * qX + sqz)),
+            np.arctan2(2 * (qY * qW - qX * qZ), 1 - 2 * (qY * qY + sqz)),
+            np.arcsin(2 * test),
+        ),
+    )
+
+def ToEulerAnglesZXY(q0):
+    qX, qY, qZ, qW = components(Normalize(q0))
+    test = qX * qW + qY * qZ
+    sqx = qX * qX
+    return _toEulerAngles(
+        test, True,
+        lambda sign: (sign * np.pi / 2, 0.0, sign * 2 * np.arctan2(qY, qW)),
+        lambda: (
+            np.arcsin(2 * test),
+            np.arctan2(2 * (qY * qW - qX * qZ), 1 - 2 * (qY * qY + sqx)),
+            np.arctan2(2 * (qZ * qW - qX * qY), 1 - 2 * (qZ * qZ + sqx)),
+        ),
+    )
+
+def ToEulerAnglesZYX(q0):
+    qX, qY, qZ, qW = components(Normalize(q0))
+    test = qY * qW - qX * qZ
+    sqy = qY * qY
+    return _toEulerAngles(
+        test, True,
+        lambda sign: (0.0, sign * np.pi / 2, sign * 2 * -np.arctan2(qX, qW)),
+        lambda: (
+            np.arctan2(2 * (qX * qW + qY * qZ), 1 - 2 * (qX * qX + sqy)),
+            np.arcsin(2 * test),
+            np.arctan2(2 * (qX * qY + qZ * qW), 1 - 2 * (qZ * qZ + sqy)),
+        ),
+    )
+
+TO_EULER_ANGLES_MAP = {
+    "XYZ": ToEulerAnglesXYZ,
+    "XZY": ToEulerAnglesXZY,
+    "YZX": ToEulerAnglesYZX,
+    "YXZ": ToEulerAnglesYXZ,
+    "ZXY": ToEulerAnglesZXY,
+    "ZYX": ToEulerAnglesZYX,
+}
+
+def ToEulerAngles(q0, rotationOrder="XYZ"):
+    return TO_EULER_ANGLES_MAP[rotationOrder](q0)
+
+def ToAxisAngle(q0):
+    q0 = Normalize(q0)
+    qX, qY, qZ, qW = components(q0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        angle = 2 * np.arccos(qW)
+        s = np.sqrt(1 - qW * qW)
+        axis = np.where((s < EPSILON)[..., None], q0[..., :3], q0[..., :3] / s[..., None])
+    return axis, angle
+
+def ToMatrix(q0):
+    # (N, 9) row major, the layout of CFrame.fromMatrixArray in the tests
+    qX, qY, qZ, qW = components(Normalize(q0))
+    sqX, sqY, sqZ, sqW = qX * qX, qY * qY, qZ * qZ, qW * qW
+    return np.stack([
+        sqX - sqY - sqZ + sqW, 2 * (qX * qY - qZ * qW), 2 * (qX * qZ + qY * qW),
+        2 * (qX * qY + qZ * qW), -sqX + sqY - sqZ + sqW, 2 * (qY * qZ - qX * qW),
+        2 * (qX * qZ - qY * qW), 2 * (qY * qZ + qX * qW), -sqX - sqY + sqZ + sqW,
+    ], axis=-1)
+
+def Slerp(q0, q1, alpha):
+    q0 = Normalize(q0)
+    q1 = Normalize(q1)
+    alpha = column(alpha)
+
+    dot = Dot(q0, q1)
+    flip = dot < 0
+    q0 = np.where(flip[..., None], -q0, q0)
+    dot = np.where(flip, -dot, dot)
+
+    lerp = Normalize(q0 + (q1 - q0) * alpha)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        theta0 = np.arccos(dot)[..., None]
+        sinTheta0 = np.sin(theta0)
+        theta = theta0 * alpha
+        sinTheta = np.sin(theta)
+        s0 = np.cos(theta) - dot[..., None] * sinTheta / sinTheta0
+        s1 = sinTheta / sinTheta0
+        slerp = Normalize(q0 * s0 + q1 * s1)
+    return np.where((dot >= 1)[..., None], lerp, slerp)
+
+def Exp(q0):
+    qX, qY, qZ, qW = components(q0)
+    m = np.exp(qW)
+    vv = qX * qX + qY * qY + qZ * qZ
+    with np.errstate(invalid="ignore", divide="ignore"):
+        v = np.sqrt(vv)
+        s = m * np.sin(v) / v
+        imaginary = new(qX * s, qY * s, qZ * s, m * np.cos(v))
+    return np.where((vv > 0)[..., None], imaginary, new(0.0, 0.0, 0.0, m))
+
+def Log(q0):
+    qX, qY, qZ, qW = components(q0)
+    vv = qX * qX + qY * qY + qZ * qZ
+    mm = qW * qW + vv
+    with np.errstate(invalid="ignore", divide="ignore"):
+        m = np.sqrt(mm)
+        s = np.arccos(qW / m) / np.sqrt(vv)
+        imaginary = new(qX * s, qY * s, qZ * s, np.log(m))
+        real = new(0.0, 0.0, 0.0, np.log(mm) / 2)
+    zero = new(0.0, 0.0, 0.0, -np.inf)
+    return np.select([(vv > 0)[..., None] & (mm > 0)[..., None], (mm > 0)[..., None]], [imaginary, real], zero)
+
+def Pow(q0, number):
+    number = np.asarray(number, dtype=np.float64)
+    aX, aY, aZ, aW = components(q0)
+    im = aX * aX + aY * aY + aZ * aZ
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        aMag = np.sqrt(aW * aW + im)
+        aIm = np.sqrt(im)
+        cMag = aMag ** number
+
+        cAng = number * np.arctan2(aIm, aW)
+        cMagcSin = cMag * np.sin(cAng)
+        power = new(cMagcSin * (aX / aIm), cMagcSin * (aY / aIm), cMagcSin * (aZ / aIm), cMag * np.cos(cAng))
+        inverse = Inverse(q0)
+
+    real = new(0.0, 0.0, 0.0, cMag)
+    return np.select(
+        [(number == -1)[..., None], (aIm <= EPSILON * aMag)[..., None]],
+        [inverse, real],
+        power,
+    )
+
+def RandomQuaternion(count, rng):
+    # the same uniform sampling as Quaternion.RandomQuaternion
+    u, v, w = rng.random((3, count))
+    tau = 2 * np.pi
+    squ = np.sqrt(u)
+    sqmu = np.sqrt(1 - u)
+    return new(sqmu * np.sin(tau * v), sqmu * np.cos(tau * v), squ * np.sin(tau * w), squ * np.cos(tau * w))
@@ -5,10 +5,19 @@
 local Tester = require("tests/Tester")
 local Quaternion = require("test_build/Quaternion")
 local TestLibrary = require("tests/QuaternionTest")
-local testData = require("tests/TestData")
+local TestDataLoader = require("tests/TestDataLoader")
+-- test.py keeps the packed copy of TestData.lua up to date
+local testData = TestDataLoader.require(
+    "tests/TestDataPacked", "tests/TestData", require("test_build/TestDataDigest").digest
+)
 
 local UNSAFE_MODE = false
 local ERROR_ON_FAIL = false
 local tester = Tester.new(Quaternion, TestLibrary, testData, UNSAFE_MODE, ERROR_ON_FAIL)
 
-tester:ExecuteTests()
\ No newline at end of file
+-- test.py --jobs runs this file once per shard with SHARD set
+if SHARD then
+    tester:ExecuteShard(SHARD.index, SHARD.count)
+else
+    tester:ExecuteTests()
+end